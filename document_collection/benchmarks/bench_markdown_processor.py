@@ -0,0 +1,75 @@
+"""Benchmark the streaming Markdown processor.
+
+Usage:
+    python benchmarks/bench_markdown_processor.py [--input documents/wellarchitected-framework.md] [--repeat 5]
+
+The input is processed into a temporary directory and the throughput is
+reported in MB/s of input, next to the speed of a single ``bytes.count``
+pass over the same input: the processor makes several passes of that kind,
+so the ratio of the two carries over between machines better than either.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from document_collection.converters.markdown_processor import MarkdownProcessor  # noqa: E402
+
+DEFAULT_INPUT = (
+    Path(__file__).resolve().parent.parent
+    / "documents"
+    / "wellarchitected-framework.md"
+)
+
+
+def time_processing(input_path: Path, output_path: Path) -> float:
+    """Process once and return the elapsed wall time in seconds."""
+    processor = MarkdownProcessor()
+    start = time.perf_counter()
+    asyncio.run(processor.convert(input_path, output_path))
+    return time.perf_counter() - start
+
+
+def time_scan(input_path: Path, repeat: int) -> float:
+    """Return the median time of one ``bytes.count`` pass over the input."""
+    data = input_path.read_bytes()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data.count(b"\n")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    size_mb = args.input.stat().st_size / 1_000_000
+    print(f"Input: {args.input.name}, {size_mb:.1f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / args.input.name
+        timings = [time_processing(args.input, output_path) for _ in range(args.repeat)]
+        elapsed = statistics.median(timings)
+        output_mb = output_path.stat().st_size / 1_000_000
+
+    print(f"{'time':>10}: {elapsed:.3f}s (median of {args.repeat})")
+    print(f"{'throughput':>10}: {size_mb / elapsed:.0f} MB/s")
+    print(
+        f"{'scan':>10}: {size_mb / time_scan(args.input, args.repeat):.0f} MB/s (one bytes.count pass)"
+    )
+    print(f"{'output':>10}: {output_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark the streaming PowerPoint converter against the python-pptx path.
+
+Usage:
+    python benchmarks/bench_powerpoint_converter.py [--slides 300] [--repeat 3]
+
+A synthetic deck is generated with python-pptx (title, bullet body, a table
+and speaker notes on every slide) and converted with both code paths.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from document_collection.converters.powerpoint_converter import (  # noqa: E402
+    PowerPointConverter,
+)
+
+
+def build_deck(path: Path, slides: int) -> None:
+    """Write a synthetic ``.pptx`` with ``slides`` slides to ``path``."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for number in range(1, slides + 1):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {number}"
+        slide.placeholders[1].text = "\n".join(
+            f"Point {point} about reliability and cost" for point in range(6)
+        )
+        table = slide.shapes.add_table(
+            3, 3, Inches(1), Inches(5), Inches(6), Inches(1)
+        ).table
+        for row_index, row in enumerate(table.rows):
+            for col_index, cell in enumerate(row.cells):
+                cell.text = f"r{row_index}c{col_index}"
+        if number % 2:
+            slide.notes_slide.notes_text_frame.text = f"Notes for slide {number}"
+    prs.save(str(path))
+
+
+def time_conversion(input_path: Path, output_path: Path, **options: object) -> float:
+    """Convert once and return the elapsed wall time in seconds."""
+    converter = PowerPointConverter()
+    start = time.perf_counter()
+    asyncio.run(converter.convert(input_path, output_path, **options))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        input_path = workdir / "benchmark.pptx"
+        build_deck(input_path, args.slides)
+        size_mb = input_path.stat().st_size / 1_000_000
+        print(f"Deck: {args.slides} slides, {size_mb:.1f} MB")
+
+        variants: dict[str, dict[str, object]] = {
+            "python-pptx": {"fast_path": False},
+            "streaming": {"parallel_threshold": args.slides + 1},
+            "parallel": {"parallel_threshold": 1},
+        }
+        results = {}
+        for label, options in variants.items():
+            timings = [
+                time_conversion(input_path, workdir / f"{label}.md", **options)
+                for _ in range(args.repeat)
+            ]
+            results[label] = statistics.median(timings)
+            print(f"{label:>12}: {results[label]:.3f}s (median of {args.repeat})")
+
+        for label in ("streaming", "parallel"):
+            speedup = results["python-pptx"] / results[label]
+            print(f"{label + ' x':>12}: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
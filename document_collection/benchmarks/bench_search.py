@@ -0,0 +1,86 @@
+"""Benchmark indexing and querying the full-text search index.
+
+Usage:
+    python benchmarks/bench_search.py [--input documents/wellarchitected-framework.md] [--copies 20]
+
+The input is split at its level 2 headings into documents of ten sections,
+copied ``--copies`` times into a temporary collection, indexed, and then
+queried. Indexing throughput is reported in MB/s and query latency as the
+median over the query set.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from document_collection.search import SearchIndex  # noqa: E402
+
+DEFAULT_INPUT = (
+    Path(__file__).resolve().parent.parent
+    / "documents"
+    / "wellarchitected-framework.md"
+)
+QUERIES = [
+    "reliability",
+    "disaster recovery",
+    "cost optimization pillar",
+    "identity and access management",
+    "the",
+    "performance efficiency best practices for compute",
+]
+
+
+def write_collection(input_path: Path, root: Path, copies: int) -> int:
+    """Write the split input ``copies`` times and return the bytes written."""
+    sections = input_path.read_text(encoding="utf-8").split("\n## ")
+    written = 0
+    for copy in range(copies):
+        for start in range(0, len(sections), 10):
+            text = f"# part {copy}-{start}\n\n## " + "\n## ".join(
+                sections[start : start + 10]
+            )
+            path = root / f"copy{copy:03d}" / f"part{start:04d}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            written += path.write_text(text, encoding="utf-8")
+    return written
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--copies", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        size_mb = write_collection(args.input, root, args.copies) / 1_000_000
+        print(f"Corpus: {size_mb:.1f} MB")
+
+        with SearchIndex(root) as index:
+            start = time.perf_counter()
+            documents = index.refresh()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{'indexing':>10}: {documents} documents in {elapsed:.2f}s ({size_mb / elapsed:.1f} MB/s)"
+            )
+
+            for query in QUERIES:
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    index.search(query)
+                    timings.append(time.perf_counter() - start)
+                print(
+                    f"{'query':>10}: {statistics.median(timings) * 1000:6.2f} ms  {query!r}"
+                )
+
+
+if __name__ == "__main__":
+    main()
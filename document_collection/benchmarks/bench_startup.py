@@ -0,0 +1,89 @@
+"""Benchmark the start-up time of the CLI commands.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 10] [--top 5] [--budget-ms 300]
+
+Each command runs ``--repeat`` times in a fresh interpreter with
+``-X importtime``. The median wall time of a run is reported together with
+the cumulative import time of the CLI and the modules that took longest to
+import by themselves. With ``--budget-ms`` the benchmark exits non-zero when
+a command starts slower than the budget, so a regression in the imports can
+fail CI.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "src"
+
+COMMANDS = [
+    ["--help"],
+    ["list-formats"],
+    ["collect", "--help"],
+    ["search", "--help"],
+    ["daemon", "status"],
+    ["mcp-server", "--help"],
+]
+
+ENTRY_POINT = "from document_collection.cli.main import main; main()"
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def run_once(arguments: list[str]) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Run a command; return its wall time and the self and cumulative import times."""
+    env = dict(os.environ, PYTHONPATH=str(SOURCE))
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_POINT, *arguments],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    imports = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(3)] = (int(match.group(1)), int(match.group(2)))
+    return elapsed, imports
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    over_budget = []
+    for arguments in COMMANDS:
+        command = " ".join(arguments)
+        runs = [run_once(arguments) for _ in range(args.repeat)]
+        wall_ms = statistics.median(elapsed for elapsed, _ in runs) * 1000
+        # The import times of the last run; earlier runs warm the file cache
+        imports = runs[-1][1]
+        cli_ms = imports.get("document_collection.cli.main", (0, 0))[1] / 1000
+        print(
+            f"{command:>20}: {wall_ms:7.1f} ms wall, {cli_ms:6.1f} ms importing the CLI"
+        )
+        slowest = sorted(imports.items(), key=lambda item: item[1][0], reverse=True)
+        for module, (own, _) in slowest[: args.top]:
+            print(f"{'':>22}{own / 1000:6.1f} ms  {module}")
+        if args.budget_ms is not None and wall_ms > args.budget_ms:
+            over_budget.append(command)
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
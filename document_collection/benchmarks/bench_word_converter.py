@@ -0,0 +1,80 @@
+"""Benchmark the streaming Word converter against the python-docx path.
+
+Usage:
+    python benchmarks/bench_word_converter.py [--pages 500] [--repeat 3]
+
+A synthetic document is generated with python-docx (headings, body paragraphs
+and a table on every page) and converted with both code paths.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from document_collection.converters.word_converter import WordConverter  # noqa: E402
+
+PARAGRAPHS_PER_PAGE = 12
+
+
+def build_document(path: Path, pages: int) -> None:
+    """Write a synthetic ``.docx`` of roughly ``pages`` pages to ``path``."""
+    from docx import Document
+
+    doc = Document()
+    for page in range(1, pages + 1):
+        doc.add_heading(f"Section {page}", level=1 + page % 3)
+        for paragraph in range(PARAGRAPHS_PER_PAGE):
+            doc.add_paragraph(
+                f"Paragraph {paragraph} of section {page}. "
+                "The workload should be resilient, observable and cost aware. " * 3
+            )
+        table = doc.add_table(rows=4, cols=3)
+        for row_index, row in enumerate(table.rows):
+            for col_index, cell in enumerate(row.cells):
+                cell.text = f"r{row_index}c{col_index}"
+    doc.save(str(path))
+
+
+def time_conversion(input_path: Path, output_path: Path, fast_path: bool) -> float:
+    """Convert once and return the elapsed wall time in seconds."""
+    converter = WordConverter()
+    start = time.perf_counter()
+    asyncio.run(converter.convert(input_path, output_path, fast_path=fast_path))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        input_path = workdir / "benchmark.docx"
+        build_document(input_path, args.pages)
+        size_mb = input_path.stat().st_size / 1_000_000
+        print(f"Document: {args.pages} pages, {size_mb:.1f} MB")
+
+        results = {}
+        for label, fast_path in (("python-docx", False), ("streaming", True)):
+            timings = [
+                time_conversion(input_path, workdir / f"{label}.md", fast_path)
+                for _ in range(args.repeat)
+            ]
+            results[label] = statistics.median(timings)
+            print(f"{label:>12}: {results[label]:.3f}s (median of {args.repeat})")
+
+        speedup = results["python-docx"] / results["streaming"]
+        print(f"{'speedup':>12}: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
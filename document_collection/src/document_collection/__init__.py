@@ -8,8 +8,20 @@ __version__ = "0.1.0"
 __author__ = "Architecture Advisor"
 __description__ = "Document collection and conversion tool for architectural reviews"
 
-from .core.models import CollectionRequest, CollectionResult, DocumentMetadata
-from .core.service import DocumentCollectionService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.models import CollectionRequest, CollectionResult, DocumentMetadata
+    from .core.service import DocumentCollectionService
+
+# Imported on first access, so the CLI can start without loading the service
+_EXPORTS = {
+    "DocumentCollectionService": ".core.service",
+    "CollectionRequest": ".core.models",
+    "CollectionResult": ".core.models",
+    "DocumentMetadata": ".core.models",
+}
 
 __all__ = [
     "DocumentCollectionService",
@@ -17,3 +29,17 @@ __all__ = [
     "CollectionResult",
     "DocumentMetadata",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
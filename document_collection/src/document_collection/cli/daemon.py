@@ -0,0 +1,332 @@
+"""Local collection daemon serving the CLI over a Unix socket.
+
+The daemon keeps one warmed-up service (HTTP connections, caches and the
+parser libraries) in a long-running process. CLI invocations send their work
+to it instead of paying interpreter start-up and imports every time, and do
+the work in process when no daemon is running.
+
+Requests and responses are single lines of JSON. A connection may carry any
+number of requests, answered in order.
+
+The socket is only accessible to the user running the daemon, and clients
+only talk to a socket owned by their own user, so another local user can
+neither send work to the daemon nor impersonate it.
+"""
+
+import asyncio
+import getpass
+import json
+import logging
+import os
+import socket
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..core.config import get_config
+from ..core.exceptions import ConfigurationError, ProcessingError
+from ..core.types import (
+    DAEMON_PING_TIMEOUT,
+    DAEMON_SOCKET_NAME,
+    DEFAULT_DAEMON_TIMEOUT,
+    MAX_DAEMON_MESSAGE_BYTES,
+)
+
+if TYPE_CHECKING:
+    from ..core.models import CollectionResult
+    from ..core.service import DocumentCollectionService
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path() -> Path:
+    """Return the socket of the daemon of the current user.
+
+    The ``daemon_socket`` setting wins; otherwise the socket lives in
+    ``$XDG_RUNTIME_DIR``, named after the user, or in a directory of the user
+    inside the temporary directory, which the daemon creates private.
+    """
+    configured = get_config().get("daemon_socket")
+    if configured:
+        return Path(configured)
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_directory:
+        return Path(runtime_directory) / f"{DAEMON_SOCKET_NAME}-{user}.sock"
+    return Path(tempfile.gettempdir()) / f"{DAEMON_SOCKET_NAME}-{user}" / "daemon.sock"
+
+
+async def collect_via_daemon(
+    sources: list[str],
+    destination: Path,
+    socket_path: Path | None = None,
+    **options: Any,
+) -> list["CollectionResult"] | None:
+    """Collect documents in the daemon.
+
+    Relative paths are resolved here, since the daemon runs in another
+    working directory; the results report the sources as given.
+
+    Args:
+        sources: Source file paths or URLs
+        destination: Destination directory
+        socket_path: Socket of the daemon (default: default_socket_path())
+        **options: Options passed to collect_document
+
+    Returns:
+        One result per source, or None when no daemon is running
+
+    Raises:
+        ProcessingError: If the daemon could not run the request or did not
+            answer within the ``daemon_timeout`` setting
+
+    """
+    # pydantic is only worth importing once there are results to validate
+    from ..core.models import CollectionResult
+
+    timeout = float(get_config().get("daemon_timeout", DEFAULT_DAEMON_TIMEOUT))
+    try:
+        response = await _request(
+            socket_path or default_socket_path(),
+            {
+                "command": "collect",
+                "sources": [_absolute_source(source) for source in sources],
+                "destination": str(destination.resolve()),
+                "options": options,
+            },
+            timeout,
+        )
+    except TimeoutError as e:
+        # The daemon may still be working on the sources, so they are not
+        # collected a second time in process
+        raise ProcessingError(
+            f"The daemon did not answer within {timeout:g}s", stage="daemon"
+        ) from e
+    if response is None:
+        return None
+    if not response.get("ok"):
+        raise ProcessingError(
+            response.get("error", "Daemon request failed"), stage="daemon"
+        )
+    results = [
+        CollectionResult.model_validate(result) for result in response["results"]
+    ]
+    for source, result in zip(sources, results, strict=True):
+        result.source = source
+    return results
+
+
+async def daemon_status(socket_path: Path | None = None) -> dict[str, Any] | None:
+    """Return the pid, uptime and request count of the daemon, None if none runs.
+
+    A daemon that does not answer within ``DAEMON_PING_TIMEOUT`` counts as
+    not running.
+    """
+    return await _control(socket_path or default_socket_path(), "ping")
+
+
+async def stop_daemon(socket_path: Path | None = None) -> bool:
+    """Ask the daemon to exit; False if none was running."""
+    response = await _control(socket_path or default_socket_path(), "shutdown")
+    return response is not None
+
+
+class CollectionDaemon:
+    """Serve collection requests from a warm service on a Unix socket."""
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Socket to listen on (default: default_socket_path())
+
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.requests = 0
+        self._started = time.monotonic()
+        self._stopped = asyncio.Event()
+        self._service: DocumentCollectionService | None = None
+
+    async def serve(self) -> None:
+        """Listen until a shutdown request arrives.
+
+        Collections run in the service's threads, so the daemon keeps
+        answering pings while it converts.
+
+        Raises:
+            ConfigurationError: If another daemon already listens on the socket
+
+        """
+        # Imported here so the client side of the CLI stays light
+        from ..core.service import DocumentCollectionService
+
+        # A busy daemon may be slow to answer a ping, so only a socket that
+        # refuses connections is taken for one left behind
+        if await _accepts_connections(self.socket_path):
+            raise ConfigurationError(
+                f"A daemon is already running on {self.socket_path}",
+                config_key="daemon_socket",
+                config_value=str(self.socket_path),
+            )
+        _prepare_directory(self.socket_path.parent)
+        # A socket left behind by a daemon that did not exit cleanly
+        self.socket_path.unlink(missing_ok=True)
+
+        service = self._service = DocumentCollectionService()
+        loaded = await asyncio.to_thread(service.warm_up)
+        logger.info("Converter libraries preloaded: %s", ", ".join(loaded))
+
+        # Only the owner may send work to the daemon; the socket is created
+        # with that mode, leaving no window in which others could connect
+        previous_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle, path=str(self.socket_path), limit=MAX_DAEMON_MESSAGE_BYTES
+            )
+        finally:
+            os.umask(previous_umask)
+        logger.info("Collection daemon listening on %s", self.socket_path)
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            self.socket_path.unlink(missing_ok=True)
+            service.close()
+            logger.info("Collection daemon stopped")
+
+    def stop(self) -> None:
+        """Make serve() return."""
+        self._stopped.set()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection."""
+        try:
+            while line := await reader.readline():
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            logger.warning("Dropped daemon connection: %s", e)
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict[str, Any]:
+        """Run one request."""
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            command = request.get("command")
+            if command == "ping":
+                return {
+                    "ok": True,
+                    "pid": os.getpid(),
+                    "uptime": time.monotonic() - self._started,
+                    "requests": self.requests,
+                }
+            if command == "collect" and self._service is not None:
+                results = await self._service.collect_documents(
+                    request["sources"],
+                    Path(request["destination"]),
+                    **request.get("options", {}),
+                )
+                return {
+                    "ok": True,
+                    "results": [result.model_dump(mode="json") for result in results],
+                }
+            if command == "shutdown":
+                self.stop()
+                return {"ok": True}
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        except Exception as e:
+            logger.error("Daemon request failed: %s", e)
+            return {"ok": False, "error": str(e)}
+
+
+async def _accepts_connections(socket_path: Path) -> bool:
+    """Check whether something listens on the socket, without sending a request."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    writer.close()
+    return True
+
+
+async def _control(socket_path: Path, command: str) -> dict[str, Any] | None:
+    """Send a ping or shutdown request; None when no daemon answers in time."""
+    try:
+        return await _request(socket_path, {"command": command}, DAEMON_PING_TIMEOUT)
+    except TimeoutError:
+        logger.warning(
+            "The daemon on %s did not answer within %gs",
+            socket_path,
+            DAEMON_PING_TIMEOUT,
+        )
+        return None
+
+
+async def _request(
+    socket_path: Path, request: dict[str, Any], timeout: float
+) -> dict[str, Any] | None:
+    """Send one request to the daemon; None when no daemon answers.
+
+    Raises:
+        TimeoutError: If the daemon took the request but did not answer in time
+
+    """
+    if not hasattr(socket, "AF_UNIX") or not _owned_by_user(socket_path):
+        return None
+    try:
+        reader, writer = await asyncio.open_unix_connection(
+            str(socket_path), limit=MAX_DAEMON_MESSAGE_BYTES
+        )
+    except (FileNotFoundError, ConnectionRefusedError, PermissionError):
+        return None
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout)
+    finally:
+        writer.close()
+    # An empty line means the daemon went away before answering
+    return json.loads(line) if line else None
+
+
+def _owned_by_user(socket_path: Path) -> bool:
+    """Check the socket belongs to the current user, so its answers can be trusted."""
+    try:
+        owner = socket_path.lstat().st_uid
+    except OSError:
+        return False
+    if owner != os.getuid():
+        logger.warning("Ignoring daemon socket %s owned by another user", socket_path)
+        return False
+    return True
+
+
+def _prepare_directory(directory: Path) -> None:
+    """Create the directory of the socket, private unless it exists already.
+
+    Raises:
+        ConfigurationError: If the directory belongs to another user
+
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if directory.stat().st_uid != os.getuid():
+        raise ConfigurationError(
+            f"The daemon socket directory {directory} belongs to another user",
+            config_key="daemon_socket",
+            config_value=str(directory),
+        )
+
+
+def _absolute_source(source: str) -> str:
+    """Resolve a local source against the working directory of the client."""
+    if "://" in source:
+        return source
+    return str(Path(source).expanduser().resolve())
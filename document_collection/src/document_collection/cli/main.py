@@ -3,16 +3,48 @@
 import asyncio
 import sys
 import time
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from ..core.service import DocumentCollectionService
+from ..core.types import DEFAULT_SEARCH_LIMIT
+from .daemon import CollectionDaemon, collect_via_daemon, daemon_status, stop_daemon
 
-# Initialize rich console
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..core.service import DocumentCollectionService
+
+
+def __getattr__(name: str) -> Any:
+    """Import the service on first use.
+
+    The service loads the converters and their dependencies, which commands
+    such as --help and list-formats never need.
+    """
+    if name == "DocumentCollectionService":
+        from ..core.service import DocumentCollectionService
+
+        return DocumentCollectionService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _create_service() -> "DocumentCollectionService":
+    """Create the collection service, looked up on the module so tests can patch it."""
+    service: DocumentCollectionService = sys.modules[
+        __name__
+    ].DocumentCollectionService()
+    return service
+
+
+@cache
+def _console() -> "Console":
+    """Return the rich console, importing rich only once output is rendered."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -58,6 +90,12 @@ def cli() -> None:
     is_flag=True,
     help="Suppress all output except errors",
 )
+@click.option(
+    "--daemon/--no-daemon",
+    "use_daemon",
+    default=True,
+    help="Send the work to the collection daemon when it is running (default: true)",
+)
 def collect(
     source: str,
     destination: Path,
@@ -66,6 +104,7 @@ def collect(
     overwrite: bool,
     verbose: bool,
     quiet: bool,
+    use_daemon: bool,
 ) -> None:
     """Collect a single document from a file path or URL.
 
@@ -88,6 +127,7 @@ def collect(
                 overwrite=overwrite,
                 verbose=verbose,
                 quiet=quiet,
+                use_daemon=use_daemon,
             )
         )
 
@@ -143,6 +183,12 @@ def collect(
     is_flag=True,
     help="Suppress all output except errors",
 )
+@click.option(
+    "--daemon/--no-daemon",
+    "use_daemon",
+    default=True,
+    help="Send the work to the collection daemon when it is running (default: true)",
+)
 def collect_batch(
     sources: tuple[str, ...],
     destination: Path,
@@ -151,6 +197,7 @@ def collect_batch(
     overwrite: bool,
     verbose: bool,
     quiet: bool,
+    use_daemon: bool,
 ) -> None:
     """Collect multiple documents from file paths or URLs.
 
@@ -174,6 +221,7 @@ def collect_batch(
                 overwrite=overwrite,
                 verbose=verbose,
                 quiet=quiet,
+                use_daemon=use_daemon,
             )
         )
 
@@ -196,6 +244,8 @@ def collect_batch(
 @cli.command()
 def list_formats() -> None:
     """List supported document formats."""
+    from rich.table import Table
+
     table = Table(title="[bold blue]Supported Document Formats[/bold blue]")
     table.add_column("Format", style="cyan", no_wrap=True)
     table.add_column("Extension", style="magenta")
@@ -206,13 +256,66 @@ def list_formats() -> None:
         ("Word", ".docx", "Microsoft Word Document"),
         ("PowerPoint", ".pptx", "Microsoft PowerPoint Presentation"),
         ("Excel", ".xlsx", "Microsoft Excel Spreadsheet"),
+        ("HTML", ".html", "Web Page"),
         ("Markdown", ".md", "Markdown Document (processing/validation)"),
     ]
 
     for format_name, extension, description in formats_info:
         table.add_row(format_name, extension, description)
 
-    console.print(table)
+    _console().print(table)
+
+
+@cli.command()
+@click.argument("query", type=str)
+@click.option(
+    "--destination",
+    "-d",
+    type=click.Path(path_type=Path),
+    default=Path("./documents"),
+    help="Collection directory to search (default: ./documents)",
+)
+@click.option(
+    "--limit",
+    "-n",
+    type=int,
+    default=DEFAULT_SEARCH_LIMIT,
+    help=f"Maximum number of results (default: {DEFAULT_SEARCH_LIMIT})",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Index new and changed documents before searching",
+)
+def search(query: str, destination: Path, limit: int, refresh: bool) -> None:
+    """Search the sections of collected documents.
+
+    QUERY is free text; sections are ranked by BM25 over their words.
+    """
+    from rich.markup import escape
+
+    if not destination.is_dir():
+        click.echo(f"Error: Collection directory not found: {destination}", err=True)
+        sys.exit(1)
+
+    service = _create_service()
+    hits = asyncio.run(
+        service.search(
+            query, destination_path=destination, limit=limit, refresh=refresh
+        )
+    )
+    if not hits:
+        _console().print(f"No results for [bold]{query}[/bold]")
+        return
+
+    for rank, hit in enumerate(hits, start=1):
+        location = f"{hit.document}" + (f" › {hit.heading}" if hit.heading else "")
+        _console().print(
+            f"{rank:>2}. [blue]{escape(location)}[/blue] [dim]({hit.score:.2f})[/dim]",
+            highlight=False,
+        )
+        if hit.snippet:
+            _console().print(f"    {hit.snippet}", highlight=False, markup=False)
 
 
 async def _collect_single_document(
@@ -223,23 +326,32 @@ async def _collect_single_document(
     overwrite: bool,
     verbose: bool,
     quiet: bool,
+    use_daemon: bool = False,
 ) -> bool:
     """Collect a single document with progress indication."""
-    service = DocumentCollectionService()
-
     if not quiet:
         click.echo(f"Collecting document from: {source}")
         click.echo(f"Destination: {destination}")
         click.echo("Processing...", nl=False)
 
     start_time = time.time()
-    result = await service.collect_document(
-        source=source,
-        destination_path=destination,
-        convert_to_markdown=convert_to_markdown,
-        preserve_original=preserve_original,
-        overwrite_existing=overwrite,
+    options: dict[str, Any] = {
+        "convert_to_markdown": convert_to_markdown,
+        "preserve_original": preserve_original,
+        "overwrite_existing": overwrite,
+    }
+    results = (
+        await collect_via_daemon([source], destination, **options)
+        if use_daemon
+        else None
     )
+    if results is not None:
+        result = results[0]
+    else:
+        service = _create_service()
+        result = await service.collect_document(
+            source=source, destination_path=destination, **options
+        )
     end_time = time.time()
 
     if not quiet:
@@ -247,30 +359,41 @@ async def _collect_single_document(
 
     if result.success:
         if not quiet:
-            console.print("✅ [bold green]Successfully collected document[/bold green]")
-            console.print(f"  📄 Output: [blue]{result.output_path}[/blue]")
+            _console().print(
+                "✅ [bold green]Successfully collected document[/bold green]"
+            )
+            _console().print(f"  📄 Output: [blue]{result.output_path}[/blue]")
             if result.original_path and result.original_path != result.output_path:
-                console.print(f"  📁 Original: [blue]{result.original_path}[/blue]")
-            console.print(
+                _console().print(f"  📁 Original: [blue]{result.original_path}[/blue]")
+            _console().print(
                 f"  ⏱️  Processing time: [yellow]{end_time - start_time:.2f}s[/yellow]"
             )
 
             if verbose and result.metadata:
-                console.print(f"  📋 Filename: {result.metadata.filename}")
-                console.print(f"  🔖 Format: {result.metadata.format}")
+                _console().print(f"  📋 Filename: {result.metadata.filename}")
+                _console().print(f"  🔖 Format: {result.metadata.format}")
                 if result.metadata.size_bytes:
-                    console.print(f"  📏 Size: {result.metadata.size_bytes} bytes")
+                    _console().print(f"  📏 Size: {result.metadata.size_bytes} bytes")
+            if verbose and "pages_reused" in result.conversion_stats:
+                _console().print(
+                    f"  ♻️  Pages reused: {result.conversion_stats['pages_reused']}"
+                    f"/{result.conversion_stats['pages_total']}"
+                )
+            if verbose and "chunks" in result.artifacts:
+                _console().print(
+                    f"  🧩 Chunk index: [blue]{result.artifacts['chunks']}[/blue]"
+                )
         return True
     else:
         if not quiet:
-            console.print("❌ [bold red]Failed to collect document[/bold red]")
-            console.print(
+            _console().print("❌ [bold red]Failed to collect document[/bold red]")
+            _console().print(
                 f"  ⏱️  Processing time: [yellow]{end_time - start_time:.2f}s[/yellow]"
             )
             for error in result.errors:
-                console.print(f"  🚨 Error: [red]{error}[/red]")
+                _console().print(f"  🚨 Error: [red]{error}[/red]")
             for warning in result.warnings:
-                console.print(f"  ⚠️  Warning: [yellow]{warning}[/yellow]")
+                _console().print(f"  ⚠️  Warning: [yellow]{warning}[/yellow]")
         return False
 
 
@@ -282,23 +405,33 @@ async def _collect_multiple_documents(
     overwrite: bool,
     verbose: bool,
     quiet: bool,
+    use_daemon: bool = False,
 ) -> bool:
     """Collect multiple documents with progress indication."""
-    service = DocumentCollectionService()
 
     if not quiet:
-        console.print(f"📦 [bold blue]Collecting {len(sources)} documents[/bold blue]")
-        console.print(
+        _console().print(
+            f"📦 [bold blue]Collecting {len(sources)} documents[/bold blue]"
+        )
+        _console().print(
             f"📁 [bold blue]Destination:[/bold blue] [blue]{destination}[/blue]"
         )
 
-    results = await service.collect_documents(
-        sources=sources,
-        destination_path=destination,
-        convert_to_markdown=convert_to_markdown,
-        preserve_original=preserve_original,
-        overwrite_existing=overwrite,
+    options: dict[str, Any] = {
+        "convert_to_markdown": convert_to_markdown,
+        "preserve_original": preserve_original,
+        "overwrite_existing": overwrite,
+    }
+    results = (
+        await collect_via_daemon(sources, destination, **options)
+        if use_daemon
+        else None
     )
+    if results is None:
+        service = _create_service()
+        results = await service.collect_documents(
+            sources=sources, destination_path=destination, **options
+        )
 
     # Summarize results
     successful = [r for r in results if r.success]
@@ -306,24 +439,24 @@ async def _collect_multiple_documents(
 
     if not quiet:
         if successful:
-            console.print(
+            _console().print(
                 f"✅ [bold green]Successfully collected {len(successful)} documents[/bold green]"
             )
             if verbose:
                 for result in successful:
-                    console.print(
+                    _console().print(
                         f"  ✅ [green]{result.source}[/green] → [blue]{result.output_path}[/blue]"
                     )
 
         if failed:
-            console.print(
+            _console().print(
                 f"❌ [bold red]Failed to collect {len(failed)} documents[/bold red]"
             )
             for result in failed:
-                console.print(f"  ❌ [red]{result.source}[/red]")
+                _console().print(f"  ❌ [red]{result.source}[/red]")
                 if verbose:
                     for error in result.errors:
-                        console.print(f"    🚨 Error: [red]{error}[/red]")
+                        _console().print(f"    🚨 Error: [red]{error}[/red]")
 
     return len(failed) == 0
 
@@ -335,28 +468,113 @@ async def _collect_multiple_documents(
     default="stdio",
     help="Transport type for MCP server (default: stdio)",
 )
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Address for HTTP transport to bind (default: 127.0.0.1)",
+)
 @click.option(
     "--port",
     type=int,
     default=8000,
     help="Port for HTTP transport (default: 8000)",
 )
-def mcp_server(transport: str, port: int) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Server processes sharing the HTTP port (default: 1)",
+)
+def mcp_server(transport: str, host: str, port: int, workers: int) -> None:
     """Run the MCP (Model Context Protocol) server for document collection."""
     from ..mcp_server.server import run_server, run_server_http
 
-    console.print(
+    _console().print(
         "🚀 [bold blue]Starting Document Collection MCP Server...[/bold blue]"
     )
-    console.print(f"🔗 [bold blue]Transport:[/bold blue] [cyan]{transport}[/cyan]")
+    _console().print(f"🔗 [bold blue]Transport:[/bold blue] [cyan]{transport}[/cyan]")
 
     if transport == "http":
-        console.print(f"🌐 [bold blue]Port:[/bold blue] [yellow]{port}[/yellow]")
-        run_server_http(port=port)
+        _console().print(
+            f"🌐 [bold blue]Address:[/bold blue] [yellow]{host}:{port}[/yellow]"
+        )
+        if workers > 1:
+            _console().print(
+                f"⚙️  [bold blue]Workers:[/bold blue] [yellow]{workers}[/yellow]"
+            )
+        run_server_http(port=port, host=host, workers=workers)
     else:
         run_server()
 
 
+@cli.group()
+def daemon() -> None:
+    """Run a local daemon that keeps the service and parsers warm.
+
+    While the daemon runs, collect and collect-batch send their work to it
+    over a Unix socket instead of starting the service in every invocation.
+    """
+
+
+@daemon.command("start")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Unix socket to listen on (default: per-user socket in the runtime directory)",
+)
+def daemon_start(socket_path: Path | None) -> None:
+    """Run the daemon in the foreground until it is stopped."""
+    server = CollectionDaemon(socket_path)
+    _console().print(
+        f"🔌 [bold blue]Collection daemon on[/bold blue] [cyan]{server.socket_path}[/cyan]"
+    )
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        _console().print("Daemon stopped")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@daemon.command("stop")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Unix socket of the daemon",
+)
+def daemon_stop(socket_path: Path | None) -> None:
+    """Ask the running daemon to exit."""
+    if asyncio.run(stop_daemon(socket_path)):
+        _console().print("✅ Daemon stopped")
+    else:
+        _console().print("No daemon is running")
+
+
+@daemon.command("status")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Unix socket of the daemon",
+)
+def daemon_status_command(socket_path: Path | None) -> None:
+    """Show whether the daemon is running."""
+    status = asyncio.run(daemon_status(socket_path))
+    if status is None:
+        _console().print("No daemon is running")
+        sys.exit(1)
+    _console().print(
+        f"✅ Daemon running: pid [cyan]{status['pid']}[/cyan], "
+        f"up [yellow]{status['uptime']:.0f}s[/yellow], {status['requests']} requests"
+    )
+
+
 def main() -> None:
     """Serve as the main entry point for the CLI."""
     cli()
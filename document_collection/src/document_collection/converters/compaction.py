@@ -0,0 +1,66 @@
+"""Compaction of extracted text before it is written as Markdown."""
+
+import re
+
+# Table of contents leaders: four or more dots (or middle dots), spaced or not
+_DOT_LEADER = re.compile(r"[ \t]*(?:[.·…][ \t]*){4,}")
+_WHITESPACE = re.compile(r"[ \t\f\v\u00a0\u2000-\u200a\u202f\u3000]+")
+# Lines that start a new block even when the previous line was wrapped
+_BLOCK_START = re.compile(r"(?:[•●▪◦‣*+-]|\d{1,3}[.)]|[a-zA-Z][.)])\s")
+_SOFT_HYPHEN = "\u00ad"
+_CONTINUED_ENDINGS = (",", ";", "-", _SOFT_HYPHEN)
+
+
+def compact_text(text: str) -> str:
+    """Compact extracted page text into Markdown paragraphs.
+
+    Dot leaders are collapsed to `` ... ``, runs of whitespace are squeezed,
+    and hard-wrapped lines are rejoined into paragraphs in a single pass over
+    the lines. A line is treated as wrapped when the extractor left trailing
+    whitespace on it, when it ends in a comma, semicolon or hyphen, or when
+    the next line starts in lowercase; list items always start a new block.
+    Words split at a soft hyphen are rejoined without it, while a visible
+    hyphen at a line break is kept, since in technical text it is far more
+    often part of a compound (``Well-Architected``) than a hyphenation.
+
+    Args:
+        text: Text of one page as produced by the extractor
+
+    Returns:
+        Paragraphs separated by blank lines
+
+    """
+    paragraphs: list[str] = []
+    current: list[str] = []
+    continues = False
+
+    for raw_line in text.split("\n"):
+        line = _WHITESPACE.sub(" ", _DOT_LEADER.sub(" ... ", raw_line)).strip()
+        if not line:
+            if current:
+                paragraphs.append("".join(current))
+                current = []
+            continues = False
+            continue
+
+        if (
+            current
+            and (continues or line[0].islower())
+            and not _BLOCK_START.match(line)
+        ):
+            previous = current[-1]
+            if previous.endswith(_SOFT_HYPHEN):
+                current[-1] = previous[:-1]
+            elif not previous.endswith("-"):
+                current.append(" ")
+            current.append(line)
+        else:
+            if current:
+                paragraphs.append("".join(current))
+            current = [line]
+
+        continues = raw_line[-1:].isspace() or line.endswith(_CONTINUED_ENDINGS)
+
+    if current:
+        paragraphs.append("".join(current))
+    return "\n\n".join(paragraphs)
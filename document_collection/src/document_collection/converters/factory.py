@@ -1,34 +1,68 @@
 """ConverterFactory for selecting appropriate converter."""
 
-from document_collection.converters.excel_converter import ExcelConverter
-from document_collection.converters.markdown_processor import MarkdownProcessor
-from document_collection.converters.pdf_converter import PdfConverter
-from document_collection.converters.powerpoint_converter import PowerPointConverter
-from document_collection.converters.word_converter import WordConverter
+import importlib
+import logging
+
+from document_collection.core.interfaces import DocumentConverter
+from document_collection.core.models import DocumentFormat
+from document_collection.core.registry import converter_registry, source_extension
+
+logger = logging.getLogger(__name__)
+
+# Parser libraries the converters import on first use
+CONVERTER_LIBRARIES = ("pypdf", "docx", "pptx", "openpyxl", "lxml.etree")
 
 
 class ConverterFactory:
-    """Factory to instantiate appropriate converter based on file type."""
+    """Factory selecting the converter registered for a file type."""
 
     @staticmethod
     def get_converter(
         source: str,
-    ) -> (
-        PdfConverter
-        | WordConverter
-        | PowerPointConverter
-        | ExcelConverter
-        | MarkdownProcessor
-    ):
-        """Get appropriate converter based on file extension."""
-        if source.lower().endswith(".pdf"):
-            return PdfConverter()
-        if source.lower().endswith(".docx"):
-            return WordConverter()
-        if source.lower().endswith(".pptx"):
-            return PowerPointConverter()
-        if source.lower().endswith(".xlsx"):
-            return ExcelConverter()
-        if source.lower().endswith(".md"):
-            return MarkdownProcessor()
-        raise ValueError(f"Unsupported file type: {source}")
+        mime_type: str | None = None,
+        document_format: DocumentFormat | None = None,
+    ) -> DocumentConverter:
+        """Get the converter for a source by its extension, else its MIME type.
+
+        Args:
+            source: Source file path or URL
+            mime_type: Content type reported for the source, if known
+            document_format: Format detected from the content; when given it
+                alone decides, whatever the extension claims
+
+        Raises:
+            ValueError: If no converter is registered for the source
+
+        """
+        if document_format is not None:
+            keys = [f".{document_format.value}"]
+        else:
+            keys = [source_extension(source)]
+            if mime_type:
+                keys.append(mime_type.partition(";")[0].strip())
+        converter = converter_registry.get(*keys)
+        if converter is None:
+            raise ValueError(f"Unsupported file type: {source}")
+        return converter
+
+    @staticmethod
+    def warm_up() -> list[str]:
+        """Import the converters' parser libraries ahead of the first conversion.
+
+        Converters import their parsers lazily, which adds the import time
+        to the first document of each format. A long-running server calls
+        this at startup instead.
+
+        Returns:
+            Names of the libraries that could be imported
+
+        """
+        loaded = []
+        for name in CONVERTER_LIBRARIES:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                logger.debug("Could not preload %s: %s", name, e)
+                continue
+            loaded.append(name)
+        return loaded
@@ -0,0 +1,461 @@
+"""HTML to Markdown converter implementation."""
+
+import codecs
+import itertools
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from document_collection.converters.writer import write_markdown
+from document_collection.core.interfaces import DocumentConverter
+
+# Size of the blocks of the page fed to the parser
+READ_BLOCK_SIZE = 64 * 1024
+
+# Text buffered for one block before it is written out regardless, which
+# bounds memory on pages that put all their text in a single element
+MAX_BLOCK_CHARS = 64 * 1024
+
+# Elements dropped with everything inside them: scripts, styling, widgets and
+# the navigation around the content of the page
+_SKIPPED = frozenset(
+    {
+        "head",
+        "script",
+        "style",
+        "noscript",
+        "template",
+        "svg",
+        "canvas",
+        "iframe",
+        "object",
+        "nav",
+        "footer",
+        "aside",
+        "button",
+        "select",
+        "textarea",
+    }
+)
+_SKIPPED_ROLES = frozenset(
+    {"navigation", "banner", "contentinfo", "search", "complementary"}
+)
+# Elements holding the content of the page; a header outside them is the
+# banner of the page and dropped, one inside them heads the content
+_CONTENT = frozenset({"main", "article"})
+
+# Elements that start and end a paragraph
+_BLOCKS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "header",
+        "figure",
+        "figcaption",
+        "caption",
+        "address",
+        "details",
+        "summary",
+        "dl",
+        "dt",
+        "dd",
+        "center",
+        "br",
+    }
+)
+_HEADINGS = {f"h{level}": level for level in range(1, 7)}
+_LISTS = frozenset({"ul", "ol"})
+_CELLS = frozenset({"td", "th"})
+# Inline elements and the Markdown around their text
+_EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*", "code": "`"}
+
+_WHITESPACE = re.compile(r"\s+")
+_BACKTICKS = re.compile(r"`+")
+_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+
+
+class _Mark(NamedTuple):
+    """Inline markup opened in the text buffer and closed at the end tag."""
+
+    position: int
+    size: int
+    closing: str
+
+
+class _MarkdownTarget:
+    """Parser target turning the events of lxml's HTMLParser into Markdown.
+
+    Completed blocks are collected in ``blocks`` and taken with ``drain()``
+    after every fed chunk; only the block being built is held in memory.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: list[str] = []
+        self._text: list[str] = []
+        self._size = 0
+        self._marks: list[_Mark | None] = []
+        self._skip = 0
+        self._content = 0
+        self._heading = 0
+        self._quote = 0
+        self._lists: list[list[Any]] = []  # [ordered, items so far]
+        self._items: list[str] = []  # Prefix of the next line of each open item
+        self._pre = 0
+        self._code: list[str] = []
+        self._code_size = 0
+        self._fence: str | None = None
+        self._language = ""
+        self._tables = 0
+        self._row: list[str] | None = None
+        self._cell = False
+        self._columns = 0
+
+    def drain(self) -> list[str]:
+        """Take the blocks completed so far."""
+        blocks, self.blocks = self.blocks, []
+        return blocks
+
+    def start(self, tag: str, attrib: Any) -> None:
+        """Handle an opening tag."""
+        if (
+            self._skip
+            or tag in _SKIPPED
+            or (tag == "header" and not self._content)
+            or (attrib and attrib.get("role") in _SKIPPED_ROLES)
+        ):
+            self._skip += 1
+            return
+        if tag in _CONTENT:
+            self._content += 1
+        if self._pre:
+            if tag == "pre":
+                self._pre += 1
+            elif tag == "code" and not self._language:
+                # <pre><code class="language-x"> names the language on the code
+                self._language = _language(attrib.get("class", ""))
+            return
+        if tag == "table":
+            self._tables += 1
+            if self._tables == 1:
+                self._flush()
+                self._columns = 0
+            else:
+                self._space()
+        elif self._tables == 1 and tag == "tr":
+            self._row = []
+        elif self._tables == 1 and tag in _CELLS and self._row is not None:
+            self._clear()
+            self._cell = True
+        elif tag in _EMPHASIS:
+            self._open(_EMPHASIS[tag], _EMPHASIS[tag])
+        elif tag == "a":
+            href = attrib.get("href", "")
+            if href and not href.startswith(("#", "javascript:")):
+                self._open("[", f"]({href})")
+            else:
+                self._marks.append(None)
+        elif tag == "img":
+            source = attrib.get("src", "")
+            if source and not source.startswith("data:"):
+                self._append(f"![{attrib.get('alt', '')}]({source})")
+        elif self._cell or self._tables > 1:
+            # Tables only hold inline text in their cells
+            self._space()
+        elif tag in _HEADINGS:
+            self._flush()
+            self._heading = _HEADINGS[tag]
+        elif tag in _LISTS:
+            self._flush()
+            self._lists.append([tag == "ol", 0])
+        elif tag == "li":
+            self._flush()
+            self._open_item()
+        elif tag == "pre":
+            self._flush()
+            self._pre = 1
+            self._language = _language(attrib.get("class", ""))
+        elif tag == "blockquote":
+            self._flush()
+            self._quote += 1
+        elif tag == "hr":
+            self._flush()
+            self.blocks.append("---\n")
+        elif tag in _BLOCKS:
+            self._flush()
+
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        if self._skip:
+            self._skip -= 1
+            return
+        if tag in _CONTENT:
+            self._content = max(0, self._content - 1)
+        if self._pre:
+            if tag == "pre":
+                self._pre -= 1
+                if not self._pre:
+                    self._close_code()
+            return
+        if tag == "table":
+            self._tables -= 1
+            if self._tables == 0:
+                self._row = None
+                self._cell = False
+                if self._columns:
+                    self.blocks.append("")
+        elif self._tables == 1 and tag in _CELLS and self._cell:
+            text = self._take().replace("|", "\\|")
+            if self._row is not None:
+                self._row.append(text)
+            self._cell = False
+        elif self._tables == 1 and tag == "tr":
+            self._write_row()
+        elif tag in _EMPHASIS or tag == "a":
+            self._close()
+        elif self._cell or self._tables > 1:
+            self._space()
+        elif tag in _HEADINGS:
+            self._flush()
+            self._heading = 0
+        elif tag in _LISTS:
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self.blocks.append("")
+        elif tag == "li":
+            self._flush()
+            if self._items:
+                self._items.pop()
+        elif tag == "blockquote":
+            self._flush()
+            self._quote = max(0, self._quote - 1)
+        elif tag in _BLOCKS:
+            self._flush()
+
+    def data(self, data: str) -> None:
+        """Handle text."""
+        if self._skip:
+            return
+        if self._pre:
+            self._code.append(data)
+            self._code_size += len(data)
+            if self._code_size > MAX_BLOCK_CHARS:
+                self._flush_code()
+            return
+        self._append(data)
+        if self._size > MAX_BLOCK_CHARS and not self._cell and not self._tables:
+            self._flush()
+
+    def close(self) -> None:
+        """Write out what is left at the end of the page."""
+        if self._pre:
+            self._close_code()
+        self._flush()
+
+    def _append(self, text: str) -> None:
+        self._text.append(text)
+        self._size += len(text)
+
+    def _space(self) -> None:
+        self._append(" ")
+
+    def _open(self, opening: str, closing: str) -> None:
+        self._append(opening)
+        self._marks.append(_Mark(len(self._text) - 1, self._size, closing))
+
+    def _close(self) -> None:
+        mark = self._marks.pop() if self._marks else None
+        if mark is None:
+            return
+        if self._size == mark.size:
+            # Nothing inside, so no markup either
+            self._text[mark.position] = ""
+        else:
+            self._append(mark.closing)
+
+    def _take(self) -> str:
+        """Return the buffered text with whitespace collapsed, and clear it."""
+        if not self._text:
+            return ""
+        for slot, mark in enumerate(self._marks):
+            if mark is not None:
+                # Markup left open across a block boundary is dropped
+                self._text[mark.position] = ""
+                self._marks[slot] = None
+        text = _WHITESPACE.sub(" ", "".join(self._text)).strip()
+        self._clear()
+        return text
+
+    def _clear(self) -> None:
+        self._text.clear()
+        self._size = 0
+
+    def _flush(self) -> None:
+        """End the block being built."""
+        text = self._take()
+        if not text:
+            return
+        quote = "> " * self._quote
+        if self._heading:
+            self.blocks.append(f"{quote}{'#' * self._heading} {text}\n")
+        elif self._items:
+            prefix = self._items[-1]
+            self.blocks.append(f"{quote}{prefix}{text}")
+            # Later paragraphs of the item are indented below its marker
+            self._items[-1] = " " * len(prefix)
+        else:
+            self.blocks.append(f"{quote}{text}\n")
+
+    def _open_item(self) -> None:
+        if not self._lists:
+            # A list item outside of a list
+            self._items.append("- ")
+            return
+        current = self._lists[-1]
+        current[1] += 1
+        marker = f"{current[1]}." if current[0] else "-"
+        self._items.append(f"{'  ' * (len(self._lists) - 1)}{marker} ")
+
+    def _write_row(self) -> None:
+        row, self._row = self._row, None
+        if not row or not any(row):
+            return
+        if not self._columns:
+            self._columns = len(row)
+            self.blocks.append("| " + " | ".join(row) + " |")
+            self.blocks.append("|" + " --- |" * self._columns)
+            return
+        row.extend([""] * (self._columns - len(row)))
+        self.blocks.append("| " + " | ".join(row) + " |")
+
+    def _flush_code(self) -> None:
+        """Write out the complete lines of a long code block."""
+        code = "".join(self._code)
+        if self._fence is None:
+            self._fence = _fence(code)
+            self.blocks.append(f"{self._fence}{self._language}")
+            code = code.lstrip("\n")
+        complete, _, rest = code.rpartition("\n")
+        if complete:
+            self.blocks.append(complete)
+        self._code = [rest]
+        self._code_size = len(rest)
+
+    def _close_code(self) -> None:
+        code = "".join(self._code).rstrip()
+        if self._fence is None:
+            code = code.lstrip("\n")
+            if code:
+                fence = _fence(code)
+                self.blocks.append(f"{fence}{self._language}\n{code}\n{fence}\n")
+        else:
+            if code:
+                self.blocks.append(code)
+            self.blocks.append(f"{self._fence}\n")
+        self._pre = 0
+        self._code = []
+        self._code_size = 0
+        self._fence = None
+        self._language = ""
+
+
+class HtmlConverter(DocumentConverter):
+    """Convert HTML pages to Markdown format."""
+
+    def can_convert(self, file_path: Path) -> bool:
+        """Check if this converter can handle HTML pages."""
+        return str(file_path).lower().endswith((".html", ".htm"))
+
+    def get_supported_formats(self) -> list[str]:
+        """Return list of supported formats."""
+        return ["html", "htm"]
+
+    async def convert(self, input_path: Path, output_path: Path, **kwargs: Any) -> Path:
+        """Convert an HTML page to Markdown.
+
+        The page is fed to lxml's HTMLParser block by block with a parser
+        target instead of a tree, and the Markdown of each block is written as
+        soon as it is complete. Memory use stays bounded and time linear in
+        the size of the page. Headings, paragraphs, lists, tables, code blocks,
+        quotes, links and images are converted; scripts, styles and the
+        navigation, header and footer landmarks are dropped unread. A header
+        inside the main content or an article is kept.
+        """
+        try:
+            content_parts = itertools.chain(
+                [f"# {input_path.stem}\n", "Converted from HTML document\n"],
+                self._iter_markdown(input_path),
+            )
+            write_markdown(output_path, content_parts)
+            return output_path
+
+        except ImportError:
+            # Fallback if lxml is not available
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nHTML conversion requires lxml library.\n"
+                )
+            return output_path
+        except Exception as e:
+            # Create error file
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nError converting HTML document: {str(e)}\n"
+                )
+            return output_path
+
+    def _iter_markdown(self, input_path: Path) -> Iterator[str]:
+        """Yield the Markdown blocks of a page as its bytes are parsed."""
+        from lxml import etree
+
+        target = _MarkdownTarget()
+        with open(input_path, "rb") as f:
+            block = f.read(READ_BLOCK_SIZE)
+            if not block.strip():
+                return
+            parser = etree.HTMLParser(target=target, encoding=_encoding(block))
+            while block:
+                parser.feed(block)
+                yield from target.drain()
+                block = f.read(READ_BLOCK_SIZE)
+        parser.close()
+        yield from target.drain()
+
+
+def _encoding(head: bytes) -> str:
+    """Return the encoding of a page from its byte order mark or meta tag.
+
+    libxml2 falls back to Latin-1 for pages that declare nothing, while
+    nearly all of them are UTF-8 today.
+    """
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    match = _CHARSET.search(head[:4096])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except (LookupError, UnicodeDecodeError):
+            pass
+    return "utf-8"
+
+
+def _language(classes: str) -> str:
+    """Return the language named by a ``language-*`` or ``lang-*`` class."""
+    for name in classes.split():
+        for prefix in ("language-", "lang-"):
+            if name.startswith(prefix):
+                return name[len(prefix) :]
+    return ""
+
+
+def _fence(code: str) -> str:
+    """Return a code fence longer than any run of backticks in the code."""
+    longest = max((len(run) for run in _BACKTICKS.findall(code)), default=0)
+    return "`" * max(3, longest + 1)
@@ -0,0 +1,84 @@
+"""Content-addressed store for images extracted by the converters."""
+
+import hashlib
+import os
+import secrets
+from pathlib import Path
+
+
+class ImageStore:
+    """Store image blobs named by the hash of their content.
+
+    Every blob is written once per images directory; converting another page,
+    slide or document that contains the same bytes only returns the existing
+    name, so markdown references from many documents point at one shared file.
+    """
+
+    def __init__(self, images_dir: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            images_dir: Directory that holds the image blobs
+
+        """
+        self.images_dir = images_dir
+        self._known: set[str] = set()
+        self.images_written = 0
+        self.images_deduplicated = 0
+        self.bytes_written = 0
+        self.bytes_deduplicated = 0
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Return the content hash used to name a blob."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def filename_for(self, digest: str, extension: str) -> str:
+        """Return the blob filename for a digest and file extension."""
+        return f"{digest}{extension.lower()}"
+
+    def contains(self, filename: str) -> bool:
+        """Check whether a blob is already stored."""
+        if filename in self._known:
+            return True
+        if (self.images_dir / filename).is_file():
+            self._known.add(filename)
+            return True
+        return False
+
+    def put(self, data: bytes, extension: str) -> str:
+        """Store image data and return its filename inside the images directory.
+
+        Args:
+            data: Encoded image bytes
+            extension: File extension including the leading dot
+
+        Returns:
+            Filename of the stored blob
+
+        """
+        filename = self.filename_for(self.digest(data), extension)
+        if self.contains(filename):
+            self.images_deduplicated += 1
+            self.bytes_deduplicated += len(data)
+            return filename
+
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent writers never expose
+        # a partially written blob under its final name. Unlike mkstemp, which
+        # makes the file private, the kernel applies the umask to the mode
+        # given here, so blobs get the mode of any other file written.
+        temp_path = self.images_dir / f".{filename}.{secrets.token_hex(8)}.tmp"
+        fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, self.images_dir / filename)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        self._known.add(filename)
+        self.images_written += 1
+        self.bytes_written += len(data)
+        return filename
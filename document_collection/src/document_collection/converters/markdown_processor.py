@@ -1,9 +1,46 @@
 """Markdown processor implementation."""
 
+import os
+import re
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from document_collection.core.interfaces import DocumentConverter
+from document_collection.core.outline import OutlineBuilder, write_outline
+
+# Size of the blocks read from the input; each block is extended to a line end
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Front matter longer than this is not treated as front matter
+MAX_FRONT_MATTER_LINES = 500
+
+# The patterns work on UTF-8 bytes, which keeps every pass in the regex engine
+# and leaves the text undecoded. Patterns that look at the start of a line
+# begin with a literal newline so the engine can skip ahead to candidates;
+# the text they run on is given a leading newline for the first line.
+_BOM = b"\xef\xbb\xbf"
+_FENCE = re.compile(rb"^ {0,3}(`{3,}|~{3,})", re.MULTILINE)
+_TRAILING_WHITESPACE = re.compile(rb"[ \t]+\n")
+_BLANK_LINES = re.compile(rb"\n{3,}")
+_ATX_HEADING = re.compile(rb"\n(#{1,6})(?:[ \t]+([^\n]*?))?(?:[ \t]+#+)?(?=\n)")
+_INDENTED_ATX_HEADING = re.compile(
+    rb"\n {1,3}(#{1,6})(?:[ \t]+([^\n]*?))?(?:[ \t]+#+)?(?=\n)"
+)
+_SETEXT_UNDERLINE = re.compile(rb"\n {0,3}(=+|-+)[ \t]*(?=\n)")
+# Lines that cannot be the text of a setext heading
+_NOT_PARAGRAPH = re.compile(
+    rb"[ \t]*(?:(?:[-*+>|#]|\d+[.)])(?:[ \t]|$)|[=-]+[ \t]*$)", re.MULTILINE
+)
+# Lines that end the paragraph above them, so a hard line break before them
+# does not render
+_PARAGRAPH_END = re.compile(
+    rb"[ \t]*$| {0,3}(?:#{1,6}(?:[ \t]|$)|(?:[-*+>]|\d+[.)])(?:[ \t]|$)|[=-]+[ \t]*$|```|~~~)",
+    re.MULTILINE,
+)
+_FRONT_MATTER_START = b"---"
+_FRONT_MATTER_END = (b"---", b"...")
 
 
 class MarkdownProcessor(DocumentConverter):
@@ -18,7 +55,284 @@ class MarkdownProcessor(DocumentConverter):
         return ["md"]
 
     async def convert(self, input_path: Path, output_path: Path, **kwargs: Any) -> Path:
-        """Process and standardize Markdown documents."""
-        # TODO: Implement Markdown processing logic
-        # Placeholder: just return output_path
-        return output_path
+        """Process and standardize Markdown documents.
+
+        The input is read in blocks of whole lines and written out block by
+        block, so memory use does not grow with the document. Line endings are
+        normalised to ``\\n``, trailing whitespace is removed except for hard
+        line breaks, runs of blank lines are collapsed, and ATX and setext
+        headings are rewritten as ``# Heading``. Fenced code blocks are copied
+        unchanged. YAML front matter is kept and its fields are reported as
+        ``front_matter`` in the ``stats`` dict when one is passed. The heading
+        outline is collected from the written blocks and saved as a sidecar.
+
+        Each block takes several passes, and the heading rewrite and outline
+        cost grows with the number of headings, so throughput is in the tens
+        of MB/s (``benchmarks/bench_markdown_processor.py`` measures it).
+
+        The output may be the input file itself; it is replaced atomically once
+        the whole document has been processed.
+        """
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+            )
+            outline = OutlineBuilder()
+            try:
+                with open(input_path, "rb") as source, os.fdopen(fd, "wb") as target:
+                    front_matter, first_block = _read_front_matter(source)
+                    if front_matter is not None:
+                        target.write(front_matter)
+                        outline.skip(len(front_matter))
+                        stats = kwargs.get("stats")
+                        if isinstance(stats, dict):
+                            stats["front_matter"] = _parse_front_matter(front_matter)
+
+                    in_fence: bytes | None = None
+                    # Blank lines before the content are dropped, or reduced
+                    # to one after the front matter
+                    leading: bytes | None = b"\n" if front_matter is not None else b""
+                    for block in _iter_blocks(source, first_block):
+                        processed, in_fence = _normalise_block(block, in_fence)
+                        if leading is not None:
+                            processed = processed.lstrip(b"\n")
+                            if not processed:
+                                continue
+                            processed = leading + processed
+                            leading = None
+                        target.write(processed)
+                        outline.feed(processed)
+                os.replace(temp_name, output_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+            write_outline(output_path, outline.finish(output_path.name))
+
+            return output_path
+
+        except Exception as e:
+            # Create error file, unless that would overwrite the input
+            if output_path.resolve() != input_path.resolve():
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.write(
+                        f"# {input_path.stem}\n\nError processing Markdown document: {str(e)}\n"
+                    )
+            return output_path
+
+
+def _read_front_matter(source: BinaryIO) -> tuple[bytes | None, bytes]:
+    """Read a leading YAML front matter block.
+
+    Returns the front matter (delimiters included) or None, together with any
+    input that was read ahead and still has to be processed as content.
+    """
+    first_line = source.readline().removeprefix(_BOM)
+    if first_line.rstrip() != _FRONT_MATTER_START:
+        return None, first_line
+
+    lines = [first_line]
+    for _ in range(MAX_FRONT_MATTER_LINES):
+        line = source.readline()
+        if not line:
+            break
+        lines.append(line)
+        if line.rstrip() in _FRONT_MATTER_END:
+            return b"".join(line.rstrip() + b"\n" for line in lines), b""
+    # No closing delimiter, so this was a thematic break and not front matter
+    return None, b"".join(lines)
+
+
+def _parse_front_matter(front_matter: bytes) -> dict[str, Any]:
+    """Parse the fields of a front matter block, ignoring malformed YAML."""
+    try:
+        import yaml
+
+        body = front_matter.split(b"\n", 1)[1].rsplit(b"\n", 2)[0]
+        fields = yaml.safe_load(body.decode("utf-8", errors="replace"))
+    except Exception:
+        return {}
+    return fields if isinstance(fields, dict) else {}
+
+
+def _iter_blocks(source: BinaryIO, first_block: bytes = b"") -> Iterator[bytes]:
+    """Yield the input in blocks of whole lines with ``\\n`` line endings.
+
+    Each block ends just before its last non-blank line, which is carried over
+    into the next block together with the line above it when it could be a
+    setext underline, so that a heading or run of blank lines is never split
+    across blocks.
+    """
+    carry = first_block
+    while True:
+        block = source.read(READ_BLOCK_SIZE)
+        if not block:
+            break
+        block = carry + block + source.readline()
+        if b"\r" in block:
+            block = block.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        content_end = len(block.rstrip(b"\n"))
+        cut = block.rfind(b"\n", 0, content_end) + 1
+        while (
+            cut > 1
+            and block[cut - 2] != 0x0A
+            and _SETEXT_UNDERLINE.match(block, cut - 1)
+        ):
+            cut = block.rfind(b"\n", 0, cut - 1) + 1
+        if cut == 0:
+            carry = block
+            continue
+        carry = block[cut:]
+        yield block[:cut]
+    if b"\r" in carry:
+        carry = carry.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if carry.strip():
+        yield carry.rstrip() + b"\n"
+
+
+def _normalise_block(
+    block: bytes, in_fence: bytes | None
+) -> tuple[bytes, bytes | None]:
+    """Normalise one block of lines, copying fenced code unchanged.
+
+    Args:
+        block: Whole lines of markdown
+        in_fence: Opening fence of a code block still open from the previous block
+
+    Returns:
+        The normalised text and the fence still open at the end of the block
+
+    """
+    if in_fence is None and b"```" not in block and b"~~~" not in block:
+        return _normalise_text(block), None
+
+    parts: list[bytes] = []
+    position = 0
+    for match in _FENCE.finditer(block):
+        fence = match.group(1)
+        line_end = block.find(b"\n", match.end())
+        line_end = len(block) if line_end == -1 else line_end + 1
+        if in_fence is None:
+            parts.append(_normalise_text(block[position : match.start()]))
+            parts.append(block[match.start() : line_end])
+            in_fence = fence
+        elif (
+            fence[0] == in_fence[0]
+            and len(fence) >= len(in_fence)
+            and not block[match.end() : line_end].strip()
+        ):
+            parts.append(block[position:line_end])
+            in_fence = None
+        else:
+            continue
+        position = line_end
+
+    remainder = block[position:]
+    parts.append(remainder if in_fence is not None else _normalise_text(remainder))
+    return b"".join(parts), in_fence
+
+
+def _normalise_text(text: bytes) -> bytes:
+    """Normalise whitespace and headings in whole lines outside code blocks."""
+    if not text:
+        return text
+    text = _strip_trailing_whitespace(text)
+    # The leading newline stands for the end of the previous line
+    text = b"\n" + text
+    if b"=\n" in text or b"-\n" in text:
+        text = _setext_to_atx(text)
+    if b"\n#" in text:
+        text = _ATX_HEADING.sub(_atx_heading, text)
+    # The literal prefix of the pattern finds candidates as fast as a
+    # containment check would
+    text = _INDENTED_ATX_HEADING.sub(_atx_heading, text)
+    return _collapse(text, b"\n\n\n", b"\n\n", _BLANK_LINES)[1:]
+
+
+def _strip_trailing_whitespace(text: bytes) -> bytes:
+    """Remove the spaces and tabs at the end of every line, keeping hard breaks.
+
+    A line of text ending in two or more spaces is a hard line break and
+    keeps exactly two, unless the paragraph ends after it. Such runs are
+    rare, so they are found with a search for two spaces before a newline and
+    handled one by one; the text between them goes through
+    ``_strip_line_ends``.
+    """
+    if b"  \n" not in text:
+        return _strip_line_ends(text)
+    parts: list[bytes] = []
+    position = 0
+    run = text.find(b"  \n")
+    while run != -1:
+        line_start = text.rfind(b"\n", 0, run) + 1
+        line_end = run + 3
+        content = text[line_start:run].rstrip(b" \t")
+        parts.append(_strip_line_ends(text[position:line_start]))
+        # The next line may be in the next block; a break kept at the end of
+        # a paragraph does not change how it renders
+        ends_paragraph = line_end < len(text) and _PARAGRAPH_END.match(text, line_end)
+        parts.append(content + (b"  \n" if content and not ends_paragraph else b"\n"))
+        position = line_end
+        run = text.find(b"  \n", position)
+    parts.append(_strip_line_ends(text[position:]))
+    return b"".join(parts)
+
+
+def _strip_line_ends(text: bytes) -> bytes:
+    """Remove the spaces and tabs at the end of every line.
+
+    Each round removes one trailing space and one trailing tab per line, and
+    most lines end in at most one. Runs still left after a few rounds fall
+    back to ``_TRAILING_WHITESPACE``.
+    """
+    # Tab-free text, the usual case, is spared the search for tabs
+    needles = (b" \n", b"\t\n") if b"\t" in text else (b" \n",)
+    for _ in range(3):
+        changed = False
+        for needle in needles:
+            if needle in text:
+                text = b"\n".join(text.split(needle))
+                changed = True
+        if not changed:
+            return text
+    return _TRAILING_WHITESPACE.sub(b"\n", text)
+
+
+def _collapse(
+    text: bytes, needle: bytes, replacement: bytes, pattern: re.Pattern[bytes]
+) -> bytes:
+    """Collapse the runs matched by ``pattern`` to ``replacement``.
+
+    Runs are usually short, so a few rounds of splitting at ``needle``, which
+    is much faster than a regex scan, remove them; longer runs fall back to
+    ``pattern``. A containment check comes first as it is several times
+    faster than a ``bytes.replace`` that finds nothing.
+    """
+    for _ in range(3):
+        if needle not in text:
+            return text
+        text = replacement.join(text.split(needle))
+    return pattern.sub(replacement, text)
+
+
+def _setext_to_atx(text: bytes) -> bytes:
+    """Rewrite setext headings (a text line underlined with = or -) as ATX headings."""
+    parts: list[bytes] = []
+    position = 0
+    for match in _SETEXT_UNDERLINE.finditer(text):
+        line_start = text.rfind(b"\n", 0, match.start()) + 1
+        title = text[line_start : match.start()].strip()
+        if line_start < position or not title or _NOT_PARAGRAPH.match(text, line_start):
+            continue
+        marker = b"#" if match.group(1)[0] == 0x3D else b"##"
+        parts.extend((text[position:line_start], marker, b" ", title))
+        position = match.end()
+    parts.append(text[position:])
+    return b"".join(parts)
+
+
+def _atx_heading(match: re.Match[bytes]) -> bytes:
+    """Rewrite an ATX heading with one space and no closing sequence."""
+    text = (match.group(2) or b"").strip()
+    return b"\n" + match.group(1) + (b" " + text if text else b"")
@@ -0,0 +1,177 @@
+"""Page-level cache for incremental PDF reconversion."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Bump when page extraction changes so stale entries are not reused
+PAGE_CACHE_VERSION = 1
+
+# Pages not seen for this long, and the oldest pages beyond this many, are
+# pruned whenever pages are stored
+PAGE_CACHE_MAX_AGE = 90 * 24 * 3600
+PAGE_CACHE_MAX_PAGES = 100_000
+
+# Keys that point back up the page tree and must not be hashed
+_SKIPPED_KEYS = frozenset({"/Parent", "/P"})
+
+
+class CachedPage(NamedTuple):
+    """Extraction results stored for one page."""
+
+    text: str
+    images: list[str]
+
+
+class PageCache:
+    """SQLite-backed store of extracted page text and image references.
+
+    Entries are keyed by a fingerprint of the page's content streams and
+    resources, so unchanged pages of a republished document are found again
+    regardless of where they moved to in the file. Every conversion stores
+    the pages it reused again, so the pages that are pruned are those no
+    recent conversion has seen.
+    """
+
+    def __init__(
+        self,
+        database_path: Path,
+        max_age: float = PAGE_CACHE_MAX_AGE,
+        max_pages: int = PAGE_CACHE_MAX_PAGES,
+    ) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            database_path: Path to the SQLite database file
+            max_age: Seconds after which a page that was not stored again is pruned
+            max_pages: Number of most recently stored pages that are kept
+
+        """
+        self.max_age = max_age
+        self.max_pages = max_pages
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(database_path), timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pdf_pages ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " images TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS pdf_pages_updated_at ON pdf_pages (updated_at)"
+        )
+
+    def get(self, fingerprint: str) -> CachedPage | None:
+        """Return the cached page for a fingerprint, if any."""
+        row = self._connection.execute(
+            "SELECT text, images FROM pdf_pages WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CachedPage(text=row[0], images=json.loads(row[1]))
+
+    def put_many(self, pages: list[tuple[str, CachedPage]]) -> None:
+        """Store extraction results for several pages and prune old ones.
+
+        Both happen in one transaction.
+        """
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pdf_pages VALUES (?, ?, ?, ?)",
+                [
+                    (fingerprint, page.text, json.dumps(page.images), now)
+                    for fingerprint, page in pages
+                ],
+            )
+            self._connection.execute(
+                "DELETE FROM pdf_pages WHERE updated_at < ?", (now - self.max_age,)
+            )
+            self._connection.execute(
+                "DELETE FROM pdf_pages WHERE fingerprint IN ("
+                " SELECT fingerprint FROM pdf_pages"
+                " ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_pages,),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def page_fingerprint(
+    page: Any, digests: dict[Any, bytes], options: dict[str, Any] | None = None
+) -> str:
+    """Return a fingerprint of a page's content streams and resources.
+
+    Args:
+        page: pypdf page object
+        digests: Digest memo shared across the pages of one document, so fonts
+            and images referenced from many pages are only hashed once
+        options: Conversion options that change the extracted page, so pages
+            converted with other options are not reused
+
+    Returns:
+        Hex digest identifying the page content
+
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"v{PAGE_CACHE_VERSION}".encode())
+    hasher.update(json.dumps(options or {}, sort_keys=True).encode())
+    for key in ("/Contents", "/Resources", "/Rotate", "/MediaBox", "/CropBox"):
+        hasher.update(key.encode())
+        value = page.get(key)
+        hasher.update(_object_digest(value, digests) if value is not None else b"-")
+    return hasher.hexdigest()
+
+
+def _object_digest(
+    obj: Any, digests: dict[Any, bytes], active: frozenset[Any] = frozenset()
+) -> bytes:
+    """Return a digest of a PDF object, following indirect references."""
+    reference = getattr(obj, "indirect_reference", None)
+    if reference is None and hasattr(obj, "idnum"):
+        # An unresolved IndirectObject
+        reference = obj
+    reference_key = (
+        (reference.idnum, reference.generation) if reference is not None else None
+    )
+    if reference_key is not None:
+        if reference_key in digests:
+            return digests[reference_key]
+        if reference_key in active:
+            # Reference cycle, the object is already being hashed further up
+            return b"cycle"
+        active = active | {reference_key}
+
+    obj = obj.get_object() if hasattr(obj, "get_object") else obj
+    hasher = hashlib.blake2b(digest_size=20)
+    if isinstance(obj, dict):
+        hasher.update(b"d")
+        for key in sorted(obj):
+            if key in _SKIPPED_KEYS:
+                continue
+            hasher.update(str(key).encode())
+            hasher.update(_object_digest(obj[key], digests, active))
+        # Stream objects keep their undecoded bytes in _data, which is also what
+        # pypdf hashes; decoding every image and font would defeat the cache
+        data = getattr(obj, "_data", None)
+        if data is not None:
+            hasher.update(b"s")
+            hasher.update(data if isinstance(data, bytes) else str(data).encode())
+    elif isinstance(obj, list):
+        hasher.update(b"a")
+        for item in obj:
+            hasher.update(_object_digest(item, digests, active))
+    else:
+        hasher.update(repr(obj).encode())
+
+    digest = hasher.digest()
+    if reference_key is not None:
+        digests[reference_key] = digest
+    return digest
@@ -1,9 +1,43 @@
 """PDF to Markdown converter implementation."""
 
+import asyncio
+import logging
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+from document_collection.converters.compaction import compact_text
+from document_collection.converters.image_store import ImageStore
+from document_collection.converters.page_cache import (
+    CachedPage,
+    PageCache,
+    page_fingerprint,
+)
+from document_collection.converters.running_lines import strip_running_lines
+from document_collection.converters.worker_pool import worker_pool
+from document_collection.converters.writer import write_markdown
 from document_collection.core.interfaces import DocumentConverter
+from document_collection.core.types import PDF_PAGE_CACHE_FILE, STATE_DIRECTORY
+
+logger = logging.getLogger(__name__)
+
+# Image filters whose stream data is already a complete image file
+PASSTHROUGH_FILTERS = {"/DCTDecode": ".jpg", "/JPXDecode": ".jp2"}
+
+# Images with at least this many pixels are decoded after the page walk,
+# in a worker pool when there is more than one of them
+LAZY_DECODE_PIXELS = 1_000_000
+
+# Raw JPEG 2000 codestreams (no JP2 container) start with SOC + SIZ markers
+_J2K_SIGNATURE = b"\xff\x4f\xff\x51"
+
+
+class _DeferredImage(NamedTuple):
+    """An image whose decoding was deferred until after the page walk."""
+
+    page_index: int
+    image_id: str | tuple[str, ...]
+    placeholder: str
 
 
 class PdfConverter(DocumentConverter):
@@ -33,69 +67,180 @@ class PdfConverter(DocumentConverter):
             content_parts = [f"# {input_path.stem}\n"]
             content_parts.append("Converted from PDF document\n")
 
-            image_counter = 1
-            extracted_images = []
-
-            # Process each page
-            for page_num, page in enumerate(reader.pages, 1):
-                # Extract text from page
-                try:
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        content_parts.append(f"\n## Page {page_num}\n\n")
-                        # Clean up text formatting
-                        cleaned_text = self._clean_text(page_text)
-                        content_parts.append(f"{cleaned_text}\n")
-                except Exception:
-                    # Continue if text extraction fails for this page
-                    content_parts.append(f"\n## Page {page_num}\n\n")
-                    content_parts.append("*Text extraction failed for this page.*\n")
+            store = ImageStore(images_dir)
+            extracted_images: list[tuple[int, str]] = []
+            deferred_images: list[_DeferredImage] = []
+            seen_images: dict[Any, str] = {}
+
+            # Pages whose content is unchanged since an earlier run are taken
+            # from the page cache instead of being extracted again
+            passthrough = kwargs.get("image_passthrough", True)
+            cache = None
+            if kwargs.get("page_cache", True):
+                cache = PageCache(
+                    output_path.parent / STATE_DIRECTORY / PDF_PAGE_CACHE_FILE
+                )
+            digests: dict[Any, bytes] = {}
+            # Raw text of each page, None where text extraction failed
+            page_sections: list[str | None] = []
+            page_texts: dict[int, str] = {}
+            fingerprints: dict[int, str] = {}
+            pages_reused = 0
 
-                # Extract images from page
-                try:
-                    if hasattr(page, 'images'):
-                        # Use a simpler approach to extract images
+            try:
+                # Process each page
+                for page_num, page in enumerate(reader.pages, 1):
+                    fingerprint = None
+                    if cache is not None:
                         try:
-                            images = list(page.images)
-                            for image_obj in images:
-                                try:
-                                    # Get image data more safely
-                                    if hasattr(image_obj, 'data'):
-                                        image_data = image_obj.data
-                                    else:
-                                        continue
-
-                                    # Create filename with page and image index
-                                    new_filename = f"{input_path.stem}_page{page_num:03d}_image_{image_counter:03d}.png"
-                                    image_path = images_dir / new_filename
-
-                                    # Save image
-                                    with open(image_path, 'wb') as img_file:
-                                        img_file.write(image_data)
-
-                                    extracted_images.append((page_num, new_filename))
-                                    image_counter += 1
-
-                                except Exception:
-                                    # Skip this image if extraction fails
-                                    continue
+                            fingerprint = page_fingerprint(
+                                page, digests, {"image_passthrough": bool(passthrough)}
+                            )
+                            cached = cache.get(fingerprint)
                         except Exception:
-                            # Skip image extraction for this page if enumeration fails
-                            pass
-                except Exception:
-                    # Continue if page image extraction fails
-                    pass
+                            cached = None
+                        if (
+                            fingerprint is not None
+                            and cached is not None
+                            and all(store.contains(name) for name in cached.images)
+                        ):
+                            pages_reused += 1
+                            page_sections.append(cached.text)
+                            extracted_images.extend(
+                                (page_num, name) for name in cached.images
+                            )
+                            # Stored again so that the page is not pruned
+                            page_texts[page_num] = cached.text
+                            fingerprints[page_num] = fingerprint
+                            continue
+
+                    # Extract text from page
+                    try:
+                        page_text = page.extract_text()
+                        page_sections.append(page_text)
+                    except Exception:
+                        # Continue if text extraction fails for this page
+                        page_sections.append(None)
+                        fingerprint = None
+
+                    # Extract images from page
+                    try:
+                        if hasattr(page, "images"):
+                            self._extract_page_images(
+                                page,
+                                page_num,
+                                store,
+                                extracted_images,
+                                deferred_images,
+                                seen_images,
+                                passthrough=passthrough,
+                            )
+                    except Exception:
+                        # Continue if page image extraction fails
+                        fingerprint = None
+
+                    # Only pages extracted without errors are cached
+                    if fingerprint is not None:
+                        page_texts[page_num] = page_text
+                        fingerprints[page_num] = fingerprint
+
+                # Decode the large images that were deferred while walking the pages
+                if deferred_images:
+                    extracted_images = await self._decode_deferred_images(
+                        reader,
+                        input_path,
+                        store,
+                        deferred_images,
+                        extracted_images,
+                        max_workers=kwargs.get("max_workers"),
+                    )
+
+                if cache is not None and fingerprints:
+                    page_images: dict[int, list[str]] = {
+                        page_num: [] for page_num in fingerprints
+                    }
+                    for page_num, filename in extracted_images:
+                        if (
+                            page_num in page_images
+                            and filename not in page_images[page_num]
+                        ):
+                            page_images[page_num].append(filename)
+                    cache.put_many(
+                        [
+                            (
+                                fingerprint,
+                                CachedPage(page_texts[page_num], page_images[page_num]),
+                            )
+                            for page_num, fingerprint in fingerprints.items()
+                        ]
+                    )
+            finally:
+                if cache is not None:
+                    cache.close()
+
+            page_count = len(reader.pages)
+            if cache is not None:
+                logger.info(
+                    "Reused %d of %d pages from the page cache for %s",
+                    pages_reused,
+                    page_count,
+                    input_path.name,
+                )
+            stats = kwargs.get("stats")
+            if isinstance(stats, dict):
+                stats["pages_total"] = page_count
+                stats["pages_reused"] = pages_reused
+
+            # Drop running headers and footers repeated across the pages
+            if kwargs.get("strip_running_lines", True):
+                extracted = [text for text in page_sections if text is not None]
+                stripped, bytes_saved = strip_running_lines(extracted)
+                stripped_texts = iter(stripped)
+                page_sections = [
+                    next(stripped_texts) if text is not None else None
+                    for text in page_sections
+                ]
+                logger.info(
+                    "Removed %d bytes of running headers and footers from %s",
+                    bytes_saved,
+                    input_path.name,
+                )
+                if isinstance(stats, dict):
+                    stats["running_lines_bytes_saved"] = bytes_saved
+
+            for page_num, section in enumerate(page_sections, 1):
+                if section is None:
+                    content_parts.append(f"\n## Page {page_num}\n\n")
+                    content_parts.append("*Text extraction failed for this page.*\n")
+                elif section.strip():
+                    content_parts.append(f"\n## Page {page_num}\n\n")
+                    # Clean up text formatting
+                    cleaned_text = self._clean_text(section)
+                    content_parts.append(f"{cleaned_text}\n")
+
+            # Reference every stored image once, from the first page it appears on
+            first_pages: dict[str, int] = {}
+            for page_num, filename in extracted_images:
+                if filename:
+                    first_pages.setdefault(filename, page_num)
+            extracted_images = [
+                (page_num, filename) for filename, page_num in first_pages.items()
+            ]
 
             # Add extracted images section
             if extracted_images:
-                content_parts.append(f"\n*This document contains {len(extracted_images)} extracted images stored in the `images/` directory.*\n")
+                content_parts.append(
+                    f"\n*This document contains {len(extracted_images)} extracted images stored in the `images/` directory.*\n"
+                )
                 content_parts.append("\n## Extracted Images\n\n")
                 for page_num, filename in extracted_images:
-                    content_parts.append(f"![Image from Page {page_num}](images/{filename})\n\n")
+                    content_parts.append(
+                        f"![Image from Page {page_num}](images/{filename})\n\n"
+                    )
 
             # Add document metadata
             content_parts.append("\n## Document Information\n\n")
-            content_parts.append(f"- **Pages**: {len(reader.pages)}\n")
+            content_parts.append(f"- **Pages**: {page_count}\n")
             if reader.metadata:
                 if reader.metadata.title:
                     content_parts.append(f"- **Title**: {reader.metadata.title}\n")
@@ -107,38 +252,237 @@ class PdfConverter(DocumentConverter):
                     content_parts.append(f"- **Creator**: {reader.metadata.creator}\n")
 
             # Write markdown content
-            markdown_content = "\n".join(content_parts)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_markdown(output_path, content_parts)
 
             return output_path
 
         except ImportError:
             # Fallback if pypdf is not available
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nPDF conversion requires pypdf library.\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nPDF conversion requires pypdf library.\n"
+                )
             return output_path
         except Exception as e:
             # Create error file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nError converting PDF document: {str(e)}\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nError converting PDF document: {str(e)}\n"
+                )
             return output_path
 
     def _clean_text(self, text: str) -> str:
         """Clean and format extracted text."""
-        # Remove excessive whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Remove multiple spaces
-                line = ' '.join(line.split())
-                cleaned_lines.append(line)
-
-        # Join lines with proper spacing
-        return '\n\n'.join(cleaned_lines)
+        return compact_text(text)
+
+    def _extract_page_images(
+        self,
+        page: Any,
+        page_num: int,
+        store: ImageStore,
+        extracted_images: list[tuple[int, str]],
+        deferred_images: list["_DeferredImage"],
+        seen_images: dict[Any, str],
+        passthrough: bool = True,
+    ) -> None:
+        """Extract the images of one page into the image store.
+
+        Each occurrence is recorded in ``extracted_images`` as ``(page, filename)``.
+        Images already seen in this document, either as the same object or with
+        identical stream data, are recognised by ``seen_images`` before anything
+        is decoded or written. JPEG and JPEG 2000 streams are stored as-is when
+        ``passthrough`` is set; large images that need decoding are recorded in
+        ``deferred_images`` under a placeholder name and decoded later.
+        """
+        try:
+            image_ids = page.images.keys()
+        except Exception:
+            # Skip image extraction for this page if enumeration fails
+            return
+
+        for image_id in image_ids:
+            try:
+                xobject = _resolve_image_xobject(page, image_id)
+                if xobject is None:
+                    # Inline images live in the content stream and are decoded there
+                    image_obj = page.images[image_id]
+                    extension = Path(image_obj.name).suffix.lower() or ".png"
+                    extracted_images.append(
+                        (page_num, store.put(image_obj.data, extension))
+                    )
+                    continue
+
+                # Logos and backgrounds are usually one shared object on every page
+                reference = xobject.indirect_reference
+                reference_key = (
+                    (reference.idnum, reference.generation)
+                    if reference is not None
+                    else None
+                )
+                if reference_key is not None and reference_key in seen_images:
+                    extracted_images.append((page_num, seen_images[reference_key]))
+                    continue
+
+                stream_data = xobject.get_data()
+                content_key = _content_key(xobject, stream_data)
+                if content_key in seen_images:
+                    filename = seen_images[content_key]
+                else:
+                    stream_extension = (
+                        _passthrough_extension(xobject) if passthrough else None
+                    )
+                    if stream_extension is not None:
+                        # The stream is already an image file, store it unchanged
+                        if stream_extension == ".jp2" and stream_data.startswith(
+                            _J2K_SIGNATURE
+                        ):
+                            stream_extension = ".j2k"
+                        filename = store.put(stream_data, stream_extension)
+                    elif _pixel_count(xobject) >= LAZY_DECODE_PIXELS:
+                        filename = f"deferred:{len(deferred_images)}"
+                        deferred_images.append(
+                            _DeferredImage(page_num - 1, _image_key(image_id), filename)
+                        )
+                    else:
+                        image_obj = page.images[image_id]
+                        extension = Path(image_obj.name).suffix.lower() or ".png"
+                        filename = store.put(image_obj.data, extension)
+                    seen_images[content_key] = filename
+
+                if reference_key is not None:
+                    seen_images[reference_key] = filename
+                extracted_images.append((page_num, filename))
+
+            except Exception:
+                # Skip this image if extraction fails
+                continue
+
+    async def _decode_deferred_images(
+        self,
+        reader: Any,
+        input_path: Path,
+        store: ImageStore,
+        deferred_images: list["_DeferredImage"],
+        extracted_images: list[tuple[int, str]],
+        max_workers: int | None = None,
+    ) -> list[tuple[int, str]]:
+        """Decode deferred images and replace their placeholders with filenames.
+
+        Images that fail to decode are dropped from the returned list.
+        """
+        jobs = [(image.page_index, image.image_id) for image in deferred_images]
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+        decoded: list[tuple[bytes, str] | None]
+        if workers < 2:
+            decoded = [
+                _decode_image(reader, page_index, image_id)
+                for page_index, image_id in jobs
+            ]
+        else:
+            chunk_size = -(-len(jobs) // workers)
+            loop = asyncio.get_running_loop()
+            pool = worker_pool()
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _decode_image_chunk,
+                        str(input_path),
+                        jobs[i : i + chunk_size],
+                    )
+                    for i in range(0, len(jobs), chunk_size)
+                )
+            )
+            decoded = [result for chunk in chunks for result in chunk]
+
+        filenames = {
+            image.placeholder: store.put(*result) if result is not None else ""
+            for image, result in zip(deferred_images, decoded, strict=True)
+        }
+        return [
+            (page_num, filenames.get(filename, filename))
+            for page_num, filename in extracted_images
+            if filenames.get(filename, filename)
+        ]
+
+
+def _image_key(image_id: Any) -> str | tuple[str, ...]:
+    """Return a hashable, picklable form of a pypdf image id."""
+    return image_id if isinstance(image_id, str) else tuple(image_id)
+
+
+def _resolve_image_xobject(page: Any, image_id: Any) -> Any:
+    """Return the image XObject for an image id, or None for inline images."""
+    if isinstance(image_id, str):
+        if image_id.startswith("~"):
+            return None
+        path = [image_id]
+    else:
+        path = list(image_id)
+
+    obj = page
+    for name in path:
+        obj = obj["/Resources"]["/XObject"][name]
+    return obj if obj.get("/Subtype") == "/Image" else None
+
+
+def _content_key(xobject: Any, stream_data: bytes) -> tuple[str, str]:
+    """Return a key identifying an image by its stream data and image parameters."""
+    parameters = "|".join(
+        str(xobject.get(key))
+        for key in (
+            "/Width",
+            "/Height",
+            "/BitsPerComponent",
+            "/ColorSpace",
+            "/Decode",
+            "/SMask",
+            "/Mask",
+        )
+    )
+    return ("content", ImageStore.digest(stream_data + parameters.encode()))
+
+
+def _passthrough_extension(xobject: Any) -> str | None:
+    """Return the file extension if the image stream can be written as-is."""
+    if any(key in xobject for key in ("/SMask", "/Mask", "/Decode")):
+        # Masks and decode arrays have to be applied by decoding
+        return None
+    filters = xobject.get("/Filter")
+    if isinstance(filters, list):
+        filters = filters[-1] if filters else None
+    return PASSTHROUGH_FILTERS.get(str(filters)) if filters is not None else None
+
+
+def _pixel_count(xobject: Any) -> int:
+    """Return the pixel count of an image XObject."""
+    try:
+        return int(xobject.get("/Width", 0)) * int(xobject.get("/Height", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _decode_image(
+    reader: Any, page_index: int, image_id: Any
+) -> tuple[bytes, str] | None:
+    """Decode one image through pypdf, returning its data and extension."""
+    try:
+        image_obj = reader.pages[page_index].images[image_id]
+        return image_obj.data, Path(image_obj.name).suffix.lower() or ".png"
+    except Exception:
+        return None
+
+
+def _decode_image_chunk(
+    input_path: str, jobs: list[tuple[int, Any]]
+) -> list[tuple[bytes, str] | None]:
+    """Decode a chunk of images in a worker process with its own reader."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(input_path)
+    return [
+        _decode_image(reader, page_index, image_id) for page_index, image_id in jobs
+    ]
@@ -1,11 +1,26 @@
 """PowerPoint to Markdown converter implementation."""
 
+import asyncio
+import os
+import posixpath
 import zipfile
 from pathlib import Path
 from typing import Any
 
+from document_collection.converters.image_store import ImageStore
+from document_collection.converters.worker_pool import worker_pool
+from document_collection.converters.writer import write_markdown
 from document_collection.core.interfaces import DocumentConverter
 
+# PresentationML, DrawingML and relationship namespaces
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PR = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Decks with at least this many slides are converted in parallel chunks
+PARALLEL_SLIDE_THRESHOLD = 64
+
 
 class PowerPointConverter(DocumentConverter):
     """Convert PowerPoint documents to Markdown format with image extraction."""
@@ -19,153 +34,350 @@ class PowerPointConverter(DocumentConverter):
         return ["pptx"]
 
     async def convert(self, input_path: Path, output_path: Path, **kwargs: Any) -> Path:
-        """Convert PowerPoint document to Markdown using python-pptx with image extraction."""
+        """Convert PowerPoint document to Markdown with image extraction.
+
+        By default slides and their notes are parsed directly from the package
+        XML with lxml, descending into group shapes; decks with at least
+        ``parallel_threshold`` slides are converted in parallel chunks. Pass
+        ``fast_path=False`` to use the python-pptx object model instead.
+        """
         try:
-            from pptx import Presentation
+            slide_parts: list[str] | None = None
+            if kwargs.get("fast_path", True):
+                try:
+                    slide_parts = await self._read_slides_streaming(
+                        input_path,
+                        parallel_threshold=kwargs.get(
+                            "parallel_threshold", PARALLEL_SLIDE_THRESHOLD
+                        ),
+                        max_workers=kwargs.get("max_workers"),
+                    )
+                except ImportError:
+                    # lxml is not available, use python-pptx below
+                    slide_parts = None
 
-            # Read PowerPoint presentation
-            prs = Presentation(str(input_path))
+            if slide_parts is None:
+                slide_parts = self._read_slides_pptx(input_path)
 
             # Create images directory
             images_dir = output_path.parent / "images"
             images_dir.mkdir(parents=True, exist_ok=True)
-
-            # Extract embedded images from the presentation's media folder
-            image_counter = 1
-            image_mapping = {}  # Map original image names to new filenames
-
-            try:
-                # Access the presentation as a zip file to extract images
-                with zipfile.ZipFile(str(input_path), 'r') as pptx_zip:
-                    # Look for images in the media directory
-                    for file_info in pptx_zip.filelist:
-                        if file_info.filename.startswith('ppt/media/'):
-                            # Extract image
-                            image_data = pptx_zip.read(file_info.filename)
-
-                            # Determine file extension
-                            original_name = Path(file_info.filename).name
-                            file_ext = Path(file_info.filename).suffix.lower()
-                            if not file_ext:
-                                file_ext = '.png'  # Default
-
-                            # Create new filename
-                            new_filename = f"{input_path.stem}_image_{image_counter:03d}{file_ext}"
-                            image_path = images_dir / new_filename
-
-                            # Save image
-                            with open(image_path, 'wb') as img_file:
-                                img_file.write(image_data)
-
-                            # Map original to new filename
-                            image_mapping[original_name] = new_filename
-                            image_counter += 1
-
-            except Exception:
-                # Continue if image extraction fails
-                pass
+            image_mapping = self._extract_images(input_path, images_dir)
+            image_files = list(dict.fromkeys(image_mapping.values()))
 
             # Convert presentation content to markdown
             content_parts = [f"# {input_path.stem}\n"]
             content_parts.append("Converted from PowerPoint presentation\n")
 
-            if image_counter > 1:
-                content_parts.append(f"*This presentation contains {image_counter - 1} extracted images stored in the `images/` directory.*\n")
-
-            # Process slides
-            for slide_num, slide in enumerate(prs.slides, 1):
-                content_parts.append(f"\n## Slide {slide_num}\n")
-
-                # Extract text from shapes
-                for shape in slide.shapes:
-                    try:
-                        # Try to get text from text_frame first
-                        text_frame = getattr(shape, 'text_frame', None)
-                        if text_frame:
-                            text = getattr(text_frame, 'text', '').strip()
-                            if text:
-                                # Add text with some basic formatting
-                                if len(text) < 100 and '\n' not in text:
-                                    # Likely a title or header
-                                    content_parts.append(f"### {text}\n")
-                                else:
-                                    # Body text
-                                    content_parts.append(f"{text}\n")
-                        else:
-                            # Fallback to direct text attribute
-                            text = getattr(shape, 'text', '').strip()
-                            if text:
-                                # Add text with some basic formatting
-                                if len(text) < 100 and '\n' not in text:
-                                    # Likely a title or header
-                                    content_parts.append(f"### {text}\n")
-                                else:
-                                    # Body text
-                                    content_parts.append(f"{text}\n")
-                    except Exception:
-                        # Skip shapes that don't have text
-                        pass
-
-                    # Check for tables in shape
-                    try:
-                        table = getattr(shape, 'table', None)
-                        if table:
-                            content_parts.append("\n")
-                            for i, row in enumerate(table.rows):
-                                row_cells = [getattr(cell, 'text', '').strip() for cell in row.cells]
-                                content_parts.append("| " + " | ".join(row_cells) + " |\n")
-
-                                # Add header separator for first row
-                                if i == 0:
-                                    content_parts.append("| " + " | ".join(["---"] * len(row_cells)) + " |\n")
-                            content_parts.append("\n")
-                    except Exception:
-                        # Skip if table extraction fails
-                        pass
-
-                # Add notes if present
-                notes_slide = getattr(slide, 'notes_slide', None)
-                if notes_slide:
-                    notes_text = ""
-                    try:
-                        for shape in notes_slide.shapes:
-                            try:
-                                text_frame = getattr(shape, 'text_frame', None)
-                                if text_frame:
-                                    notes_text += getattr(text_frame, 'text', '').strip() + " "
-                                else:
-                                    notes_text += getattr(shape, 'text', '').strip() + " "
-                            except Exception:
-                                continue
-                        if notes_text.strip():
-                            content_parts.append(f"\n**Speaker Notes:** {notes_text.strip()}\n")
-                    except Exception:
-                        # Skip notes if extraction fails
-                        pass
+            if image_files:
+                content_parts.append(
+                    f"*This presentation contains {len(image_files)} extracted images stored in the `images/` directory.*\n"
+                )
+
+            content_parts.extend(slide_parts)
 
             # Add image references for any images found
-            if image_mapping:
+            if image_files:
                 content_parts.append("\n## Extracted Images\n\n")
-                for i, (_original, new_filename) in enumerate(image_mapping.items(), 1):
-                    content_parts.append(f"![Image {i}](images/{new_filename})\n\n")
+                for i, filename in enumerate(image_files, 1):
+                    content_parts.append(f"![Image {i}](images/{filename})\n\n")
 
             # Write markdown content
-            markdown_content = "\n".join(content_parts)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_markdown(output_path, content_parts)
 
             return output_path
 
         except ImportError:
             # Fallback if python-pptx is not available
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nPowerPoint conversion requires python-pptx library.\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nPowerPoint conversion requires python-pptx library.\n"
+                )
             return output_path
         except Exception as e:
             # Create error file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nError converting PowerPoint document: {str(e)}\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nError converting PowerPoint document: {str(e)}\n"
+                )
             return output_path
+
+    def _extract_images(self, input_path: Path, images_dir: Path) -> dict[str, str]:
+        """Extract embedded images from the presentation's media folder into the image store."""
+        store = ImageStore(images_dir)
+        image_mapping: dict[str, str] = {}  # Map original image names to stored blobs
+
+        try:
+            # Access the presentation as a zip file to extract images
+            with zipfile.ZipFile(str(input_path), "r") as pptx_zip:
+                # Look for images in the media directory
+                for file_info in pptx_zip.filelist:
+                    if file_info.filename.startswith("ppt/media/"):
+                        # Extract image
+                        image_data = pptx_zip.read(file_info.filename)
+
+                        # Determine file extension
+                        original_name = Path(file_info.filename).name
+                        file_ext = Path(file_info.filename).suffix.lower()
+                        if not file_ext:
+                            file_ext = ".png"  # Default
+
+                        # Store the image once under its content hash
+                        image_mapping[original_name] = store.put(image_data, file_ext)
+
+        except Exception:
+            # Continue if image extraction fails
+            pass
+
+        return image_mapping
+
+    def _read_slides_pptx(self, input_path: Path) -> list[str]:
+        """Convert slides using the python-pptx object model."""
+        from pptx import Presentation
+
+        prs = Presentation(str(input_path))
+        content_parts: list[str] = []
+
+        # Process slides
+        for slide_num, slide in enumerate(prs.slides, 1):
+            content_parts.append(f"\n## Slide {slide_num}\n")
+
+            # Extract text from shapes
+            for shape in slide.shapes:
+                try:
+                    # Try to get text from text_frame first
+                    text_frame = getattr(shape, "text_frame", None)
+                    if text_frame:
+                        text = getattr(text_frame, "text", "").strip()
+                    else:
+                        # Fallback to direct text attribute
+                        text = getattr(shape, "text", "").strip()
+                    if text:
+                        content_parts.append(_format_shape_text(text))
+                except Exception:
+                    # Skip shapes that don't have text
+                    pass
+
+                # Check for tables in shape
+                try:
+                    table = getattr(shape, "table", None)
+                    if table:
+                        rows = [
+                            [getattr(cell, "text", "").strip() for cell in row.cells]
+                            for row in table.rows
+                        ]
+                        content_parts.extend(_format_table(rows))
+                except Exception:
+                    # Skip if table extraction fails
+                    pass
+
+            # Add notes if present
+            notes_slide = getattr(slide, "notes_slide", None)
+            if notes_slide:
+                notes_text = ""
+                try:
+                    for shape in notes_slide.shapes:
+                        try:
+                            text_frame = getattr(shape, "text_frame", None)
+                            if text_frame:
+                                notes_text += (
+                                    getattr(text_frame, "text", "").strip() + " "
+                                )
+                            else:
+                                notes_text += getattr(shape, "text", "").strip() + " "
+                        except Exception:
+                            continue
+                    if notes_text.strip():
+                        content_parts.append(
+                            f"\n**Speaker Notes:** {notes_text.strip()}\n"
+                        )
+                except Exception:
+                    # Skip notes if extraction fails
+                    pass
+
+        return content_parts
+
+    async def _read_slides_streaming(
+        self,
+        input_path: Path,
+        parallel_threshold: int = PARALLEL_SLIDE_THRESHOLD,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Convert slides by parsing the slide and notes XML parts directly.
+
+        Notes are only read when a slide actually links a notes part, so no
+        notes slides are created. Large decks are split into contiguous chunks
+        that are converted in the shared worker processes.
+        """
+        import lxml  # noqa: F401  # fail early so the python-pptx path is used
+
+        with zipfile.ZipFile(str(input_path), "r") as pptx_zip:
+            slide_refs = _list_slides(pptx_zip)
+
+        workers = max_workers or os.cpu_count() or 1
+        if len(slide_refs) < parallel_threshold or workers < 2:
+            chunks = [_convert_slide_chunk(str(input_path), slide_refs)]
+        else:
+            chunk_size = -(-len(slide_refs) // workers)
+            loop = asyncio.get_running_loop()
+            pool = worker_pool()
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _convert_slide_chunk,
+                        str(input_path),
+                        slide_refs[i : i + chunk_size],
+                    )
+                    for i in range(0, len(slide_refs), chunk_size)
+                )
+            )
+
+        return [part for chunk in chunks for part in chunk]
+
+
+def _format_shape_text(text: str) -> str:
+    """Format shape text as a markdown heading or body text."""
+    # Add text with some basic formatting
+    if len(text) < 100 and "\n" not in text:
+        # Likely a title or header
+        return f"### {text}\n"
+    # Body text
+    return f"{text}\n"
+
+
+def _format_table(rows: list[list[str]]) -> list[str]:
+    """Format table rows as a markdown table."""
+    content_parts = ["\n"]
+    for i, row_cells in enumerate(rows):
+        content_parts.append("| " + " | ".join(row_cells) + " |\n")
+
+        # Add header separator for first row
+        if i == 0:
+            content_parts.append("| " + " | ".join(["---"] * len(row_cells)) + " |\n")
+    content_parts.append("\n")
+    return content_parts
+
+
+def _read_relationships(
+    pptx_zip: zipfile.ZipFile, part_name: str
+) -> dict[str, tuple[str, str]]:
+    """Return ``rId -> (type, absolute target)`` for the given package part."""
+    from lxml import etree
+
+    folder, filename = posixpath.split(part_name)
+    rels_name = posixpath.join(folder, "_rels", f"{filename}.rels")
+    try:
+        rels_root = etree.fromstring(pptx_zip.read(rels_name))
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for rel in rels_root.iterfind(f"{_PR}Relationship"):
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join(folder, target))
+        relationships[rel.get("Id", "")] = (rel.get("Type", ""), target)
+    return relationships
+
+
+def _list_slides(pptx_zip: zipfile.ZipFile) -> list[tuple[int, str, str | None]]:
+    """Return ``(slide number, slide part, notes part)`` in presentation order."""
+    from lxml import etree
+
+    presentation = etree.fromstring(pptx_zip.read("ppt/presentation.xml"))
+    relationships = _read_relationships(pptx_zip, "ppt/presentation.xml")
+
+    slides = []
+    for slide_num, slide_id in enumerate(
+        presentation.iterfind(f"{_P}sldIdLst/{_P}sldId"), 1
+    ):
+        _rel_type, slide_part = relationships[slide_id.get(f"{_R}id", "")]
+        notes_part = None
+        for rel_type, target in _read_relationships(pptx_zip, slide_part).values():
+            if rel_type.endswith("/notesSlide"):
+                notes_part = target
+                break
+        slides.append((slide_num, slide_part, notes_part))
+    return slides
+
+
+def _convert_slide_chunk(
+    input_path: str, slides: list[tuple[int, str, str | None]]
+) -> list[str]:
+    """Convert a contiguous run of slides to markdown parts.
+
+    Runs in worker processes for large decks, so it opens the package itself.
+    """
+    from lxml import etree
+
+    content_parts: list[str] = []
+    with zipfile.ZipFile(input_path, "r") as pptx_zip:
+        for slide_num, slide_part, notes_part in slides:
+            content_parts.append(f"\n## Slide {slide_num}\n")
+
+            slide_root = etree.fromstring(pptx_zip.read(slide_part))
+            sp_tree = slide_root.find(f"{_P}cSld/{_P}spTree")
+            if sp_tree is not None:
+                _append_shape_tree(sp_tree, content_parts)
+
+            if notes_part is not None:
+                notes_root = etree.fromstring(pptx_zip.read(notes_part))
+                notes_text = " ".join(
+                    text
+                    for shape in notes_root.iterfind(f"{_P}cSld/{_P}spTree/{_P}sp")
+                    if _placeholder_type(shape) == "body"
+                    and (text := _text_body(shape).strip())
+                )
+                if notes_text:
+                    content_parts.append(f"\n**Speaker Notes:** {notes_text}\n")
+    return content_parts
+
+
+def _append_shape_tree(tree: Any, content_parts: list[str]) -> None:
+    """Append text and tables of the shapes in a shape tree, including groups."""
+    for shape in tree:
+        if shape.tag == f"{_P}sp":
+            text = _text_body(shape).strip()
+            if text:
+                content_parts.append(_format_shape_text(text))
+        elif shape.tag == f"{_P}grpSp":
+            _append_shape_tree(shape, content_parts)
+        elif shape.tag == f"{_P}graphicFrame":
+            table = shape.find(f"{_A}graphic/{_A}graphicData/{_A}tbl")
+            if table is not None:
+                rows = [
+                    [_text_body(tc).strip() for tc in tr.iterchildren(f"{_A}tc")]
+                    for tr in table.iterchildren(f"{_A}tr")
+                ]
+                content_parts.extend(_format_table(rows))
+
+
+def _placeholder_type(shape: Any) -> str | None:
+    """Return the placeholder type of a shape, if it is a placeholder."""
+    placeholder = shape.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+    if placeholder is None:
+        return None
+    return str(placeholder.get("type", "body"))
+
+
+def _text_body(element: Any) -> str:
+    """Return the text of the ``txBody`` of a shape or table cell."""
+    text_body = element.find(f"{_P}txBody")
+    if text_body is None:
+        text_body = element.find(f"{_A}txBody")
+    if text_body is None:
+        return ""
+
+    paragraphs = []
+    for paragraph in text_body.iterchildren(f"{_A}p"):
+        pieces = []
+        for child in paragraph:
+            if child.tag in (f"{_A}r", f"{_A}fld"):
+                pieces.append(child.findtext(f"{_A}t") or "")
+            elif child.tag == f"{_A}br":
+                pieces.append("\n")
+        paragraphs.append("".join(pieces))
+    return "\n".join(paragraphs)
@@ -0,0 +1,117 @@
+"""Detection and removal of running headers and footers in paged text."""
+
+import math
+import re
+from collections import Counter
+
+# Number of lines at the top and at the bottom of a page checked for running text
+EDGE_LINES = 2
+
+# A line is running text when it repeats at the same position on this share of pages
+RUNNING_LINE_RATIO = 0.6
+
+# Documents with fewer pages than this are left unchanged
+RUNNING_LINE_MIN_PAGES = 3
+
+# Longest line, in characters, that can be a footer ending in a page number
+PAGE_NUMBER_LINE_LENGTH = 40
+
+_DIGITS = re.compile(r"\d+")
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_NUMBER = re.compile(r"(?:^|\s)(\d+)$")
+
+
+def strip_running_lines(
+    pages: list[str],
+    edge_lines: int = EDGE_LINES,
+    ratio: float = RUNNING_LINE_RATIO,
+    min_pages: int = RUNNING_LINE_MIN_PAGES,
+) -> tuple[list[str], int]:
+    """Remove headers and footers that repeat at the same position across pages.
+
+    Each of the first and last ``edge_lines`` non-blank lines of a page is
+    normalised (digits collapsed, whitespace squeezed) and counted by its
+    position in a hashed frequency index. Lines whose normalised form occurs
+    at the same position on at least ``ratio`` of the pages are removed. A
+    position where most pages hold a short line ending in the page number,
+    such as a footer that names the current chapter, is treated as a
+    page-number slot, and the short lines there whose number advances with
+    the page are removed too. Body text ending in a number, such as a year,
+    does not advance with the page and is kept. Both passes are linear in the
+    size of the text.
+
+    Args:
+        pages: Extracted text of each page
+        edge_lines: Number of lines checked at the top and bottom of each page
+        ratio: Share of pages a line has to repeat on
+        min_pages: Minimum number of pages before anything is removed
+
+    Returns:
+        The page texts without running lines and the number of bytes removed
+
+    """
+    if len(pages) < min_pages:
+        return pages, 0
+
+    threshold = max(min_pages, math.ceil(ratio * len(pages)))
+    page_lines = [page.split("\n") for page in pages]
+
+    line_counts: Counter[tuple[int, int]] = Counter()
+    number_slots: Counter[tuple[int, int]] = Counter()
+    page_keys: list[list[tuple[int, int, int, int | None]]] = []
+    for page_index, lines in enumerate(page_lines):
+        keys = []
+        for position, index in _edge_positions(lines, edge_lines):
+            squeezed = _WHITESPACE.sub(" ", lines[index]).strip()
+            line_hash = hash(_DIGITS.sub("#", squeezed))
+            number = _page_number(squeezed)
+            # Page numbers keep a constant offset from the index of the page
+            offset = None if number is None else number - page_index
+            line_counts[position, line_hash] += 1
+            if offset is not None:
+                number_slots[position, offset] += 1
+            keys.append((position, index, line_hash, offset))
+        page_keys.append(keys)
+
+    bytes_saved = 0
+    stripped_pages = []
+    for lines, keys in zip(page_lines, page_keys, strict=True):
+        removed = {
+            index
+            for position, index, line_hash, offset in keys
+            if line_counts[position, line_hash] >= threshold
+            or (offset is not None and number_slots[position, offset] >= threshold)
+        }
+        if not removed:
+            stripped_pages.append("\n".join(lines))
+            continue
+        bytes_saved += sum(len(lines[index].encode("utf-8")) + 1 for index in removed)
+        stripped_pages.append(
+            "\n".join(line for index, line in enumerate(lines) if index not in removed)
+        )
+
+    return stripped_pages, bytes_saved
+
+
+def _page_number(line: str) -> int | None:
+    """Return the number a short line ends in, None for other lines."""
+    if len(line) > PAGE_NUMBER_LINE_LENGTH:
+        return None
+    match = _TRAILING_NUMBER.search(line)
+    return int(match.group(1)) if match else None
+
+
+def _edge_positions(lines: list[str], edge_lines: int) -> list[tuple[int, int]]:
+    """Return ``(position, line index)`` for the non-blank lines at the page edges.
+
+    Positions count from 0 downwards at the top and from -1 upwards at the
+    bottom, so a footer keeps its position however long the page is.
+    """
+    indexes = [index for index, line in enumerate(lines) if line.strip()]
+    top = [(position, index) for position, index in enumerate(indexes[:edge_lines])]
+    bottom_indexes = indexes[max(edge_lines, len(indexes) - edge_lines) :]
+    bottom = [
+        (position - len(bottom_indexes), index)
+        for position, index in enumerate(bottom_indexes)
+    ]
+    return top + bottom
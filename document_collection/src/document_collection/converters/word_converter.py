@@ -1,11 +1,28 @@
 """Word to Markdown converter implementation."""
 
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from document_collection.converters.image_store import ImageStore
+from document_collection.converters.writer import write_markdown
 from document_collection.core.interfaces import DocumentConverter
 
+# WordprocessingML namespace used by document.xml and styles.xml
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W = f"{{{W_NS}}}"
+
+# Elements whose text contributes to a run, mirroring python-docx ``Run.text``
+_RUN_TEXT: dict[str, str | None] = {
+    f"{_W}t": None,
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}br": "\n",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
 
 class WordConverter(DocumentConverter):
     """Convert Word documents to Markdown format with image extraction."""
@@ -19,107 +36,283 @@ class WordConverter(DocumentConverter):
         return ["docx"]
 
     async def convert(self, input_path: Path, output_path: Path, **kwargs: Any) -> Path:
-        """Convert Word document to Markdown using python-docx with image extraction."""
+        """Convert Word document to Markdown with image extraction.
+
+        By default the document body is streamed straight from ``word/document.xml``
+        with lxml, which keeps paragraphs and tables in document order. Pass
+        ``fast_path=False`` to use the python-docx object model instead.
+        """
         try:
-            from docx import Document
+            body_parts: list[str] | None = None
+            if kwargs.get("fast_path", True):
+                try:
+                    body_parts = list(self._iter_body_streaming(input_path))
+                except ImportError:
+                    # lxml is not available, use python-docx below
+                    body_parts = None
 
-            # Read Word document
-            doc = Document(str(input_path))
+            if body_parts is None:
+                body_parts = self._read_body_docx(input_path)
 
             # Create images directory
             images_dir = output_path.parent / "images"
             images_dir.mkdir(parents=True, exist_ok=True)
-
-            # Extract embedded images from the document's media folder
-            image_counter = 1
-            image_mapping = {}  # Map original image names to new filenames
-
-            try:
-                # Access the document as a zip file to extract images
-                with zipfile.ZipFile(str(input_path), 'r') as docx_zip:
-                    # Look for images in the media directory
-                    for file_info in docx_zip.filelist:
-                        if file_info.filename.startswith('word/media/'):
-                            # Extract image
-                            image_data = docx_zip.read(file_info.filename)
-
-                            # Determine file extension
-                            original_name = Path(file_info.filename).name
-                            file_ext = Path(file_info.filename).suffix.lower()
-                            if not file_ext:
-                                file_ext = '.png'  # Default
-
-                            # Create new filename
-                            new_filename = f"{input_path.stem}_image_{image_counter:03d}{file_ext}"
-                            image_path = images_dir / new_filename
-
-                            # Save image
-                            with open(image_path, 'wb') as img_file:
-                                img_file.write(image_data)
-
-                            # Map original to new filename
-                            image_mapping[original_name] = new_filename
-                            image_counter += 1
-
-            except Exception:
-                # Continue if image extraction fails
-                pass
+            image_mapping = self._extract_images(input_path, images_dir)
+            image_files = list(dict.fromkeys(image_mapping.values()))
 
             # Convert document content to markdown
             content_parts = [f"# {input_path.stem}\n"]
             content_parts.append("Converted from Word document\n")
 
-            if image_counter > 1:
-                content_parts.append(f"*This document contains {image_counter - 1} extracted images stored in the `images/` directory.*\n")
-
-            # Process paragraphs
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    # Basic formatting detection with null check
-                    style_name = getattr(paragraph.style, 'name', None) if paragraph.style else None
-                    if style_name and style_name.startswith('Heading'):
-                        level = int(style_name.split()[-1]) if style_name.split()[-1].isdigit() else 1
-                        content_parts.append(f"{'#' * min(level + 1, 6)} {text}\n")
-                    else:
-                        content_parts.append(f"{text}\n")
-
-            # Process tables
-            for table in doc.tables:
-                content_parts.append("\n")
-                # Create markdown table
-                for i, row in enumerate(table.rows):
-                    row_cells = [cell.text.strip() for cell in row.cells]
-                    content_parts.append("| " + " | ".join(row_cells) + " |\n")
+            if image_files:
+                content_parts.append(
+                    f"*This document contains {len(image_files)} extracted images stored in the `images/` directory.*\n"
+                )
 
-                    # Add header separator for first row
-                    if i == 0:
-                        content_parts.append("| " + " | ".join(["---"] * len(row_cells)) + " |\n")
-                content_parts.append("\n")
+            content_parts.extend(body_parts)
 
             # Add image references for any images found
-            if image_mapping:
+            if image_files:
                 content_parts.append("\n## Extracted Images\n\n")
-                for i, (_original, new_filename) in enumerate(image_mapping.items(), 1):
-                    content_parts.append(f"![Image {i}](images/{new_filename})\n\n")
+                for i, filename in enumerate(image_files, 1):
+                    content_parts.append(f"![Image {i}](images/{filename})\n\n")
 
             # Write markdown content
-            markdown_content = "\n".join(content_parts)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_markdown(output_path, content_parts)
 
             return output_path
 
         except ImportError:
             # Fallback if python-docx is not available
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nWord conversion requires python-docx library.\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nWord conversion requires python-docx library.\n"
+                )
             return output_path
         except Exception as e:
             # Create error file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {input_path.stem}\n\nError converting Word document: {str(e)}\n")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(
+                    f"# {input_path.stem}\n\nError converting Word document: {str(e)}\n"
+                )
             return output_path
+
+    def _extract_images(self, input_path: Path, images_dir: Path) -> dict[str, str]:
+        """Extract embedded images from the document's media folder into the image store."""
+        store = ImageStore(images_dir)
+        image_mapping: dict[str, str] = {}  # Map original image names to stored blobs
+
+        try:
+            # Access the document as a zip file to extract images
+            with zipfile.ZipFile(str(input_path), "r") as docx_zip:
+                # Look for images in the media directory
+                for file_info in docx_zip.filelist:
+                    if file_info.filename.startswith("word/media/"):
+                        # Extract image
+                        image_data = docx_zip.read(file_info.filename)
+
+                        # Determine file extension
+                        original_name = Path(file_info.filename).name
+                        file_ext = Path(file_info.filename).suffix.lower()
+                        if not file_ext:
+                            file_ext = ".png"  # Default
+
+                        # Store the image once under its content hash
+                        image_mapping[original_name] = store.put(image_data, file_ext)
+
+        except Exception:
+            # Continue if image extraction fails
+            pass
+
+        return image_mapping
+
+    def _read_body_docx(self, input_path: Path) -> list[str]:
+        """Convert the document body using the python-docx object model."""
+        from docx import Document
+
+        doc = Document(str(input_path))
+        content_parts: list[str] = []
+
+        # Process paragraphs
+        for paragraph in doc.paragraphs:
+            text = paragraph.text.strip()
+            if text:
+                # Basic formatting detection with null check
+                style_name = (
+                    getattr(paragraph.style, "name", None) if paragraph.style else None
+                )
+                content_parts.append(
+                    _format_paragraph(text, _heading_level(style_name))
+                )
+
+        # Process tables
+        for table in doc.tables:
+            rows = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+            content_parts.extend(_format_table(rows))
+
+        return content_parts
+
+    def _iter_body_streaming(self, input_path: Path) -> Iterator[str]:
+        """Stream the document body from ``word/document.xml`` in document order.
+
+        Styles are resolved once from ``styles.xml`` into a style-id to heading
+        level map, and each body element is cleared as soon as it is emitted so
+        memory stays flat on very large documents.
+        """
+        from lxml import etree
+
+        with zipfile.ZipFile(str(input_path), "r") as docx_zip:
+            heading_levels, default_style = _load_heading_levels(docx_zip)
+
+            body_tag = f"{_W}body"
+            with docx_zip.open("word/document.xml") as document_xml:
+                for _event, element in etree.iterparse(
+                    document_xml, events=("end",), tag=(f"{_W}p", f"{_W}tbl")
+                ):
+                    parent = element.getparent()
+                    if parent is None or parent.tag != body_tag:
+                        # Nested paragraphs are handled with their table
+                        continue
+
+                    if element.tag == f"{_W}p":
+                        text = _paragraph_text(element).strip()
+                        if text:
+                            p_style = element.find(f"{_W}pPr/{_W}pStyle")
+                            style_id = (
+                                p_style.get(f"{_W}val")
+                                if p_style is not None
+                                else default_style
+                            )
+                            yield _format_paragraph(
+                                text, heading_levels.get(style_id or "")
+                            )
+                    else:
+                        yield from _format_table(_table_rows(element))
+
+                    # Release the processed element and everything before it
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+
+def _heading_level(style_name: str | None) -> int | None:
+    """Return the heading level for a style name, or None for body text."""
+    if style_name and style_name.startswith("Heading"):
+        last = style_name.split()[-1]
+        return int(last) if last.isdigit() else 1
+    return None
+
+
+def _format_paragraph(text: str, level: int | None) -> str:
+    """Format a paragraph as a markdown heading or body line."""
+    if level is not None:
+        return f"{'#' * min(level + 1, 6)} {text}\n"
+    return f"{text}\n"
+
+
+def _format_table(rows: list[list[str]]) -> list[str]:
+    """Format table rows as a markdown table."""
+    content_parts = ["\n"]
+    for i, row_cells in enumerate(rows):
+        content_parts.append("| " + " | ".join(row_cells) + " |\n")
+
+        # Add header separator for first row
+        if i == 0:
+            content_parts.append("| " + " | ".join(["---"] * len(row_cells)) + " |\n")
+    content_parts.append("\n")
+    return content_parts
+
+
+def _load_heading_levels(
+    docx_zip: zipfile.ZipFile,
+) -> tuple[dict[str, int], str | None]:
+    """Precompute a style-id to heading-level map from ``styles.xml``.
+
+    Returns the map together with the id of the default paragraph style.
+    """
+    from lxml import etree
+
+    try:
+        styles_root = etree.fromstring(docx_zip.read("word/styles.xml"))
+    except KeyError:
+        return {}, None
+
+    levels: dict[str, int] = {}
+    default_style = None
+    for style in styles_root.iterfind(f"{_W}style"):
+        if style.get(f"{_W}type") != "paragraph":
+            continue
+        style_id = style.get(f"{_W}styleId")
+        if style_id is None:
+            continue
+        if style.get(f"{_W}default") in ("1", "true", "on"):
+            default_style = style_id
+        name = style.find(f"{_W}name")
+        style_name = name.get(f"{_W}val") if name is not None else None
+        if style_name:
+            # Built-in names are stored lowercase; python-docx shows them capitalised
+            parts = style_name.split()
+            if len(parts) == 2 and parts[0] == "heading" and parts[1].isdigit():
+                style_name = f"Heading {parts[1]}"
+        level = _heading_level(style_name)
+        if level is not None:
+            levels[style_id] = level
+    return levels, default_style
+
+
+def _paragraph_text(paragraph: Any) -> str:
+    """Return the text of a ``w:p`` element the way python-docx reports it."""
+    pieces: list[str] = []
+    for child in paragraph:
+        if child.tag == f"{_W}r":
+            _append_run_text(child, pieces)
+        elif child.tag == f"{_W}hyperlink":
+            for run in child.iterchildren(f"{_W}r"):
+                _append_run_text(run, pieces)
+    return "".join(pieces)
+
+
+def _append_run_text(run: Any, pieces: list[str]) -> None:
+    """Append the text content of a ``w:r`` element."""
+    for child in run:
+        if child.tag in _RUN_TEXT:
+            replacement = _RUN_TEXT[child.tag]
+            if replacement is None:
+                replacement = child.text or ""
+            pieces.append(replacement)
+
+
+def _table_rows(table: Any) -> list[list[str]]:
+    """Return the cell texts of a ``w:tbl`` element, expanding merged cells."""
+    rows: list[list[str]] = []
+    previous: list[str] = []
+    for tr in table.iterchildren(f"{_W}tr"):
+        row: list[str] = []
+        for tc in tr.iterchildren(f"{_W}tc"):
+            tc_pr = tc.find(f"{_W}tcPr")
+            span = 1
+            continued = False
+            if tc_pr is not None:
+                grid_span = tc_pr.find(f"{_W}gridSpan")
+                if grid_span is not None:
+                    span = int(grid_span.get(f"{_W}val", "1"))
+                v_merge = tc_pr.find(f"{_W}vMerge")
+                if (
+                    v_merge is not None
+                    and v_merge.get(f"{_W}val", "continue") == "continue"
+                ):
+                    continued = True
+
+            if continued and len(previous) > len(row):
+                # Vertically merged cells repeat the text of the cell above
+                text = previous[len(row)]
+            else:
+                text = "\n".join(
+                    _paragraph_text(p) for p in tc.iterchildren(f"{_W}p")
+                ).strip()
+            row.extend([text] * span)
+        rows.append(row)
+        previous = row
+    return rows
@@ -0,0 +1,42 @@
+"""Process pool shared by the converters for CPU-bound work."""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def worker_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it on first use.
+
+    Workers are started by a fork server (or spawned where there is none)
+    rather than forked from the caller: the MCP server and the daemon convert
+    in threads, and a forked worker can inherit a lock another thread holds
+    and wait on it forever. Starting them once, rather than per conversion,
+    keeps that start-up cost off every document.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _pool
+
+
+def shutdown_worker_pool() -> None:
+    """Stop the shared worker pool; the next conversion starts a new one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
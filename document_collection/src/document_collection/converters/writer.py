@@ -0,0 +1,32 @@
+"""Writing converted Markdown together with its heading outline."""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from document_collection.core.outline import OutlineBuilder, write_outline
+
+
+def write_markdown(output_path: Path, content_parts: Iterable[str]) -> Path:
+    """Write Markdown parts joined by newlines and its outline sidecar.
+
+    The outline is collected from the bytes as they are written, so the
+    document is not read back to find its headings. The parts may be a
+    generator; each is written as soon as it is produced.
+
+    Args:
+        output_path: Markdown file to write
+        content_parts: Lines or blocks of the document, in order
+
+    Returns:
+        Path of the written Markdown file
+
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    builder = OutlineBuilder()
+    with open(output_path, "wb") as f:
+        for index, part in enumerate(content_parts):
+            data = ("\n" + part if index else part).encode("utf-8")
+            f.write(data)
+            builder.feed(data)
+    write_outline(output_path, builder.finish(output_path.name))
+    return output_path
@@ -1,43 +1,119 @@
-"""Core module for document collection."""
+"""Core module for document collection.
 
-from .config import Configuration, get_config, reset_config, set_config
-from .exceptions import (
-    ConfigurationError,
-    ConversionError,
-    DocumentCollectionError,
-    FileSystemError,
-    NetworkError,
-    ProcessingError,
-    RetrievalError,
-    UnsupportedFormatError,
-    ValidationError,
-)
-from .interfaces import (
-    ConfigurationProvider,
-    DocumentConverter,
-    DocumentProcessor,
-    DocumentRetriever,
-    ProgressReporter,
-)
-from .models import (
-    BatchCollectionRequest,
-    BatchCollectionResult,
-    CollectionRequest,
-    CollectionResult,
-    DocumentFormat,
-    DocumentMetadata,
-    DocumentSource,
-    SourceType,
-)
-from .types import (
-    AuthenticationType,
-    CompressionType,
-    LogLevel,
-    OutputFormat,
-    ProcessingStage,
-    RetryStrategy,
-    ValidationLevel,
-)
+The public names are imported on first access, so importing one submodule
+(for instance the configuration) does not load the models and their
+dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Configuration, get_config, reset_config, set_config
+    from .exceptions import (
+        ConfigurationError,
+        ConversionError,
+        DocumentCollectionError,
+        FileSystemError,
+        NetworkError,
+        ProcessingError,
+        RetrievalError,
+        UnsupportedFormatError,
+        ValidationError,
+    )
+    from .interfaces import (
+        ConfigurationProvider,
+        DocumentConverter,
+        DocumentProcessor,
+        DocumentRetriever,
+        ProgressReporter,
+    )
+    from .models import (
+        BatchCollectionRequest,
+        BatchCollectionResult,
+        ChunkEntry,
+        ChunkIndex,
+        CollectionRequest,
+        CollectionResult,
+        DocumentFormat,
+        DocumentMetadata,
+        DocumentOutline,
+        DocumentPage,
+        DocumentSection,
+        DocumentSource,
+        DuplicateMatch,
+        JobItem,
+        JobStatus,
+        OutlineEntry,
+        SearchHit,
+        SourceType,
+    )
+    from .registry import Registry, converter_registry, retriever_registry
+    from .types import (
+        AuthenticationType,
+        CompressionType,
+        LogLevel,
+        OutputFormat,
+        ProcessingStage,
+        RetryStrategy,
+        ValidationLevel,
+    )
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    # config
+    "Configuration": "config",
+    "get_config": "config",
+    "reset_config": "config",
+    "set_config": "config",
+    # exceptions
+    "ConfigurationError": "exceptions",
+    "ConversionError": "exceptions",
+    "DocumentCollectionError": "exceptions",
+    "FileSystemError": "exceptions",
+    "NetworkError": "exceptions",
+    "ProcessingError": "exceptions",
+    "RetrievalError": "exceptions",
+    "UnsupportedFormatError": "exceptions",
+    "ValidationError": "exceptions",
+    # interfaces
+    "ConfigurationProvider": "interfaces",
+    "DocumentConverter": "interfaces",
+    "DocumentProcessor": "interfaces",
+    "DocumentRetriever": "interfaces",
+    "ProgressReporter": "interfaces",
+    # models
+    "BatchCollectionRequest": "models",
+    "BatchCollectionResult": "models",
+    "ChunkEntry": "models",
+    "ChunkIndex": "models",
+    "CollectionRequest": "models",
+    "CollectionResult": "models",
+    "DocumentFormat": "models",
+    "DocumentMetadata": "models",
+    "DocumentOutline": "models",
+    "DocumentPage": "models",
+    "DocumentSection": "models",
+    "DocumentSource": "models",
+    "DuplicateMatch": "models",
+    "JobItem": "models",
+    "JobStatus": "models",
+    "OutlineEntry": "models",
+    "SearchHit": "models",
+    "SourceType": "models",
+    # registry
+    "Registry": "registry",
+    "converter_registry": "registry",
+    "retriever_registry": "registry",
+    # types
+    "AuthenticationType": "types",
+    "CompressionType": "types",
+    "LogLevel": "types",
+    "OutputFormat": "types",
+    "ProcessingStage": "types",
+    "RetryStrategy": "types",
+    "ValidationLevel": "types",
+}
 
 __all__ = [
     # Configuration
@@ -48,18 +124,32 @@ __all__ = [
     # Models
     "DocumentFormat",
     "DocumentMetadata",
+    "DocumentOutline",
+    "DocumentSection",
+    "OutlineEntry",
+    "DocumentPage",
+    "SearchHit",
     "DocumentSource",
+    "DuplicateMatch",
+    "JobItem",
+    "JobStatus",
     "SourceType",
     "CollectionRequest",
     "CollectionResult",
     "BatchCollectionRequest",
     "BatchCollectionResult",
+    "ChunkEntry",
+    "ChunkIndex",
     # Interfaces
     "DocumentRetriever",
     "DocumentConverter",
     "DocumentProcessor",
     "ConfigurationProvider",
     "ProgressReporter",
+    # Registries
+    "Registry",
+    "converter_registry",
+    "retriever_registry",
     # Exceptions
     "DocumentCollectionError",
     "RetrievalError",
@@ -79,3 +169,17 @@ __all__ = [
     "AuthenticationType",
     "ValidationLevel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
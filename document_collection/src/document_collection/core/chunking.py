@@ -0,0 +1,241 @@
+"""Token-bounded chunking of converted Markdown documents."""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+from .models import ChunkEntry, ChunkIndex
+from .types import CHARS_PER_TOKEN, CHUNK_INDEX_SUFFIX, DEFAULT_CHUNK_TOKENS
+
+# Headings up to this level always start a new chunk; converters emit the
+# page, slide and sheet headings at level 2
+SPLIT_HEADING_LEVEL = 2
+
+_HEADING = re.compile(rb"(#{1,6})(?:[ \t]+(.*?))?[ \t#]*$")
+_FENCE = re.compile(rb" {0,3}(`{3,}|~{3,})")
+
+
+class _SplitPoint(NamedTuple):
+    """A position where the current chunk may be closed."""
+
+    offset: int
+    chars: int
+    heading_path: tuple[str, ...]
+
+
+def chunk_index_path(markdown_path: Path) -> Path:
+    """Return the path of the chunk index sidecar for a Markdown file."""
+    return markdown_path.with_name(markdown_path.stem + CHUNK_INDEX_SUFFIX)
+
+
+def build_chunk_index(
+    markdown_path: Path,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_chars: int | None = None,
+) -> ChunkIndex:
+    """Split a Markdown document into chunks under a size budget.
+
+    The file is read line by line. Headings up to ``SPLIT_HEADING_LEVEL``
+    (document title, pages, slides, sheets) always start a new chunk. When a
+    chunk would exceed the budget it is closed at the last deeper heading,
+    failing that at the last blank line, failing that at the last line end;
+    single lines longer than the budget are cut at character boundaries.
+    Fenced code blocks are never mistaken for headings.
+
+    Args:
+        markdown_path: Markdown file to index
+        max_tokens: Budget per chunk in approximate tokens
+        max_chars: Budget per chunk in characters, overrides ``max_tokens``
+
+    Returns:
+        Chunk index with byte offsets, heading paths and token estimates
+
+    """
+    budget = max(
+        1, max_chars if max_chars is not None else max_tokens * CHARS_PER_TOKEN
+    )
+    chunks: list[ChunkEntry] = []
+    headings: list[tuple[int, str]] = []
+
+    start = 0
+    start_path: tuple[str, ...] = ()
+    chars = 0  # Characters since the start of the chunk
+    offset = 0
+    in_fence: bytes | None = None
+    heading_split: _SplitPoint | None = None
+    paragraph_split: _SplitPoint | None = None
+    line_split: _SplitPoint | None = None
+
+    def close(split: _SplitPoint) -> None:
+        nonlocal start, start_path, chars, heading_split, paragraph_split, line_split
+        if split.offset > start:
+            chunks.append(
+                _entry(len(chunks), start, split.offset, split.chars, start_path)
+            )
+        start, start_path = split.offset, split.heading_path
+        chars -= split.chars
+        heading_split = paragraph_split = line_split = None
+
+    with open(markdown_path, "rb") as markdown:
+        for line in markdown:
+            line_chars = len(line.decode("utf-8", errors="surrogateescape"))
+            heading = None
+            fence = _FENCE.match(line)
+            if fence is not None:
+                marker = fence.group(1)
+                if in_fence is None:
+                    in_fence = marker
+                elif marker[0] == in_fence[0] and len(marker) >= len(in_fence):
+                    in_fence = None
+            elif in_fence is None and line.startswith(b"#"):
+                heading = _HEADING.match(line.rstrip(b"\r\n"))
+
+            if heading is not None:
+                level = len(heading.group(1))
+                text = (
+                    (heading.group(2) or b"").decode("utf-8", errors="replace").strip()
+                )
+                while headings and headings[-1][0] >= level:
+                    headings.pop()
+                headings.append((level, text))
+            here = tuple(text for _level, text in headings)
+            if heading is not None and offset > start:
+                if level <= SPLIT_HEADING_LEVEL:
+                    close(_SplitPoint(offset, chars, here))
+                else:
+                    heading_split = _SplitPoint(offset, chars, here)
+            if offset == start:
+                start_path = here
+
+            if chars + line_chars > budget and offset > start:
+                close(
+                    _choose_split(
+                        heading_split, paragraph_split, line_split, budget=budget
+                    )
+                )
+                if chars + line_chars > budget and offset > start:
+                    close(_SplitPoint(offset, chars, here))
+
+            if line_chars > budget:
+                # A single line longer than the budget is cut into pieces
+                offset = _split_long_line(
+                    line, start, offset, chars, budget, start_path, chunks
+                )
+                start, start_path, chars = offset, here, 0
+                heading_split = paragraph_split = line_split = None
+                continue
+
+            line_split = _SplitPoint(offset, chars, here)
+            offset += len(line)
+            chars += line_chars
+            if not line.strip():
+                paragraph_split = _SplitPoint(offset, chars, here)
+
+    if offset > start:
+        chunks.append(_entry(len(chunks), start, offset, chars, start_path))
+
+    return ChunkIndex(
+        document=markdown_path.name,
+        size_bytes=offset,
+        max_chars=budget,
+        chunks=chunks,
+    )
+
+
+def write_chunk_index(
+    markdown_path: Path,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_chars: int | None = None,
+) -> Path:
+    """Build the chunk index of a Markdown file and write it next to the file.
+
+    Returns:
+        Path of the written ``<stem>.chunks.json`` sidecar
+
+    """
+    index = build_chunk_index(markdown_path, max_tokens=max_tokens, max_chars=max_chars)
+    index_path = chunk_index_path(markdown_path)
+    fd, temp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as index_file:
+            index_file.write(index.model_dump_json())
+        os.replace(temp_name, index_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return index_path
+
+
+def load_chunk_index(markdown_path: Path) -> ChunkIndex:
+    """Load the chunk index sidecar of a Markdown file."""
+    return ChunkIndex.model_validate_json(chunk_index_path(markdown_path).read_bytes())
+
+
+def read_chunk(markdown_path: Path, chunk: ChunkEntry) -> str:
+    """Read one chunk with a single seek and read."""
+    with open(markdown_path, "rb") as markdown:
+        markdown.seek(chunk.start)
+        return markdown.read(chunk.end - chunk.start).decode("utf-8", errors="replace")
+
+
+def _choose_split(*splits: _SplitPoint | None, budget: int) -> _SplitPoint:
+    """Pick where to close a full chunk.
+
+    Split points are given in order of preference (heading, blank line, line
+    end). The first one that keeps at least half the budget in the closed
+    chunk wins; otherwise the latest one is used.
+    """
+    candidates = [split for split in splits if split is not None]
+    for split in candidates:
+        if split.chars >= budget // 2:
+            return split
+    return max(candidates, key=lambda split: split.offset)
+
+
+def _entry(
+    index: int, start: int, end: int, chars: int, heading_path: tuple[str, ...]
+) -> ChunkEntry:
+    """Create the index entry of a chunk."""
+    return ChunkEntry(
+        index=index,
+        start=start,
+        end=end,
+        chars=chars,
+        approx_tokens=-(-chars // CHARS_PER_TOKEN),
+        heading_path=list(heading_path),
+    )
+
+
+def _split_long_line(
+    line: bytes,
+    start: int,
+    offset: int,
+    chars: int,
+    budget: int,
+    heading_path: tuple[str, ...],
+    chunks: list[ChunkEntry],
+) -> int:
+    """Emit chunks for a line longer than the budget.
+
+    The line is cut at character boundaries. The open chunk from ``start`` to
+    ``offset``, holding ``chars`` characters, is filled up with the beginning
+    of the line.
+
+    Returns:
+        The byte offset just past the line
+
+    """
+    text = line.decode("utf-8", errors="surrogateescape")
+    position = 0
+    room = max(1, budget - chars)
+    while position < len(text):
+        piece = text[position : position + room]
+        end = offset + len(piece.encode("utf-8", errors="surrogateescape"))
+        chunks.append(_entry(len(chunks), start, end, chars + len(piece), heading_path))
+        start = offset = end
+        position += len(piece)
+        chars = 0
+        room = budget
+    return offset
@@ -7,8 +7,18 @@ from typing import Any
 import yaml
 
 from .types import (
+    DEFAULT_ADMISSION_TIMEOUT,
     DEFAULT_BATCH_SIZE,
+    DEFAULT_CHUNK_TOKENS,
+    DEFAULT_COLLECT_CONCURRENCY,
+    DEFAULT_COLLECT_QUEUE_SIZE,
+    DEFAULT_DAEMON_TIMEOUT,
+    DEFAULT_DEDUPE_TTL,
     DEFAULT_DESTINATION,
+    DEFAULT_DUPLICATE_THRESHOLD,
+    DEFAULT_INTERACTIVE_CONCURRENCY,
+    DEFAULT_INTERACTIVE_QUEUE_SIZE,
+    DEFAULT_JOB_WORKERS,
     DEFAULT_MAX_WORKERS,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_DELAY,
@@ -61,6 +71,24 @@ class Configuration:
             "preserve_formatting": True,
             "extract_images": True,
             "image_directory": "images",
+            "chunk_documents": True,
+            "chunk_max_tokens": DEFAULT_CHUNK_TOKENS,
+            "search_index": True,
+            "duplicate_detection": "flag",
+            "duplicate_threshold": DEFAULT_DUPLICATE_THRESHOLD,
+            "dedupe_ttl": DEFAULT_DEDUPE_TTL,
+            # MCP server settings
+            "mcp_resource_root": "output",
+            "job_database": None,  # Defaults to the state directory of mcp_resource_root
+            "job_workers": DEFAULT_JOB_WORKERS,
+            "collect_concurrency": DEFAULT_COLLECT_CONCURRENCY,
+            "collect_queue_size": DEFAULT_COLLECT_QUEUE_SIZE,
+            "interactive_concurrency": DEFAULT_INTERACTIVE_CONCURRENCY,
+            "interactive_queue_size": DEFAULT_INTERACTIVE_QUEUE_SIZE,
+            "admission_timeout": DEFAULT_ADMISSION_TIMEOUT,
+            # CLI daemon settings
+            "daemon_socket": None,  # Defaults to a per-user socket in the runtime directory
+            "daemon_timeout": DEFAULT_DAEMON_TIMEOUT,
             # Logging settings
             "log_level": "INFO",
             "log_to_file": False,
@@ -120,18 +148,50 @@ class Configuration:
             "DOCUMENT_COLLECTION_RETRY_DELAY": "retry_delay",
             "DOCUMENT_COLLECTION_LOG_LEVEL": "log_level",
             "DOCUMENT_COLLECTION_USER_AGENT": "user_agent",
+            "DOCUMENT_COLLECTION_CHUNK": "chunk_documents",
+            "DOCUMENT_COLLECTION_CHUNK_TOKENS": "chunk_max_tokens",
+            "DOCUMENT_COLLECTION_SEARCH": "search_index",
+            "DOCUMENT_COLLECTION_DUPLICATES": "duplicate_detection",
+            "DOCUMENT_COLLECTION_DUPLICATE_THRESHOLD": "duplicate_threshold",
+            "DOCUMENT_COLLECTION_MCP_RESOURCES": "mcp_resource_root",
+            "DOCUMENT_COLLECTION_DEDUPE_TTL": "dedupe_ttl",
+            "DOCUMENT_COLLECTION_JOB_DATABASE": "job_database",
+            "DOCUMENT_COLLECTION_JOB_WORKERS": "job_workers",
+            "DOCUMENT_COLLECTION_COLLECT_CONCURRENCY": "collect_concurrency",
+            "DOCUMENT_COLLECTION_COLLECT_QUEUE": "collect_queue_size",
+            "DOCUMENT_COLLECTION_INTERACTIVE_CONCURRENCY": "interactive_concurrency",
+            "DOCUMENT_COLLECTION_INTERACTIVE_QUEUE": "interactive_queue_size",
+            "DOCUMENT_COLLECTION_ADMISSION_TIMEOUT": "admission_timeout",
+            "DOCUMENT_COLLECTION_DAEMON_SOCKET": "daemon_socket",
+            "DOCUMENT_COLLECTION_DAEMON_TIMEOUT": "daemon_timeout",
         }
 
         for env_var, config_key in env_mapping.items():
             env_value = os.getenv(env_var)
             if env_value is not None:
                 # Convert string values to appropriate types
-                if config_key in ["max_workers", "retry_attempts"]:
+                if config_key in [
+                    "max_workers",
+                    "retry_attempts",
+                    "chunk_max_tokens",
+                    "job_workers",
+                    "collect_concurrency",
+                    "collect_queue_size",
+                    "interactive_concurrency",
+                    "interactive_queue_size",
+                ]:
                     try:
                         self._config[config_key] = int(env_value)
                     except ValueError:
                         pass
-                elif config_key in ["timeout", "retry_delay"]:
+                elif config_key in [
+                    "timeout",
+                    "retry_delay",
+                    "duplicate_threshold",
+                    "dedupe_ttl",
+                    "admission_timeout",
+                    "daemon_timeout",
+                ]:
                     try:
                         self._config[config_key] = float(env_value)
                     except ValueError:
@@ -140,6 +200,8 @@ class Configuration:
                     "convert_to_markdown",
                     "preserve_original",
                     "overwrite_existing",
+                    "chunk_documents",
+                    "search_index",
                 ]:
                     self._config[config_key] = env_value.lower() in [
                         "true",
@@ -17,7 +17,8 @@ class DocumentRetriever(ABC):
         Args:
             source: Source location (file path or URL)
             destination: Destination directory
-            **kwargs: Additional retriever-specific options
+            **kwargs: Additional retriever-specific options; a ``sniffer``
+                (FormatSniffer) given here should be fed the bytes read
 
         Returns:
             Path to the retrieved document
@@ -0,0 +1,437 @@
+"""Background batch jobs backed by a SQLite job table."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .models import CollectionResult, JobItem, JobStatus
+from .service import DocumentCollectionService
+from .types import DEFAULT_JOB_PAGE_SIZE, DEFAULT_JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    options TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    bytes_collected INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    output_path TEXT,
+    size_bytes INTEGER,
+    error TEXT,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+"""
+
+
+class JobStore:
+    """SQLite table of batch jobs and the per-source results of each job.
+
+    Progress is written as each source finishes, so a status query sees
+    partial results and a restarted server can resume unfinished jobs.
+    """
+
+    def __init__(self, database_path: Path) -> None:
+        """Open (and create if needed) the job database.
+
+        Args:
+            database_path: SQLite file holding the job table
+
+        """
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(database_path), timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def create(
+        self, sources: list[str], output_dir: Path, options: dict[str, Any]
+    ) -> str:
+        """Record a new queued job.
+
+        Returns:
+            Identifier of the job
+
+        """
+        job_id = uuid.uuid4().hex
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs (id, status, output_dir, options, total, created_at)"
+                " VALUES (?, 'queued', ?, ?, ?, ?)",
+                (
+                    job_id,
+                    str(output_dir),
+                    json.dumps(options),
+                    len(sources),
+                    time.time(),
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO job_items (job_id, position, source) VALUES (?, ?, ?)",
+                [(job_id, position, source) for position, source in enumerate(sources)],
+            )
+        return job_id
+
+    def start(self, job_id: str) -> None:
+        """Mark a job as running."""
+        with self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'running', started_at = COALESCE(started_at, ?)"
+                " WHERE id = ?",
+                (time.time(), job_id),
+            )
+
+    def pending_items(self, job_id: str) -> list[tuple[int, str]]:
+        """Return the ``(position, source)`` pairs of a job still to be collected."""
+        return self._connection.execute(
+            "SELECT position, source FROM job_items WHERE job_id = ? AND status = 'queued'"
+            " ORDER BY position",
+            (job_id,),
+        ).fetchall()
+
+    def options(self, job_id: str) -> tuple[Path, dict[str, Any]]:
+        """Return the output directory and collection options of a job."""
+        output_dir, options = self._connection.execute(
+            "SELECT output_dir, options FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return Path(output_dir), json.loads(options)
+
+    def record(self, job_id: str, position: int, result: CollectionResult) -> None:
+        """Store the result of one source and update the job's counters."""
+        self.record_many(job_id, [(position, result)])
+
+    def record_many(
+        self, job_id: str, results: Iterable[tuple[int, CollectionResult]]
+    ) -> None:
+        """Store the results of several sources in one transaction."""
+        rows = []
+        completed = failed = collected = 0
+        for position, result in results:
+            size = None
+            if result.success and result.output_path is not None:
+                try:
+                    size = Path(result.output_path).stat().st_size
+                except OSError:
+                    size = None
+            error = (
+                None if result.success else "; ".join(result.errors) or "Unknown error"
+            )
+            rows.append(
+                (
+                    "completed" if result.success else "failed",
+                    str(result.output_path) if result.output_path else None,
+                    size,
+                    error,
+                    job_id,
+                    position,
+                )
+            )
+            completed += int(result.success)
+            failed += int(not result.success)
+            collected += size or 0
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE job_items SET status = ?, output_path = ?, size_bytes = ?, error = ?"
+                " WHERE job_id = ? AND position = ?",
+                rows,
+            )
+            self._connection.execute(
+                "UPDATE jobs SET completed = completed + ?, failed = failed + ?,"
+                " bytes_collected = bytes_collected + ? WHERE id = ?",
+                (completed, failed, collected, job_id),
+            )
+
+    def finish(self, job_id: str, status: str, error: str | None = None) -> None:
+        """Put a job in a final state; sources not collected yet are cancelled.
+
+        A job already in a final state, for instance cancelled by another
+        server process, keeps it.
+        """
+        with self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ?"
+                " WHERE id = ? AND status IN ('queued', 'running')",
+                (status, time.time(), error, job_id),
+            )
+            self._connection.execute(
+                "UPDATE job_items SET status = 'cancelled' WHERE job_id = ? AND status = 'queued'",
+                (job_id,),
+            )
+
+    def unfinished(self) -> list[str]:
+        """Return the jobs that were queued or running, oldest first."""
+        rows = self._connection.execute(
+            "SELECT id FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+        ).fetchall()
+        return [job_id for (job_id,) in rows]
+
+    def get(
+        self, job_id: str, offset: int = 0, limit: int = DEFAULT_JOB_PAGE_SIZE
+    ) -> JobStatus | None:
+        """Return the status of a job with one page of its per-source results.
+
+        Args:
+            job_id: Job identifier
+            offset: Position of the first item to return
+            limit: Maximum number of items to return
+
+        Returns:
+            The job status, or None for an unknown job
+
+        """
+        row = self._connection.execute(
+            "SELECT status, output_dir, total, completed, failed, bytes_collected,"
+            " created_at, started_at, finished_at, error FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        (
+            status,
+            output_dir,
+            total,
+            completed,
+            failed,
+            bytes_collected,
+            created_at,
+            started_at,
+            finished_at,
+            error,
+        ) = row
+
+        items = [
+            JobItem(
+                position=position,
+                source=source,
+                status=item_status,
+                output_path=output_path,
+                size_bytes=size_bytes,
+                error=item_error,
+            )
+            for position, source, item_status, output_path, size_bytes, item_error in self._connection.execute(
+                "SELECT position, source, status, output_path, size_bytes, error"
+                " FROM job_items WHERE job_id = ? AND position >= ? ORDER BY position LIMIT ?",
+                (job_id, offset, limit),
+            )
+        ]
+        next_offset = offset + limit if limit and offset + limit < total else None
+
+        elapsed = 0.0
+        if started_at is not None:
+            elapsed = (finished_at or time.time()) - started_at
+        done = completed + failed
+        return JobStatus(
+            job_id=job_id,
+            status=status,
+            output_dir=output_dir,
+            total=total,
+            completed=completed,
+            failed=failed,
+            bytes_collected=bytes_collected,
+            created_at=datetime.fromtimestamp(created_at, UTC),
+            started_at=_timestamp(started_at),
+            finished_at=_timestamp(finished_at),
+            documents_per_second=done / elapsed if elapsed > 0 else 0.0,
+            bytes_per_second=bytes_collected / elapsed if elapsed > 0 else 0.0,
+            error=error,
+            items=items,
+            next_offset=next_offset,
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+class JobScheduler:
+    """Run batch jobs in the background of a long-running server.
+
+    Submitted jobs are queued and processed by ``workers`` asyncio tasks,
+    each collecting the sources of one job in order and recording every
+    result as it completes. Jobs that were unfinished when the server
+    stopped are resumed when the scheduler starts.
+    """
+
+    def __init__(
+        self,
+        service: DocumentCollectionService,
+        store: JobStore,
+        workers: int = DEFAULT_JOB_WORKERS,
+        schedule: Callable[
+            [str, Callable[[], Awaitable[CollectionResult]]],
+            Awaitable[CollectionResult],
+        ]
+        | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            service: Service used to collect the documents
+            store: Job table
+            workers: Number of jobs processed at the same time
+            schedule: Runs the collection of one document of a job, given the
+                job id, when a scheduler shared with other work grants it a
+                slot; documents are collected directly by default
+
+        """
+        self.service = service
+        self.store = store
+        self.workers = max(1, workers)
+        self._schedule = schedule
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._worker_tasks: list[asyncio.Task[None]] = []
+        self._running: dict[str, asyncio.Task[None]] = {}
+        self._cancelled: set[str] = set()
+
+    def start(self, resume: bool = True) -> None:
+        """Start the workers; must run inside the event loop.
+
+        Args:
+            resume: Requeue the jobs left unfinished by a previous run. When
+                several server processes share the job table, only one of
+                them should resume jobs.
+
+        """
+        if self._worker_tasks:
+            return
+        for job_id in self.store.unfinished() if resume else []:
+            logger.info("Resuming job %s", job_id)
+            self._queue.put_nowait(job_id)
+        self._worker_tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{number}")
+            for number in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs in progress are left to resume on the next start."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def submit(
+        self,
+        sources: list[str],
+        output_dir: Path,
+        options: dict[str, Any] | None = None,
+    ) -> str:
+        """Queue a batch job.
+
+        Returns:
+            Identifier of the job
+
+        """
+        self.start()
+        job_id = self.store.create(sources, output_dir, options or {})
+        self._queue.put_nowait(job_id)
+        logger.info("Queued job %s with %d sources", job_id, len(sources))
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job.
+
+        Returns:
+            False if the job is unknown or already finished
+
+        """
+        status = self.store.get(job_id, limit=0)
+        if status is None or status.is_finished:
+            return False
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancelled.add(job_id)
+            task.cancel()
+        else:
+            self.store.finish(job_id, "cancelled")
+        return True
+
+    async def wait(self, job_id: str, poll_interval: float = 0.05) -> JobStatus | None:
+        """Wait until a job reaches a final state."""
+        while True:
+            status = self.store.get(job_id, limit=0)
+            if status is None or status.is_finished:
+                return status
+            await asyncio.sleep(poll_interval)
+
+    async def _work(self) -> None:
+        """Take jobs off the queue and run them one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                status = self.store.get(job_id, limit=0)
+                if status is None or status.is_finished:
+                    continue
+                task = asyncio.create_task(self._run(job_id))
+                self._running[job_id] = task
+                try:
+                    await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    if not task.done():
+                        # The worker is stopping; the job resumes on restart
+                        task.cancel()
+                        raise
+            finally:
+                self._running.pop(job_id, None)
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        """Collect the remaining sources of a job."""
+        output_dir, options = self.store.options(job_id)
+        self.store.start(job_id)
+        try:
+            for position, source in self.store.pending_items(job_id):
+                status = self.store.get(job_id, limit=0)
+                if status is None or status.is_finished:
+                    # Cancelled through the job table by another server process,
+                    # or removed from it
+                    logger.info("Job %s was cancelled", job_id)
+                    return
+                result = await self._collect(job_id, source, output_dir, options)
+                self.store.record(job_id, position, result)
+        except asyncio.CancelledError:
+            # Cancelled by the server stopping, the job stays unfinished and resumes
+            if job_id in self._cancelled:
+                self._cancelled.discard(job_id)
+                self.store.finish(job_id, "cancelled")
+                logger.info("Cancelled job %s", job_id)
+            raise
+        except Exception as e:
+            logger.error("Job %s failed: %s", job_id, e)
+            self.store.finish(job_id, "failed", error=str(e))
+            return
+        self.store.finish(job_id, "completed")
+        logger.info("Completed job %s", job_id)
+
+    async def _collect(
+        self, job_id: str, source: str, output_dir: Path, options: dict[str, Any]
+    ) -> CollectionResult:
+        """Collect one source of a job, through the shared schedule if there is one."""
+        if self._schedule is None:
+            return await self.service.collect_document(source, output_dir, **options)
+        return await self._schedule(
+            job_id, lambda: self.service.collect_document(source, output_dir, **options)
+        )
+
+
+def _timestamp(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value, UTC) if value is not None else None
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
@@ -17,6 +17,7 @@ class DocumentFormat(str, Enum):
     POWERPOINT = "pptx"
     EXCEL = "xlsx"
     MARKDOWN = "md"
+    HTML = "html"
 
 
 class SourceType(str, Enum):
@@ -115,6 +116,13 @@ class CollectionRequest(BaseModel):
             return Path("./documents")
 
 
+class DuplicateMatch(BaseModel):
+    """An earlier collected document that a new one nearly duplicates."""
+
+    document: Path = Field(..., description="Path to the earlier Markdown document")
+    similarity: float = Field(..., description="Estimated Jaccard similarity (0-1)")
+
+
 class CollectionResult(BaseModel):
     """Result of document collection operation."""
 
@@ -128,6 +136,15 @@ class CollectionResult(BaseModel):
     )
     warnings: list[str] = Field(default_factory=list, description="List of warnings")
     processing_time_seconds: float | None = Field(None, description="Processing time")
+    conversion_stats: dict[str, Any] = Field(
+        default_factory=dict, description="Counters reported by the converter"
+    )
+    artifacts: dict[str, Path] = Field(
+        default_factory=dict, description="Sidecar files written next to the output"
+    )
+    duplicates: list[DuplicateMatch] = Field(
+        default_factory=list, description="Near-duplicates among earlier documents"
+    )
 
     @property
     def has_errors(self) -> bool:
@@ -140,6 +157,94 @@ class CollectionResult(BaseModel):
         return len(self.warnings) > 0
 
 
+class ChunkEntry(BaseModel):
+    """One chunk of a converted document."""
+
+    index: int = Field(..., description="Position of the chunk in the document")
+    start: int = Field(..., description="Byte offset where the chunk starts")
+    end: int = Field(..., description="Byte offset just past the end of the chunk")
+    chars: int = Field(..., description="Number of characters in the chunk")
+    approx_tokens: int = Field(..., description="Approximate number of tokens")
+    heading_path: list[str] = Field(
+        default_factory=list, description="Headings enclosing the start of the chunk"
+    )
+
+
+class ChunkIndex(BaseModel):
+    """Index of the chunks of a converted document."""
+
+    version: int = Field(default=1, description="Index format version")
+    document: str = Field(..., description="File name of the indexed document")
+    size_bytes: int = Field(..., description="Size of the document when indexed")
+    max_chars: int = Field(..., description="Character budget per chunk")
+    chunks: list[ChunkEntry] = Field(
+        default_factory=list, description="Chunks in order"
+    )
+
+
+class OutlineEntry(BaseModel):
+    """One heading of a converted document and the extent of its section."""
+
+    level: int = Field(..., description="Heading level (1-6)")
+    text: str = Field(..., description="Heading text")
+    path: list[str] = Field(
+        default_factory=list, description="Texts of the enclosing headings"
+    )
+    start: int = Field(..., description="Byte offset of the heading line")
+    end: int = Field(..., description="Byte offset where the section ends")
+
+
+class DocumentOutline(BaseModel):
+    """Heading outline of a converted document."""
+
+    version: int = Field(default=1, description="Outline format version")
+    document: str = Field(..., description="File name of the outlined document")
+    size_bytes: int = Field(..., description="Size of the document when outlined")
+    headings: list[OutlineEntry] = Field(
+        default_factory=list, description="Headings in document order"
+    )
+
+
+class DocumentSection(BaseModel):
+    """A section of a converted document read through its outline."""
+
+    heading: str = Field(..., description="Heading text")
+    level: int = Field(..., description="Heading level (1-6)")
+    path: list[str] = Field(default_factory=list, description="Enclosing headings")
+    start: int = Field(..., description="Byte offset of the heading line")
+    end: int = Field(..., description="Byte offset where the section ends")
+    content: str = Field(..., description="Markdown of the section, heading included")
+
+
+class DocumentPage(BaseModel):
+    """One page of a converted document: a byte range, page, slide or chunk."""
+
+    document: str = Field(..., description="File name of the document")
+    unit: str = Field(..., description="Pagination unit: bytes, page, slide or chunk")
+    number: int = Field(
+        ..., description="Page, slide or chunk number; byte offset for ranges"
+    )
+    total: int | None = Field(
+        default=None, description="Number of units in the document"
+    )
+    start: int = Field(..., description="Byte offset where the page starts")
+    end: int = Field(..., description="Byte offset just past the end of the page")
+    size_bytes: int = Field(..., description="Size of the whole document")
+    content_hash: str = Field(..., description="SHA-256 of the page content")
+    content: str = Field(..., description="Markdown of the page")
+
+
+class SearchHit(BaseModel):
+    """A ranked section returned by a full-text search."""
+
+    document: Path = Field(..., description="Path to the Markdown document")
+    heading: str = Field(default="", description="Heading path of the section")
+    start: int = Field(..., description="Byte offset where the section starts")
+    end: int = Field(..., description="Byte offset where the section ends")
+    score: float = Field(..., description="BM25 score")
+    snippet: str = Field(default="", description="Text around the first matching term")
+
+
 class BatchCollectionRequest(BaseModel):
     """Request for batch document collection."""
 
@@ -201,3 +306,49 @@ class BatchCollectionResult(BaseModel):
         for result in self.results:
             warnings.extend(result.warnings)
         return warnings
+
+
+JobState = Literal["queued", "running", "completed", "failed", "cancelled"]
+JobItemState = Literal["queued", "completed", "failed", "cancelled"]
+
+
+class JobItem(BaseModel):
+    """Progress of one source of a background batch job."""
+
+    position: int = Field(..., description="Position of the source in the batch")
+    source: str = Field(..., description="Source file path or URL")
+    status: JobItemState = Field(default="queued", description="Collection state")
+    output_path: str | None = Field(None, description="Collected document")
+    size_bytes: int | None = Field(None, description="Size of the collected document")
+    error: str | None = Field(None, description="Error message if collection failed")
+
+
+class JobStatus(BaseModel):
+    """State, progress and partial results of a background batch job."""
+
+    job_id: str = Field(..., description="Job identifier")
+    status: JobState = Field(..., description="Job state")
+    output_dir: str = Field(..., description="Destination directory of the batch")
+    total: int = Field(..., description="Number of sources in the batch")
+    completed: int = Field(default=0, description="Sources collected successfully")
+    failed: int = Field(default=0, description="Sources that failed")
+    bytes_collected: int = Field(default=0, description="Bytes of collected documents")
+    created_at: datetime = Field(..., description="Submission time")
+    started_at: datetime | None = Field(None, description="Start of processing")
+    finished_at: datetime | None = Field(None, description="End of processing")
+    documents_per_second: float = Field(
+        default=0.0, description="Processing throughput"
+    )
+    bytes_per_second: float = Field(default=0.0, description="Output throughput")
+    error: str | None = Field(None, description="Error that stopped the job")
+    items: list[JobItem] = Field(
+        default_factory=list, description="Page of per-source results"
+    )
+    next_offset: int | None = Field(
+        None, description="Offset of the next page of items"
+    )
+
+    @property
+    def is_finished(self) -> bool:
+        """Check whether the job reached a final state."""
+        return self.status in ("completed", "failed", "cancelled")
@@ -0,0 +1,194 @@
+"""Heading outlines of converted Markdown documents."""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from .models import DocumentOutline, DocumentSection, OutlineEntry
+from .types import OUTLINE_SUFFIX
+
+_HEADING = re.compile(rb"(#{1,6})(?:[ \t]+(.*?))?[ \t#]*$")
+_FENCE = re.compile(rb" {0,3}(`{3,}|~{3,})")
+# Lines that can be a heading or a code fence; the pattern starts with the
+# newline ending the previous line so the engine can skip ahead to candidates
+_CANDIDATE = re.compile(rb"\n(?:#| {0,3}(?:```|~~~))")
+# Separators accepted between the headings of a section path
+_PATH_SEPARATOR = re.compile(r"\s*(?:>|/)\s*")
+
+
+class OutlineBuilder:
+    """Collect heading offsets from Markdown as it is written.
+
+    Bytes are fed in the order they are written, in pieces of any size.
+    Headings inside fenced code blocks are ignored. A section ends where the
+    next heading of the same or a higher level starts, or at the end of the
+    document.
+    """
+
+    def __init__(self) -> None:
+        self._offset = 0
+        self._partial = b""
+        self._in_fence: bytes | None = None
+        self._headings: list[OutlineEntry] = []
+        self._open: list[OutlineEntry] = []
+
+    def feed(self, data: bytes) -> None:
+        """Scan written bytes for headings."""
+        data = self._partial + data
+        complete = data.rfind(b"\n") + 1
+        self._partial = data[complete:]
+        # Only lines starting like a heading or fence are looked at, so large
+        # blocks of body text stay in the regex engine
+        if complete:
+            self._scan_line(data[: data.find(b"\n")], self._offset)
+        for match in _CANDIDATE.finditer(data, 0, complete - 1):
+            line_start = match.start() + 1
+            line_end = data.find(b"\n", line_start)
+            self._scan_line(data[line_start:line_end], self._offset + line_start)
+        self._offset += complete
+
+    def skip(self, size: int) -> None:
+        """Account for written bytes that cannot hold headings, such as front matter."""
+        self._offset += size
+
+    def finish(self, document: str) -> DocumentOutline:
+        """Close the open sections and return the outline."""
+        if self._partial:
+            self._scan_line(self._partial, self._offset)
+            self._offset += len(self._partial)
+            self._partial = b""
+        for entry in self._open:
+            entry.end = self._offset
+        self._open = []
+        return DocumentOutline(
+            document=document, size_bytes=self._offset, headings=self._headings
+        )
+
+    def _scan_line(self, line: bytes, start: int) -> None:
+        fence = _FENCE.match(line)
+        if fence is not None:
+            marker = fence.group(1)
+            if self._in_fence is None:
+                self._in_fence = marker
+            elif marker[0] == self._in_fence[0] and len(marker) >= len(self._in_fence):
+                self._in_fence = None
+            return
+        if self._in_fence is not None or not line.startswith(b"#"):
+            return
+        heading = _HEADING.match(line.rstrip(b"\r"))
+        if heading is None:
+            return
+
+        level = len(heading.group(1))
+        while self._open and self._open[-1].level >= level:
+            self._open.pop().end = start
+        entry = OutlineEntry(
+            level=level,
+            text=(heading.group(2) or b"").decode("utf-8", errors="replace").strip(),
+            path=[parent.text for parent in self._open],
+            start=start,
+            end=start,
+        )
+        self._headings.append(entry)
+        self._open.append(entry)
+
+
+def outline_path(markdown_path: Path) -> Path:
+    """Return the path of the outline sidecar for a Markdown file."""
+    return markdown_path.with_name(markdown_path.stem + OUTLINE_SUFFIX)
+
+
+def build_outline(markdown_path: Path) -> DocumentOutline:
+    """Build the outline of an existing Markdown file."""
+    builder = OutlineBuilder()
+    with open(markdown_path, "rb") as markdown:
+        for line in markdown:
+            builder.feed(line)
+    return builder.finish(markdown_path.name)
+
+
+def write_outline(markdown_path: Path, outline: DocumentOutline) -> Path:
+    """Write an outline next to its Markdown file.
+
+    Returns:
+        Path of the written ``<stem>.outline.json`` sidecar
+
+    """
+    sidecar = outline_path(markdown_path)
+    fd, temp_name = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as outline_file:
+            outline_file.write(outline.model_dump_json())
+        os.replace(temp_name, sidecar)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return sidecar
+
+
+def load_outline(markdown_path: Path) -> DocumentOutline:
+    """Load the outline of a Markdown file.
+
+    The sidecar is used when it matches the size of the document; otherwise,
+    for documents converted before outlines existed or edited since, the
+    outline is rebuilt from the document and the sidecar rewritten.
+    """
+    sidecar = outline_path(markdown_path)
+    if sidecar.exists():
+        outline = DocumentOutline.model_validate_json(sidecar.read_bytes())
+        if outline.size_bytes == markdown_path.stat().st_size:
+            return outline
+    outline = build_outline(markdown_path)
+    try:
+        write_outline(markdown_path, outline)
+    except OSError:
+        pass  # A read-only collection still gets its sections
+    return outline
+
+
+def find_heading(outline: DocumentOutline, query: str) -> OutlineEntry | None:
+    """Find the heading addressed by a query.
+
+    The query is either a heading path such as ``report > Page 2 > Scope``
+    (``/`` is accepted as separator too), which must match the last headings
+    of an entry's path, or plain heading text. Matching ignores case; plain
+    text prefers an exact match and falls back to the first heading that
+    contains it.
+    """
+    query = query.strip()
+    if not query:
+        return None
+
+    parts = [part.casefold() for part in _PATH_SEPARATOR.split(query) if part]
+    if len(parts) > 1:
+        for entry in outline.headings:
+            full_path = [text.casefold() for text in [*entry.path, entry.text]]
+            if full_path[-len(parts) :] == parts:
+                return entry
+
+    wanted = query.casefold()
+    for entry in outline.headings:
+        if entry.text.casefold() == wanted:
+            return entry
+    for entry in outline.headings:
+        if wanted in entry.text.casefold():
+            return entry
+    return None
+
+
+def read_section(markdown_path: Path, entry: OutlineEntry) -> DocumentSection:
+    """Read the section under a heading with a single seek and read."""
+    with open(markdown_path, "rb") as markdown:
+        markdown.seek(entry.start)
+        content = markdown.read(entry.end - entry.start).decode(
+            "utf-8", errors="replace"
+        )
+    return DocumentSection(
+        heading=entry.text,
+        level=entry.level,
+        path=entry.path,
+        start=entry.start,
+        end=entry.end,
+        content=content,
+    )
@@ -0,0 +1,169 @@
+"""Paginated reads of converted Markdown documents.
+
+A document can be read by byte range, by the page and slide headings the PDF
+and PowerPoint converters emit, or by the chunks of its chunk index. Every
+read is a single seek and read, and every page carries the SHA-256 of its
+content so clients can cache pages and tell when they changed.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+from .chunking import build_chunk_index, load_chunk_index
+from .exceptions import ValidationError
+from .models import ChunkIndex, DocumentPage, OutlineEntry
+from .outline import load_outline
+from .types import DEFAULT_RANGE_BYTES, MAX_RANGE_BYTES, PAGE_UNITS
+
+# Converters put page and slide headings at level 2
+_UNIT_HEADING = re.compile(r"(Page|Slide) (\d+)")
+_UNIT_LEVEL = 2
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hash that identifies a page's content."""
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+def read_range(
+    markdown_path: Path, start: int, length: int = DEFAULT_RANGE_BYTES
+) -> DocumentPage:
+    """Read a byte range of a document, snapped to UTF-8 character boundaries.
+
+    A start inside a multi-byte character moves forward to the next
+    character and an end inside one moves back, so consecutive ranges, each
+    starting where the previous one ended, cover the document exactly once.
+
+    Args:
+        markdown_path: Converted Markdown document
+        start: Byte offset to read from
+        length: Number of bytes to read, at most ``MAX_RANGE_BYTES``
+
+    Raises:
+        ValidationError: If the range is outside the document
+
+    """
+    size = markdown_path.stat().st_size
+    if start < 0 or start > size:
+        raise ValidationError(
+            f"Range start must be between 0 and {size}", field="start", value=start
+        )
+    if length <= 0:
+        raise ValidationError(
+            "Range length must be positive", field="length", value=length
+        )
+    length = min(length, MAX_RANGE_BYTES)
+
+    with open(markdown_path, "rb") as markdown:
+        markdown.seek(start)
+        # Up to three extra bytes finish a character cut by the end of the range
+        data = markdown.read(length + 3)
+
+    first = 0
+    while first < min(3, len(data)) and _is_continuation(data[first]):
+        first += 1
+    last = min(first + length, len(data))
+    if last < len(data):
+        while last > first and _is_continuation(data[last]):
+            last -= 1
+    content = data[first:last]
+    return DocumentPage(
+        document=markdown_path.name,
+        unit="bytes",
+        number=start,
+        start=start + first,
+        end=start + last,
+        size_bytes=size,
+        content_hash=content_hash(content),
+        content=content.decode("utf-8", errors="replace"),
+    )
+
+
+def read_unit(markdown_path: Path, unit: str, number: int) -> DocumentPage | None:
+    """Read one page, slide or chunk of a document.
+
+    Pages and slides are the sections under the ``Page N`` and ``Slide N``
+    headings of the document's outline and are numbered as in the source
+    document. Chunks come from the chunk index and are numbered from 0; a
+    missing or stale chunk index is rebuilt in memory.
+
+    Args:
+        markdown_path: Converted Markdown document
+        unit: One of ``PAGE_UNITS``
+        number: Page or slide number, or chunk index
+
+    Returns:
+        The page, or None if the document has no such page
+
+    Raises:
+        ValidationError: If the unit is unknown
+
+    """
+    if unit not in PAGE_UNITS:
+        raise ValidationError(f"Unknown page unit: {unit}", field="unit", value=unit)
+
+    if unit == "chunk":
+        chunks = load_chunks(markdown_path).chunks
+        if not 0 <= number < len(chunks):
+            return None
+        return _read(
+            markdown_path,
+            unit,
+            number,
+            len(chunks),
+            chunks[number].start,
+            chunks[number].end,
+        )
+
+    units = unit_headings(markdown_path, unit)
+    entry = units.get(number)
+    if entry is None:
+        return None
+    return _read(markdown_path, unit, number, len(units), entry.start, entry.end)
+
+
+def unit_headings(markdown_path: Path, unit: str) -> dict[int, OutlineEntry]:
+    """Map page or slide numbers to their headings in the document outline."""
+    units: dict[int, OutlineEntry] = {}
+    for entry in load_outline(markdown_path).headings:
+        match = _UNIT_HEADING.fullmatch(entry.text)
+        if entry.level == _UNIT_LEVEL and match and match[1].lower() == unit:
+            units.setdefault(int(match[2]), entry)
+    return units
+
+
+def load_chunks(markdown_path: Path) -> ChunkIndex:
+    """Load the chunk index of a document, rebuilding it if missing or stale."""
+    try:
+        index = load_chunk_index(markdown_path)
+        if index.size_bytes == markdown_path.stat().st_size:
+            return index
+    except (OSError, ValueError):
+        pass
+    return build_chunk_index(markdown_path)
+
+
+def _read(
+    markdown_path: Path, unit: str, number: int, total: int, start: int, end: int
+) -> DocumentPage:
+    """Read the bytes of a page with a single seek and read."""
+    with open(markdown_path, "rb") as markdown:
+        size = markdown.seek(0, 2)
+        markdown.seek(start)
+        data = markdown.read(end - start)
+    return DocumentPage(
+        document=markdown_path.name,
+        unit=unit,
+        number=number,
+        total=total,
+        start=start,
+        end=end,
+        size_bytes=size,
+        content_hash=content_hash(data),
+        content=data.decode("utf-8", errors="replace"),
+    )
+
+
+def _is_continuation(byte: int) -> bool:
+    return byte & 0xC0 == 0x80
@@ -0,0 +1,208 @@
+"""Registries of the converters and retrievers, dispatching in one lookup.
+
+Converters are registered under file extensions (``.pdf``) and MIME types
+(``application/pdf``), retrievers under URL schemes (``https``, and ``file``
+for local paths). An implementation is registered by its import path, such as
+``document_collection.converters.pdf_converter:PdfConverter``. It is imported
+when first requested, and its single instance serves every document after.
+
+Other packages add implementations through entry points. The name of an entry
+point is the key it serves and its value the class::
+
+    [project.entry-points."document_collection.converters"]
+    ".rtf" = "rtf_plugin:RtfConverter"
+    "application/rtf" = "rtf_plugin:RtfConverter"
+
+Entry points are read at the first lookup and take precedence over the
+implementations registered here.
+"""
+
+import importlib
+import logging
+import threading
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .types import (
+    CONVERTER_PLUGIN_GROUP,
+    LOCAL_SCHEME,
+    RETRIEVER_PLUGIN_GROUP,
+    SUPPORTED_EXTENSIONS,
+)
+
+if TYPE_CHECKING:
+    from .interfaces import DocumentConverter, DocumentRetriever
+
+logger = logging.getLogger(__name__)
+
+
+class _Implementation[T]:
+    """A registered implementation, with its class and instance once loaded."""
+
+    __slots__ = ("target", "cls", "instance")
+
+    def __init__(self, target: str | type[T]) -> None:
+        self.target = target
+        self.cls: type[T] | None = target if isinstance(target, type) else None
+        self.instance: T | None = None
+
+
+class Registry[T]:
+    """Map keys to lazily loaded implementations shared by all callers."""
+
+    def __init__(self, kind: str, plugin_group: str | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            kind: What the registry holds, used in log messages
+            plugin_group: Entry point group read at the first lookup
+
+        """
+        self.kind = kind
+        self.plugin_group = plugin_group
+        self._keys: dict[str, _Implementation[T]] = {}
+        self._targets: dict[str | type[T], _Implementation[T]] = {}
+        self._plugins_loaded = plugin_group is None
+        self._lock = threading.Lock()
+
+    def register(self, target: str | type[T], *keys: str) -> None:
+        """Serve the keys with an implementation, replacing earlier registrations.
+
+        Args:
+            target: The class, or its import path as ``"module:Class"``
+            *keys: Extensions, MIME types or URL schemes, matched case-insensitively
+
+        """
+        # Keys of the same implementation share one instance
+        implementation = self._targets.setdefault(target, _Implementation(target))
+        for key in keys:
+            self._keys[key.lower()] = implementation
+
+    def get(self, *keys: str) -> T | None:
+        """Return the shared instance serving the first registered key.
+
+        Args:
+            *keys: Keys to try in order
+
+        Returns:
+            The implementation, or None when no key is registered
+
+        """
+        implementation = self._find(keys)
+        if implementation is None:
+            return None
+        if implementation.instance is None:
+            with self._lock:
+                if implementation.instance is None:
+                    implementation.instance = self._load(implementation)()
+        return implementation.instance
+
+    def load(self, *keys: str) -> type[T] | None:
+        """Return the class serving the first registered key, without instantiating it."""
+        implementation = self._find(keys)
+        if implementation is None:
+            return None
+        return self._load(implementation)
+
+    def keys(self) -> list[str]:
+        """Return the registered keys."""
+        self._load_plugins()
+        return sorted(self._keys)
+
+    def _find(self, keys: tuple[str, ...]) -> _Implementation[T] | None:
+        """Look the keys up in order."""
+        if not self._plugins_loaded:
+            self._load_plugins()
+        for key in keys:
+            implementation = self._keys.get(key.lower())
+            if implementation is not None:
+                return implementation
+        return None
+
+    def _load(self, implementation: _Implementation[T]) -> type[T]:
+        """Import the class of an implementation registered by its path."""
+        if implementation.cls is None:
+            module, _, name = str(implementation.target).partition(":")
+            implementation.cls = getattr(importlib.import_module(module), name)
+        return implementation.cls
+
+    def _load_plugins(self) -> None:
+        """Register the entry points of the plugin group, once."""
+        # Reading the installed distributions is only paid for at the first lookup
+        from importlib.metadata import entry_points
+
+        with self._lock:
+            if self._plugins_loaded or self.plugin_group is None:
+                return
+            for entry_point in entry_points(group=self.plugin_group):
+                logger.debug(
+                    "Registered %s plugin %s for %s",
+                    self.kind,
+                    entry_point.value,
+                    entry_point.name,
+                )
+                self.register(
+                    f"{entry_point.module}:{entry_point.attr}", entry_point.name
+                )
+            self._plugins_loaded = True
+
+
+def source_extension(source: str) -> str:
+    """Return the lowercase extension, with its dot, of a path or URL."""
+    path = urlsplit(source).path if "://" in source else source
+    return PurePosixPath(path).suffix.lower()
+
+
+def source_scheme(source: str) -> str:
+    """Return the lowercase URL scheme of a source, ``file`` for local paths."""
+    scheme, separator, _ = source.partition("://")
+    return scheme.lower() if separator else LOCAL_SCHEME
+
+
+converter_registry: "Registry[DocumentConverter]" = Registry(
+    "converter", CONVERTER_PLUGIN_GROUP
+)
+retriever_registry: "Registry[DocumentRetriever]" = Registry(
+    "retriever", RETRIEVER_PLUGIN_GROUP
+)
+
+converter_registry.register(
+    "document_collection.converters.pdf_converter:PdfConverter",
+    ".pdf",
+    SUPPORTED_EXTENSIONS["pdf"],
+)
+converter_registry.register(
+    "document_collection.converters.word_converter:WordConverter",
+    ".docx",
+    SUPPORTED_EXTENSIONS["docx"],
+)
+converter_registry.register(
+    "document_collection.converters.powerpoint_converter:PowerPointConverter",
+    ".pptx",
+    SUPPORTED_EXTENSIONS["pptx"],
+)
+converter_registry.register(
+    "document_collection.converters.excel_converter:ExcelConverter",
+    ".xlsx",
+    SUPPORTED_EXTENSIONS["xlsx"],
+)
+converter_registry.register(
+    "document_collection.converters.html_converter:HtmlConverter",
+    ".html",
+    ".htm",
+    SUPPORTED_EXTENSIONS["html"],
+    "application/xhtml+xml",
+)
+converter_registry.register(
+    "document_collection.converters.markdown_processor:MarkdownProcessor",
+    ".md",
+    SUPPORTED_EXTENSIONS["md"],
+)
+
+retriever_registry.register(
+    "document_collection.retrievers.web_retriever:WebHttpRetriever", "http", "https"
+)
+retriever_registry.register(
+    "document_collection.retrievers.local_retriever:LocalFileRetriever", LOCAL_SCHEME
+)
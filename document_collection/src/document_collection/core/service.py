@@ -1,12 +1,25 @@
 """Document collection service - main orchestration logic."""
 
+import asyncio
 import logging
+import sqlite3
+import threading
 import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from ..converters.factory import ConverterFactory
+from ..converters.worker_pool import shutdown_worker_pool
 from ..retrievers.factory import RetrieverFactory
+from ..search.duplicates import DuplicateIndex, minhash_signature
+from ..search.index import SearchIndex
+from .chunking import write_chunk_index
 from .config import get_config
 from .exceptions import ValidationError
 from .models import (
@@ -14,9 +27,25 @@ from .models import (
     CollectionResult,
     DocumentFormat,
     DocumentMetadata,
+    DocumentPage,
+    DocumentSection,
     DocumentSource,
+    DuplicateMatch,
+    SearchHit,
     SourceType,
 )
+from .outline import find_heading, load_outline, outline_path, read_section
+from .pages import read_range, read_unit
+from .singleflight import SingleFlight
+from .sniffer import FormatSniffer, trusted_format
+from .types import (
+    DEFAULT_DEDUPE_TTL,
+    DEFAULT_RANGE_BYTES,
+    DEFAULT_SEARCH_LIMIT,
+    DUPLICATE_INDEX_FILE,
+    DUPLICATE_MODES,
+    STATE_DIRECTORY,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +59,56 @@ class DocumentCollectionService:
         self.config = get_config()
         self.retriever_factory = RetrieverFactory()
         self.converter_factory = ConverterFactory()
+        self.http_session = self._create_session()
+        self._flights: SingleFlight[CollectionResult] = SingleFlight(
+            ttl=float(self.config.get("dedupe_ttl", DEFAULT_DEDUPE_TTL)),
+            remember=_is_reusable,
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
         logger.debug(
             "DocumentCollectionService initialized with config: %s", self.config
         )
 
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session whose connections are reused across downloads."""
+        session = requests.Session()
+        session.headers["User-Agent"] = self.config.get("user_agent")
+        session.verify = bool(self.config.get("verify_ssl", True))
+        adapter = HTTPAdapter(pool_maxsize=max(self.config.max_workers, 10))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def warm_up(self) -> list[str]:
+        """Preload the converters' parser libraries.
+
+        Returns:
+            Names of the libraries that were loaded
+
+        """
+        loaded = self.converter_factory.warm_up()
+        logger.debug("Preloaded converter libraries: %s", loaded)
+        return loaded
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the collection threads and processes."""
+        self.http_session.close()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        shutdown_worker_pool()
+
     async def collect_document(
         self, source: str, destination_path: Path | None = None, **options: Any
     ) -> CollectionResult:
         """Collect a single document.
 
+        Concurrent requests for the same source, destination and options
+        share one retrieval and conversion, and a successful result is
+        reused for identical requests within the ``dedupe_ttl`` setting.
+
         Args:
             source: Source file path or URL
             destination_path: Destination directory
@@ -51,6 +121,50 @@ class DocumentCollectionService:
             DocumentCollectionError: If collection fails
 
         """
+        if destination_path is None:
+            destination_path = self.config.destination_path
+        key = _flight_key(source, destination_path, options)
+
+        def run() -> Awaitable[CollectionResult]:
+            return self._collect_document(source, destination_path, **options)
+
+        result = await self._flights.do(key, run)
+        if not _is_reusable(result) and result.success:
+            # A memoised output was removed since; collect again
+            self._flights.forget(key)
+            result = await self._flights.do(key, run)
+        # Every caller gets its own copy of the shared result
+        return result.model_copy(deep=True)
+
+    async def _collect_document(
+        self, source: str, destination_path: Path | None = None, **options: Any
+    ) -> CollectionResult:
+        """Collect a single document without coalescing, in a collection thread.
+
+        Retrieval, conversion and the indexes built afterwards block while
+        they run, so they get an event loop of their own in one of
+        ``max_workers`` threads. The caller's loop stays free to serve other
+        requests, however long the document takes.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._collection_threads(),
+            lambda: asyncio.run(self._collect_now(source, destination_path, **options)),
+        )
+
+    def _collection_threads(self) -> ThreadPoolExecutor:
+        """Return the threads collecting documents, starting them on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers, thread_name_prefix="collect"
+                )
+            return self._executor
+
+    async def _collect_now(
+        self, source: str, destination_path: Path | None = None, **options: Any
+    ) -> CollectionResult:
+        """Collect a single document on the running event loop."""
         start_time = time.time()
         logger.debug("Collecting document from source: %s", source)
         logger.debug("Options: %s", options)
@@ -73,15 +187,24 @@ class DocumentCollectionService:
             )
 
             # Get appropriate retriever
-            retriever = self.retriever_factory.get_retriever(source)
+            retriever = self.retriever_factory.get_retriever(
+                source, session=self.http_session
+            )
 
-            # Retrieve document
+            # Retrieve document, detecting its format from the bytes read
+            sniffer = FormatSniffer()
             retrieved_path = await retriever.retrieve(
                 source=source,
                 destination=destination_path,
                 request_id=str(hash(source)),
+                sniffer=sniffer,
                 **options,
             )
+            if not sniffer.seen:
+                # A retriever that does not feed the sniffer
+                with open(retrieved_path, "rb") as f:
+                    sniffer.feed(f.read(sniffer.limit))
+            detected_format = trusted_format(sniffer.detect(), source)
 
             # Get metadata
             metadata = retriever.get_metadata(source)
@@ -110,24 +233,107 @@ class DocumentCollectionService:
                     modified_at=None,
                     checksum=None,
                 )
+            if detected_format is not None:
+                # The content wins over a missing, unknown or mismatched extension
+                metadata.format = detected_format
 
             # Convert to markdown if requested and supported
             output_path = retrieved_path
+            conversion_stats: dict[str, Any] = {}
             if request.convert_to_markdown:
                 try:
-                    converter = self.converter_factory.get_converter(source)
+                    converter = self.converter_factory.get_converter(
+                        source, document_format=detected_format
+                    )
                     # Generate output filename with .md extension
                     output_filename = Path(retrieved_path.stem + ".md")
                     markdown_path = destination_path / output_filename
 
                     output_path = await converter.convert(
-                        input_path=retrieved_path, output_path=markdown_path, **options
+                        input_path=retrieved_path,
+                        output_path=markdown_path,
+                        stats=conversion_stats,
+                        **options,
                     )
                 except ValueError:
                     # Converter not available for this file type
                     # Keep original file
                     pass
 
+            # Compare the markdown against documents collected earlier
+            artifacts: dict[str, Path] = {}
+            warnings: list[str] = []
+            duplicates: list[DuplicateMatch] = []
+            mode = options.get(
+                "duplicates", self.config.get("duplicate_detection", "flag")
+            )
+            if mode not in DUPLICATE_MODES:
+                raise ValidationError(
+                    f"Unknown duplicate detection mode: {mode}",
+                    field="duplicates",
+                    value=mode,
+                )
+            is_markdown = output_path.suffix.lower() == ".md" and output_path.is_file()
+            try:
+                if mode != "off" and is_markdown:
+                    duplicates = self._register_signature(
+                        output_path, destination_path, options, keep=mode != "skip"
+                    )
+                elif is_markdown:
+                    # The signature of an overwritten output no longer matches it
+                    self._forget_signature(output_path, destination_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Could not check %s for duplicates: %s", output_path, e)
+                warnings.append(f"Could not check for duplicates: {e}")
+            skipped = False
+            if duplicates:
+                best = duplicates[0]
+                warnings.append(
+                    f"Near-duplicate of {best.document} (similarity {best.similarity:.2f})"
+                )
+                if mode == "skip" and best.document.is_file():
+                    logger.info(
+                        "Skipping %s, a near-duplicate of %s",
+                        output_path,
+                        best.document,
+                    )
+                    self._discard_copies(
+                        source, {output_path, retrieved_path}, destination_path
+                    )
+                    output_path = best.document
+                    skipped = True
+
+            # Index the markdown so consumers can read it chunk by chunk
+            if not skipped and self._should_chunk(output_path, options):
+                try:
+                    artifacts["chunks"] = write_chunk_index(
+                        output_path,
+                        max_tokens=options.get(
+                            "chunk_max_tokens", self.config.get("chunk_max_tokens")
+                        ),
+                        max_chars=options.get("chunk_max_chars"),
+                    )
+                except OSError as e:
+                    logger.warning("Could not index %s: %s", output_path, e)
+                    warnings.append(f"Could not build chunk index: {e}")
+            if (
+                not skipped
+                and output_path.suffix.lower() == ".md"
+                and outline_path(output_path).is_file()
+            ):
+                artifacts["outline"] = outline_path(output_path)
+
+            # Keep the collection's search index current
+            if not skipped and self._should_index(output_path, options):
+                try:
+                    with SearchIndex(destination_path) as index:
+                        index.add_document(output_path)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(
+                        "Could not add %s to the search index: %s", output_path, e
+                    )
+                    warnings.append(f"Could not update search index: {e}")
+
             processing_time = time.time() - start_time
             logger.debug("Document collection completed in %s seconds", processing_time)
 
@@ -135,11 +341,18 @@ class DocumentCollectionService:
                 success=True,
                 source=source,
                 output_path=output_path,
-                original_path=retrieved_path if output_path != retrieved_path else None,
+                original_path=(
+                    retrieved_path
+                    if output_path != retrieved_path and retrieved_path.exists()
+                    else None
+                ),
                 metadata=metadata,
                 processing_time_seconds=processing_time,
+                conversion_stats=conversion_stats,
+                artifacts=artifacts,
+                duplicates=duplicates,
                 errors=[],
-                warnings=[],
+                warnings=warnings,
             )
 
         except Exception as e:
@@ -158,22 +371,278 @@ class DocumentCollectionService:
                 warnings=[],
             )
 
+    def _should_chunk(self, output_path: Path, options: dict[str, Any]) -> bool:
+        """Check whether a collected document should get a chunk index."""
+        if not options.get("chunk", self.config.get("chunk_documents", True)):
+            return False
+        return output_path.suffix.lower() == ".md" and output_path.is_file()
+
+    def _register_signature(
+        self,
+        markdown_path: Path,
+        destination_path: Path,
+        options: dict[str, Any],
+        keep: bool = True,
+    ) -> list[DuplicateMatch]:
+        """Find near-duplicates of a document and record its signature.
+
+        Args:
+            markdown_path: Converted document
+            destination_path: Collection the document belongs to
+            options: Collection options; ``duplicate_threshold`` overrides the config
+            keep: Record the signature even when duplicates were found; otherwise
+                it is only left out while the best match still exists
+
+        Returns:
+            Earlier documents above the similarity threshold, best match first
+
+        """
+        signature = minhash_signature(
+            markdown_path.read_text(encoding="utf-8", errors="replace")
+        )
+        with DuplicateIndex(destination_path) as index:
+            if signature is None:
+                index.remove(markdown_path)
+                return []
+            threshold = float(
+                options.get(
+                    "duplicate_threshold", self.config.get("duplicate_threshold")
+                )
+            )
+            duplicates = index.find(
+                signature, threshold=threshold, exclude=markdown_path
+            )
+            if keep or not duplicates or not duplicates[0].document.is_file():
+                index.add(markdown_path, signature)
+        return duplicates
+
+    def _forget_signature(self, markdown_path: Path, destination_path: Path) -> None:
+        """Drop the signature of a document from the collection's duplicate index, if any."""
+        if (destination_path / STATE_DIRECTORY / DUPLICATE_INDEX_FILE).is_file():
+            with DuplicateIndex(destination_path) as index:
+                index.remove(markdown_path)
+
+    def _discard_copies(
+        self, source: str, paths: set[Path], destination_path: Path
+    ) -> None:
+        """Remove the files a collection wrote, never touching the source itself."""
+        source_path = Path(source).resolve() if "://" not in source else None
+        for path in paths:
+            if path.resolve() == source_path:
+                continue
+            path.unlink(missing_ok=True)
+            if path.suffix.lower() == ".md":
+                outline_path(path).unlink(missing_ok=True)
+                self._forget_signature(path, destination_path)
+
+    def _should_index(self, output_path: Path, options: dict[str, Any]) -> bool:
+        """Check whether a collected document should be added to the search index."""
+        if not options.get("index", self.config.get("search_index", True)):
+            return False
+        return output_path.suffix.lower() == ".md" and output_path.is_file()
+
+    async def search(
+        self,
+        query: str,
+        destination_path: Path | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        refresh: bool = False,
+    ) -> list[SearchHit]:
+        """Search the sections of the documents in a collection.
+
+        Args:
+            query: Free text query
+            destination_path: Collection directory, defaults to the configured one
+            limit: Maximum number of hits
+            refresh: Index new and changed documents before searching
+
+        Returns:
+            Hits ordered by decreasing BM25 score
+
+        """
+        root = destination_path or self.config.destination_path
+        if not root.is_dir():
+            raise ValidationError(
+                "Collection directory does not exist",
+                field="destination_path",
+                value=str(root),
+            )
+        with SearchIndex(root) as index:
+            if refresh:
+                index.refresh()
+            return index.search(query, limit=limit)
+
+    async def get_section(
+        self, document_path: str | Path, heading: str
+    ) -> DocumentSection | None:
+        """Read one section of a converted document.
+
+        The heading is looked up in the document's outline sidecar, which is
+        rebuilt if missing or stale, and the section is read with a single
+        seek and read.
+
+        Args:
+            document_path: Path to a converted Markdown document
+            heading: Heading text or heading path such as ``Page 2 > Scope``
+
+        Returns:
+            The section, or None if no heading matches
+
+        Raises:
+            ValidationError: If the document does not exist or is not Markdown
+
+        """
+        path = self._markdown_document(document_path)
+        entry = find_heading(load_outline(path), heading)
+        if entry is None:
+            logger.debug("No section %r in %s", heading, path)
+            return None
+        return read_section(path, entry)
+
+    async def read_range(
+        self, document_path: str | Path, start: int, length: int = DEFAULT_RANGE_BYTES
+    ) -> DocumentPage:
+        """Read a byte range of a converted document.
+
+        Args:
+            document_path: Path to a converted Markdown document
+            start: Byte offset to read from
+            length: Number of bytes to read
+
+        Returns:
+            The range, snapped to character boundaries, with its content hash
+
+        Raises:
+            ValidationError: If the document is not Markdown or the range is outside it
+
+        """
+        return read_range(self._markdown_document(document_path), start, length)
+
+    async def get_page(
+        self, document_path: str | Path, unit: str, number: int
+    ) -> DocumentPage | None:
+        """Read one page, slide or chunk of a converted document.
+
+        Args:
+            document_path: Path to a converted Markdown document
+            unit: ``page``, ``slide`` or ``chunk``
+            number: Page or slide number as in the source, or chunk index from 0
+
+        Returns:
+            The page with its content hash, or None if there is no such page
+
+        Raises:
+            ValidationError: If the document is not Markdown or the unit is unknown
+
+        """
+        return read_unit(self._markdown_document(document_path), unit, number)
+
+    def _markdown_document(self, document_path: str | Path) -> Path:
+        """Check that a path names an existing Markdown document."""
+        path = Path(document_path)
+        if path.suffix.lower() != ".md" or not path.is_file():
+            raise ValidationError(
+                "Document must be an existing Markdown file",
+                field="document_path",
+                value=str(document_path),
+            )
+        return path
+
     async def collect_documents(
-        self, sources: list[str], destination_path: Path | None = None, **options: Any
+        self,
+        sources: list[str],
+        destination_path: Path | None = None,
+        on_result: Callable[[int, CollectionResult], Awaitable[None]] | None = None,
+        schedule: Callable[
+            [Callable[[], Awaitable[CollectionResult]]], Awaitable[CollectionResult]
+        ]
+        | None = None,
+        **options: Any,
     ) -> list[CollectionResult]:
         """Collect multiple documents.
 
         Args:
             sources: List of source file paths or URLs
             destination_path: Destination directory
+            on_result: Awaited with the position and result of each document
+                as soon as it is collected, for progress reporting
+            schedule: Runs the collection of one document when a scheduler
+                shared with other work grants it a slot. Documents are then
+                handed to it all at once and collected concurrently;
+                otherwise they are collected one after another
             **options: Additional processing options
 
         Returns:
-            List of collection results
+            List of collection results, in the order of the sources
 
         """
+        if schedule is not None:
+
+            async def collect(position: int, source: str) -> CollectionResult:
+                result = await schedule(
+                    lambda: self.collect_document(source, destination_path, **options)
+                )
+                if on_result is not None:
+                    await on_result(position, result)
+                return result
+
+            return list(
+                await asyncio.gather(
+                    *(
+                        collect(position, source)
+                        for position, source in enumerate(sources)
+                    )
+                )
+            )
+
         results = []
-        for source in sources:
+        for position, source in enumerate(sources):
             result = await self.collect_document(source, destination_path, **options)
             results.append(result)
+            if on_result is not None:
+                await on_result(position, result)
         return results
+
+
+def _flight_key(source: str, destination_path: Path, options: dict[str, Any]) -> tuple:
+    """Identify a collection request for coalescing.
+
+    URLs are compared without fragment and with scheme and host in lower
+    case. Local files are compared by resolved path, size and modification
+    time, so an edited file is collected again.
+    """
+    if source.lower().startswith(("http://", "https://")):
+        parts = urlsplit(source.strip())
+        normalised = urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path or "/",
+                parts.query,
+                "",
+            )
+        )
+        version: tuple[int, int] | None = None
+    else:
+        path = Path(source).expanduser().resolve()
+        normalised = str(path)
+        try:
+            stat = path.stat()
+            version = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            version = None
+    return (
+        normalised,
+        version,
+        str(destination_path.resolve()),
+        repr(sorted(options.items())),
+    )
+
+
+def _is_reusable(result: CollectionResult) -> bool:
+    """Check whether a result can be handed to an identical later request."""
+    return (
+        result.success
+        and result.output_path is not None
+        and result.output_path.exists()
+    )
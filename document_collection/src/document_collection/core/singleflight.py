@@ -0,0 +1,87 @@
+"""Coalescing of concurrent identical operations."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[T]:
+    """Run at most one operation per key at a time and share its result.
+
+    Callers that ask for a key while an operation for it is in flight wait
+    for that operation instead of starting their own. The operation runs in
+    its own task, so one caller being cancelled does not cancel it for the
+    others. Results accepted by ``remember`` are kept for ``ttl`` seconds and
+    returned to later callers without running the operation again.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        remember: Callable[[T], bool] | None = None,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            ttl: Seconds a completed result is reused; 0 disables the memo
+            remember: Decides whether a result may be memoised; all are by default
+            max_entries: Memo size above which expired entries are purged
+
+        """
+        self.ttl = ttl
+        self._remember = remember
+        self._max_entries = max_entries
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self._memo: dict[Hashable, tuple[float, T]] = {}
+
+    async def do(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``operation`` for ``key``, sharing it between callers.
+
+        Args:
+            key: Identity of the operation
+            operation: Starts the operation; only called when nothing is in
+                flight or memoised for the key
+
+        Returns:
+            The operation's result; exceptions propagate to every waiting caller
+
+        """
+        memoised = self._memo.get(key)
+        if memoised is not None:
+            expires, result = memoised
+            if expires > time.monotonic():
+                return result
+            del self._memo[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the memoised result of a key."""
+        self._memo.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Number of operations currently running."""
+        return len(self._in_flight)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Retire a finished operation and memoise its result."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if self.ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if self._remember is not None and not self._remember(result):
+            return
+        if len(self._memo) >= self._max_entries:
+            now = time.monotonic()
+            self._memo = {k: entry for k, entry in self._memo.items() if entry[0] > now}
+            if len(self._memo) >= self._max_entries:
+                # Still full of live entries: drop the oldest
+                del self._memo[next(iter(self._memo))]
+        self._memo[key] = (time.monotonic() + self.ttl, result)
@@ -0,0 +1,193 @@
+"""Detect the format of a document from its first bytes.
+
+Retrievers feed the chunks they read to a FormatSniffer, which keeps the
+first few kilobytes; the format is then known without reading the document
+again. The signatures recognised are:
+
+- PDF: the ``%PDF-`` header, at the start of the document after any byte
+  order mark or whitespace
+- Office Open XML: a ZIP archive whose ``[Content_Types].xml`` names the main
+  part of a Word, PowerPoint or Excel document, or whose parts live under
+  ``word/``, ``ppt/`` or ``xl/``
+- HTML: a document opening with a doctype, ``<html>``, ``<head>`` or
+  ``<body>`` tag, after any comments
+
+Anything else, Markdown and plain text included, is left to the extension.
+A detected format only overrides an extension that is missing or unknown,
+or a binary format's extension when the content is binary too: text can
+quote a PDF header, but a PDF or ZIP archive cannot be a text file.
+"""
+
+import struct
+import zlib
+
+from .models import DocumentFormat
+from .registry import source_extension
+from .types import SNIFF_BYTES
+
+# Local file header of a ZIP entry, up to the lengths of its name and extra field
+_ZIP_ENTRY = struct.Struct("<4s2x2H8x2I2H")
+_ZIP_SIGNATURE = b"PK\x03\x04"
+_ZIP_DATA_DESCRIPTOR = 0x08
+_ZIP_DEFLATED = 8
+
+_CONTENT_TYPES = b"[Content_Types].xml"
+_OOXML_MAIN_PARTS = (
+    (b"wordprocessingml.document.main+xml", DocumentFormat.WORD),
+    (b"presentationml.presentation.main+xml", DocumentFormat.POWERPOINT),
+    (b"spreadsheetml.sheet.main+xml", DocumentFormat.EXCEL),
+)
+_OOXML_DIRECTORIES = (
+    (b"word/", DocumentFormat.WORD),
+    (b"ppt/", DocumentFormat.POWERPOINT),
+    (b"xl/", DocumentFormat.EXCEL),
+)
+
+# Tags that only open HTML documents; fragments such as "<p>" or "<div>" also
+# start Markdown files, so they are not taken as HTML
+_HTML_TAGS = (b"<!doctype html", b"<html", b"<head", b"<body")
+_WHITESPACE = b" \t\n\r\x0c"
+_UTF8_BOM = b"\xef\xbb\xbf"
+_TAG_ENDS = {b">", b"/", *(bytes([byte]) for byte in _WHITESPACE)}
+_PDF_SIGNATURE = b"%PDF-"
+
+# Formats recognised by a binary signature rather than by text
+_BINARY_FORMATS = frozenset(
+    {
+        DocumentFormat.PDF,
+        DocumentFormat.WORD,
+        DocumentFormat.POWERPOINT,
+        DocumentFormat.EXCEL,
+    }
+)
+
+
+class FormatSniffer:
+    """Keep the first bytes of a document as it is read and detect its format."""
+
+    def __init__(self, limit: int = SNIFF_BYTES) -> None:
+        """Initialize the sniffer.
+
+        Args:
+            limit: Number of leading bytes kept for detection
+
+        """
+        self.limit = limit
+        self._head = bytearray()
+
+    @property
+    def complete(self) -> bool:
+        """Whether enough bytes were seen; later chunks need not be fed."""
+        return len(self._head) >= self.limit
+
+    @property
+    def seen(self) -> bool:
+        """Whether any bytes were fed."""
+        return bool(self._head)
+
+    def feed(self, chunk: bytes) -> None:
+        """Take the next chunk of the document."""
+        if not self.complete:
+            self._head += chunk[: self.limit - len(self._head)]
+
+    def detect(self) -> DocumentFormat | None:
+        """Return the format of the bytes fed, or None if unrecognised."""
+        return detect_format(bytes(self._head))
+
+
+def detect_format(head: bytes) -> DocumentFormat | None:
+    """Detect a document format from its leading bytes.
+
+    Args:
+        head: The first bytes of the document; a few kilobytes suffice
+
+    Returns:
+        The detected format, or None if the bytes match no signature
+
+    """
+    if head.removeprefix(_UTF8_BOM).lstrip(_WHITESPACE).startswith(_PDF_SIGNATURE):
+        return DocumentFormat.PDF
+    if head.startswith(_ZIP_SIGNATURE):
+        return _ooxml_format(head)
+    if _is_html(head):
+        return DocumentFormat.HTML
+    return None
+
+
+def trusted_format(
+    detected: DocumentFormat | None, source: str
+) -> DocumentFormat | None:
+    """Decide whether a detected format overrides the extension of a source.
+
+    Args:
+        detected: Format detected from the content, if any
+        source: Path or URL of the document
+
+    Returns:
+        The format to convert the document as, or None to go by its extension
+
+    """
+    if detected is None:
+        return None
+    try:
+        claimed = DocumentFormat(source_extension(source).lstrip("."))
+    except ValueError:
+        # No extension, or one that names no known format
+        return detected
+    if detected in _BINARY_FORMATS and claimed in _BINARY_FORMATS:
+        return detected
+    return None
+
+
+def _ooxml_format(head: bytes) -> DocumentFormat | None:
+    """Tell Word, PowerPoint and Excel archives apart by their first entries."""
+    offset = 0
+    while offset + _ZIP_ENTRY.size <= len(head):
+        signature, flags, method, size, _, name_length, extra_length = (
+            _ZIP_ENTRY.unpack_from(head, offset)
+        )
+        if signature != _ZIP_SIGNATURE:
+            break
+        name_start = offset + _ZIP_ENTRY.size
+        name = head[name_start : name_start + name_length]
+        data_start = name_start + name_length + extra_length
+        # Without sizes in the header, the entry runs to an unknown end
+        streamed = bool(flags & _ZIP_DATA_DESCRIPTOR)
+        data = head[data_start:] if streamed else head[data_start : data_start + size]
+
+        if name == _CONTENT_TYPES:
+            content_types = _inflate(data) if method == _ZIP_DEFLATED else data
+            for marker, document_format in _OOXML_MAIN_PARTS:
+                if marker in content_types:
+                    return document_format
+        for directory, document_format in _OOXML_DIRECTORIES:
+            if name.startswith(directory):
+                return document_format
+
+        if streamed:
+            break
+        offset = data_start + size
+    return None
+
+
+def _inflate(data: bytes) -> bytes:
+    """Decompress as much of a deflated entry as the bytes at hand allow."""
+    try:
+        return zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+    except zlib.error:
+        return b""
+
+
+def _is_html(head: bytes) -> bool:
+    """Check whether a document opens with an HTML document tag."""
+    text = head.removeprefix(_UTF8_BOM).lstrip(_WHITESPACE).lower()
+    while text.startswith(b"<!--"):
+        end = text.find(b"-->")
+        if end < 0:
+            return False
+        text = text[end + 3 :].lstrip(_WHITESPACE)
+    for tag in _HTML_TAGS:
+        # The tag name must end there, so "<header" is not "<head"
+        if text.startswith(tag) and text[len(tag) : len(tag) + 1] in _TAG_ENDS:
+            return True
+    return False
@@ -136,6 +136,59 @@ MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
 MAX_BATCH_SIZE = 1000  # Maximum files in batch
 MAX_CONCURRENT_DOWNLOADS = 10
 
+# Working state kept next to the collected documents (caches, indexes)
+STATE_DIRECTORY = ".collection"
+PDF_PAGE_CACHE_FILE = "pdf_pages.sqlite"
+
+# Chunking of converted documents
+DEFAULT_CHUNK_TOKENS = 800
+CHARS_PER_TOKEN = 4  # Rough average for English text
+CHUNK_INDEX_SUFFIX = ".chunks.json"
+
+# Heading outline written next to converted documents
+OUTLINE_SUFFIX = ".outline.json"
+
+# Seconds a completed collection is reused for identical requests
+DEFAULT_DEDUPE_TTL = 30.0
+
+# Background batch jobs of the MCP server
+JOB_DATABASE_FILE = "jobs.sqlite"
+DEFAULT_JOB_WORKERS = 1
+DEFAULT_JOB_PAGE_SIZE = 50
+MAX_BATCH_RESPONSE_ITEMS = 100
+
+# Admission control of MCP tool calls: calls in flight and waiting per lane
+DEFAULT_COLLECT_CONCURRENCY = 4
+DEFAULT_COLLECT_QUEUE_SIZE = 16
+DEFAULT_INTERACTIVE_CONCURRENCY = 32
+DEFAULT_INTERACTIVE_QUEUE_SIZE = 64
+DEFAULT_ADMISSION_TIMEOUT = 10.0
+
+# Local collection daemon of the CLI
+DAEMON_SOCKET_NAME = "document-collection"
+MAX_DAEMON_MESSAGE_BYTES = 64 * 1024 * 1024
+# Seconds the CLI waits for the daemon to answer a ping or shutdown request,
+# and by default for a collection request
+DAEMON_PING_TIMEOUT = 5.0
+DEFAULT_DAEMON_TIMEOUT = 3600.0
+
+# Paginated reads of converted documents
+DEFAULT_RANGE_BYTES = 16 * 1024
+MAX_RANGE_BYTES = 256 * 1024
+PAGE_UNITS = ("page", "slide", "chunk")
+
+# Full-text search index, kept in the state directory of a collection
+SEARCH_INDEX_DIRECTORY = "search"
+DEFAULT_SEARCH_LIMIT = 10
+
+# Near-duplicate detection of converted documents
+DUPLICATE_INDEX_FILE = "duplicates.sqlite"
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+DUPLICATE_MODES = ("flag", "skip", "off")
+
+# Bytes of a document inspected to detect its format from its content
+SNIFF_BYTES = 8 * 1024
+
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {
     "pdf": "application/pdf",
@@ -143,9 +196,17 @@ SUPPORTED_EXTENSIONS = {
     "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
     "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     "md": "text/markdown",
+    "html": "text/html",
     "txt": "text/plain",
 }
 
+# Entry point groups through which other packages add converters and retrievers
+CONVERTER_PLUGIN_GROUP = "document_collection.converters"
+RETRIEVER_PLUGIN_GROUP = "document_collection.retrievers"
+
+# Registry key of local paths, which have no URL scheme
+LOCAL_SCHEME = "file"
+
 # HTTP related constants
 USER_AGENT = "DocumentCollection/0.1.0"
 ACCEPTED_CONTENT_TYPES = [
@@ -154,5 +215,6 @@ ACCEPTED_CONTENT_TYPES = [
     "application/vnd.openxmlformats-officedocument.presentationml.presentation",
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     "text/markdown",
+    "text/html",
     "text/plain",
 ]
@@ -0,0 +1,227 @@
+"""Admission control and load shedding for the MCP server.
+
+Tool calls are admitted through lanes. Each lane allows a fixed number of
+calls in flight and keeps a bounded queue of waiting calls; a call that finds
+the queue full, or waits longer than the lane's timeout, is rejected at once
+with a retry hint instead of piling more work onto a saturated host. Cheap
+calls (format listing, reads, searches, job status), single-document
+collection and batch collection use separate lanes, so a burst of batches
+does not keep other calls from being admitted.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
+
+from ..core.config import Configuration
+from ..core.exceptions import DocumentCollectionError
+from ..core.types import (
+    DEFAULT_ADMISSION_TIMEOUT,
+    DEFAULT_COLLECT_CONCURRENCY,
+    DEFAULT_COLLECT_QUEUE_SIZE,
+    DEFAULT_INTERACTIVE_CONCURRENCY,
+    DEFAULT_INTERACTIVE_QUEUE_SIZE,
+)
+
+# Lanes of the server
+COLLECT_LANE = "collect"
+BULK_LANE = "bulk"
+INTERACTIVE_LANE = "interactive"
+
+# Weight of the latest call in the moving average of call durations
+_DURATION_SMOOTHING = 0.2
+
+
+class ServerBusy(DocumentCollectionError):
+    """Exception raised when a call is shed because its lane is saturated."""
+
+    def __init__(
+        self,
+        message: str,
+        lane: str | None = None,
+        retry_after: float = 1.0,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize server busy error.
+
+        Args:
+            message: Error message
+            lane: Lane that rejected the call
+            retry_after: Suggested seconds to wait before retrying
+            details: Additional error details
+
+        """
+        super().__init__(message, details=details)
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+class Lane:
+    """A concurrency limit with a bounded, time-limited wait queue.
+
+    Slots are handed to waiting calls in arrival order. The lane is used from
+    a single event loop, so its counters need no locking.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, timeout: float) -> None:
+        """Initialize the lane.
+
+        Args:
+            name: Lane name, reported in errors and statistics
+            limit: Maximum number of calls in flight
+            queue_size: Maximum number of calls waiting for a slot
+            timeout: Seconds a call may wait before it is rejected
+
+        """
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = max(0, queue_size)
+        self.timeout = timeout
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._average_duration = 0.0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot of the lane for the duration of the block.
+
+        Raises:
+            ServerBusy: If the queue is full or the wait times out
+
+        """
+        await self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - started
+            self._average_duration += _DURATION_SMOOTHING * (
+                duration - self._average_duration
+            )
+            self._release()
+
+    def retry_after(self) -> float:
+        """Estimate the seconds until a retried call would be admitted."""
+        backlog = (len(self._waiters) + 1) / self.limit
+        return round(max(1.0, self._average_duration * backlog), 1)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the limits, current load and counters of the lane."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._active,
+            "queue_size": self.queue_size,
+            "queue_depth": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "average_duration": round(self._average_duration, 3),
+        }
+
+    async def _acquire(self) -> None:
+        """Take a slot, waiting in the queue if none is free."""
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise self._busy(f"Server busy: {self.name} queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.timeout):
+                await waiter
+        except BaseException as e:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the call gave up
+                self._release()
+            if isinstance(e, TimeoutError):
+                self.timed_out += 1
+                raise self._busy(
+                    f"Server busy: no {self.name} slot within {self.timeout:g}s"
+                ) from None
+            raise
+        self.admitted += 1
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiting call, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _busy(self, message: str) -> ServerBusy:
+        retry_after = self.retry_after()
+        return ServerBusy(
+            f"{message}, retry after {retry_after:g}s",
+            lane=self.name,
+            retry_after=retry_after,
+            details=self.stats(),
+        )
+
+
+class AdmissionController:
+    """The lanes of the server, by name."""
+
+    def __init__(self, lanes: list[Lane]) -> None:
+        """Initialize the controller.
+
+        Args:
+            lanes: Lanes calls are admitted through
+
+        """
+        self.lanes = {lane.name: lane for lane in lanes}
+
+    @classmethod
+    def from_config(cls, config: Configuration) -> "AdmissionController":
+        """Create the collect, bulk and interactive lanes from the configuration.
+
+        The bulk lane for batches has the same limits as the collect lane.
+        """
+        timeout = float(config.get("admission_timeout", DEFAULT_ADMISSION_TIMEOUT))
+        collect_limit = int(
+            config.get("collect_concurrency", DEFAULT_COLLECT_CONCURRENCY)
+        )
+        collect_queue = int(
+            config.get("collect_queue_size", DEFAULT_COLLECT_QUEUE_SIZE)
+        )
+        return cls(
+            [
+                Lane(COLLECT_LANE, collect_limit, collect_queue, timeout),
+                Lane(BULK_LANE, collect_limit, collect_queue, timeout),
+                Lane(
+                    INTERACTIVE_LANE,
+                    int(
+                        config.get(
+                            "interactive_concurrency", DEFAULT_INTERACTIVE_CONCURRENCY
+                        )
+                    ),
+                    int(
+                        config.get(
+                            "interactive_queue_size", DEFAULT_INTERACTIVE_QUEUE_SIZE
+                        )
+                    ),
+                    timeout,
+                ),
+            ]
+        )
+
+    def admit(self, lane: str) -> AbstractAsyncContextManager[None]:
+        """Return a context manager holding a slot of the named lane."""
+        return self.lanes[lane].admit()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of every lane."""
+        return {name: lane.stats() for name, lane in self.lanes.items()}
@@ -0,0 +1,159 @@
+"""Fair scheduling of document conversions between the clients of the server.
+
+Conversions are granted a limited number of slots. Waiting conversions are
+kept in one queue per client and the queues are served by deficit
+round-robin, so a client with a thousand queued documents gets the same share
+of the slots as a client with one. Interactive work (single documents) is
+served before bulk work (batches and background jobs), so it only waits for a
+slot to free up, never behind a batch.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+
+class _Request(NamedTuple):
+    """A conversion waiting for a slot."""
+
+    grant: asyncio.Future[None]
+    cost: float
+
+
+class _Flows:
+    """Per-client queues of one priority class, served by deficit round-robin."""
+
+    def __init__(self, quantum: float) -> None:
+        self.quantum = quantum
+        self.queues: dict[str, deque[_Request]] = {}
+        self.deficits: dict[str, float] = {}
+        self.active: deque[str] = deque()
+
+    def push(self, client: str, request: _Request) -> None:
+        """Queue a request behind the earlier requests of its client."""
+        if client not in self.queues:
+            self.queues[client] = deque()
+            self.deficits[client] = 0.0
+            self.active.append(client)
+        self.queues[client].append(request)
+
+    def pop(self) -> _Request | None:
+        """Take the next request in deficit round-robin order."""
+        while self.active:
+            client = self.active[0]
+            queue = self.queues[client]
+            # Callers that gave up while waiting leave cancelled requests
+            while queue and queue[0].grant.done():
+                queue.popleft()
+            if not queue:
+                self._retire()
+                continue
+            if self.deficits[client] < queue[0].cost:
+                # A new round for this client
+                self.deficits[client] += self.quantum
+                if self.deficits[client] < queue[0].cost:
+                    self.active.rotate(-1)
+                    continue
+            request = queue.popleft()
+            self.deficits[client] -= request.cost
+            if not queue:
+                self._retire()
+            elif self.deficits[client] < queue[0].cost:
+                self.active.rotate(-1)
+            return request
+        return None
+
+    def depth(self) -> int:
+        """Number of requests waiting in this class."""
+        return sum(len(queue) for queue in self.queues.values())
+
+    def _retire(self) -> None:
+        """Drop the client at the head of the round, its queue being empty."""
+        client = self.active.popleft()
+        del self.queues[client]
+        del self.deficits[client]
+
+
+class FairScheduler:
+    """Share conversion slots fairly between clients, interactive work first.
+
+    The scheduler is used from a single event loop, so its state needs no
+    locking.
+    """
+
+    def __init__(self, capacity: int, quantum: float = 1.0) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            capacity: Maximum number of conversions running at the same time
+            quantum: Cost a client may spend per round; with the default of
+                1 and one document costing 1, clients take turns document by
+                document
+
+        """
+        self.capacity = max(1, capacity)
+        self._running = 0
+        self._interactive = _Flows(quantum)
+        self._bulk = _Flows(quantum)
+
+    async def run[T](
+        self,
+        client: str,
+        operation: Callable[[], Awaitable[T]],
+        bulk: bool = False,
+        cost: float = 1.0,
+    ) -> T:
+        """Run an operation once the client's turn for a slot comes.
+
+        Args:
+            client: Identity of the client (session) the work belongs to
+            operation: Starts the work; called when a slot is granted
+            bulk: Whether the work is batch work, served after interactive work
+            cost: Share of the client's turn the work uses
+
+        Returns:
+            The result of the operation
+
+        """
+        await self._acquire(client, bulk, cost)
+        try:
+            return await operation()
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the running and waiting work of each priority class."""
+        return {
+            "capacity": self.capacity,
+            "running": self._running,
+            "interactive_queued": self._interactive.depth(),
+            "interactive_clients": len(self._interactive.active),
+            "bulk_queued": self._bulk.depth(),
+            "bulk_clients": len(self._bulk.active),
+        }
+
+    async def _acquire(self, client: str, bulk: bool, cost: float) -> None:
+        """Take a slot, queueing behind the client's earlier work if none is free."""
+        # Work only waits while every slot is taken
+        if self._running < self.capacity:
+            self._running += 1
+            return
+        grant = asyncio.get_running_loop().create_future()
+        (self._bulk if bulk else self._interactive).push(client, _Request(grant, cost))
+        try:
+            await grant
+        except asyncio.CancelledError:
+            if grant.done() and not grant.cancelled():
+                # The slot was handed over just as the caller was cancelled
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the next request, or free it."""
+        for flows in (self._interactive, self._bulk):
+            request = flows.pop()
+            if request is not None:
+                request.grant.set_result(None)
+                return
+        self._running -= 1
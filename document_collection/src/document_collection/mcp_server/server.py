@@ -6,15 +6,50 @@ document collection tools accessible via the MCP interface. It uses the official
 MCP Python SDK with FastMCP for server implementation.
 """
 
-from collections.abc import Callable
+import asyncio
+import base64
+import hashlib
+import multiprocessing
+import signal
+import socket
+import sys
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import wraps
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote, unquote
 
 import structlog
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
+from starlette.applications import Starlette
 
+from ..core.config import get_config
+from ..core.exceptions import ConfigurationError, ValidationError
+from ..core.jobs import JobScheduler, JobStore
+from ..core.models import DocumentPage
+from ..core.pages import load_chunks, unit_headings
 from ..core.service import DocumentCollectionService
+from ..core.types import (
+    DEFAULT_COLLECT_CONCURRENCY,
+    DEFAULT_JOB_PAGE_SIZE,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_RANGE_BYTES,
+    DEFAULT_SEARCH_LIMIT,
+    JOB_DATABASE_FILE,
+    MAX_BATCH_RESPONSE_ITEMS,
+    STATE_DIRECTORY,
+)
+from .admission import (
+    BULK_LANE,
+    COLLECT_LANE,
+    INTERACTIVE_LANE,
+    AdmissionController,
+    ServerBusy,
+)
+from .fairness import FairScheduler
 
 # Configure structured logging
 logger = structlog.get_logger(__name__)
@@ -22,6 +57,9 @@ logger = structlog.get_logger(__name__)
 # Define a type alias for the decorator
 Decorator = Callable[[Callable[..., Any]], Callable[..., Any]]
 
+# Collected documents are exposed as resources below this URI
+RESOURCE_BASE = "document://collection"
+
 
 class CollectDocumentRequest(BaseModel):
     """Request model for single document collection."""
@@ -63,6 +101,21 @@ class CollectionResult(BaseModel):
     )
 
 
+class BatchResult(CollectionResult):
+    """Result model for batch collection, with lists capped in size."""
+
+    total_collected: int = Field(default=0, description="Number of collected documents")
+    total_failed: int = Field(default=0, description="Number of sources that failed")
+    truncated: bool = Field(
+        default=False, description="Whether the lists were cut to the first entries"
+    )
+    job_id: str | None = Field(default=None, description="Job holding the full results")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for get_job_status to page through all results",
+    )
+
+
 class FormatInfo(BaseModel):
     """Information about supported file formats."""
 
@@ -71,13 +124,168 @@ class FormatInfo(BaseModel):
     file_extensions: list[str] = Field(description="Supported file extensions")
 
 
+# Service shared by all tool calls, so HTTP connections, caches and loaded
+# parsers outlive a single request
+_service: DocumentCollectionService | None = None
+# Background scheduler of batch jobs, sharing the service
+_scheduler: JobScheduler | None = None
+# Sessions currently running; the HTTP transport runs the lifespan per session
+_active_sessions = 0
+# Concurrency limits of tool calls, shared by all sessions
+_admission: AdmissionController | None = None
+# Conversion slots shared fairly between sessions and background jobs
+_fair_scheduler: FairScheduler | None = None
+# Whether this process resumes unfinished jobs; one of several HTTP workers does
+_resume_jobs = True
+
+# Hosts FastMCP protects against DNS rebinding
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def get_service() -> DocumentCollectionService:
+    """Return the long-lived service of this server, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = DocumentCollectionService()
+    return _service
+
+
+def close_service() -> None:
+    """Close the shared service; the next call to get_service creates a new one."""
+    global _service
+    if _service is not None:
+        _service.close()
+        _service = None
+
+
+def get_scheduler() -> JobScheduler:
+    """Return the job scheduler of this server, creating it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        config = get_config()
+        database = config.get("job_database") or (
+            Path(config.get("mcp_resource_root", "output"))
+            / STATE_DIRECTORY
+            / JOB_DATABASE_FILE
+        )
+        _scheduler = JobScheduler(
+            get_service(),
+            JobStore(Path(database)),
+            workers=int(config.get("job_workers", DEFAULT_JOB_WORKERS)),
+            # Each job is a client of its own, behind interactive work
+            schedule=lambda job_id, operation: get_fair_scheduler().run(
+                f"job:{job_id}", operation, bulk=True
+            ),
+        )
+    return _scheduler
+
+
+def get_admission() -> AdmissionController:
+    """Return the admission controller of this server, creating it on first use."""
+    global _admission
+    if _admission is None:
+        _admission = AdmissionController.from_config(get_config())
+    return _admission
+
+
+def get_fair_scheduler() -> FairScheduler:
+    """Return the scheduler of conversion slots, creating it on first use."""
+    global _fair_scheduler
+    if _fair_scheduler is None:
+        capacity = int(
+            get_config().get("collect_concurrency", DEFAULT_COLLECT_CONCURRENCY)
+        )
+        _fair_scheduler = FairScheduler(capacity)
+    return _fair_scheduler
+
+
+def _client_id(ctx: Context | None) -> str:
+    """Identify the client of a tool call for fair scheduling.
+
+    The client id sent in the request metadata is used when present, else
+    the session; calls made outside an MCP request share one local client.
+    """
+    if ctx is None:
+        return "local"
+    try:
+        return str(ctx.client_id or f"session-{id(ctx.session)}")
+    except ValueError:
+        return "local"
+
+
+def admitted(lane: str) -> Decorator:
+    """Admit calls of a tool through a lane of the admission controller.
+
+    A call shed because the lane is saturated returns an error with a
+    retry_after hint in seconds instead of running.
+    """
+
+    def decorator(tool: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(tool)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                async with get_admission().admit(lane):
+                    return await tool(*args, **kwargs)
+            except ServerBusy as e:
+                logger.warning(
+                    "Tool call rejected", tool=tool.__name__, lane=lane, error=e.message
+                )
+                return {
+                    "success": False,
+                    "message": e.message,
+                    "error": e.message,
+                    "lane": e.lane,
+                    "retry_after": e.retry_after,
+                }
+
+        return wrapper
+
+    return decorator
+
+
+async def close_scheduler() -> None:
+    """Stop the job scheduler; unfinished jobs resume when the server restarts."""
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler.store.close()
+        _scheduler = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Create and warm up the shared service at startup and close it on shutdown.
+
+    The service is closed when the last running session ends.
+    """
+    global _active_sessions
+    service = get_service()
+    if _active_sessions == 0:
+        loaded = await asyncio.to_thread(service.warm_up)
+        logger.info("Converter libraries preloaded", libraries=loaded)
+        get_scheduler().start(resume=_resume_jobs)
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_scheduler()
+            close_service()
+            logger.info("Document collection service closed")
+
+
 # Create FastMCP server instance
-mcp = FastMCP(name="Document Collection Server")
+mcp = FastMCP(name="Document Collection Server", lifespan=lifespan)
 
 
 @mcp.tool()
+@admitted(COLLECT_LANE)
 async def collect_document(
-    url: str, output_dir: str = "output", format_override: str | None = None
+    url: str,
+    output_dir: str = "output",
+    format_override: str | None = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Collect a single document from the specified URL.
 
@@ -93,16 +301,20 @@ async def collect_document(
     logger.info("MCP collect_document called", url=url, output_dir=output_dir)
 
     try:
-        # Initialize the document collection service
-        service = DocumentCollectionService()
+        service = get_service()
 
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Collect the document
-        result = await service.collect_document(
-            source=url, destination_path=output_path, format_override=format_override
+        # Collect the document, ahead of any batch work waiting for a slot
+        result = await get_fair_scheduler().run(
+            _client_id(ctx),
+            lambda: service.collect_document(
+                source=url,
+                destination_path=output_path,
+                format_override=format_override,
+            ),
         )
 
         if result.success:
@@ -143,11 +355,20 @@ async def collect_document(
 
 
 @mcp.tool()
+@admitted(BULK_LANE)
 async def collect_batch(
-    urls: list[str], output_dir: str = "output", format_override: str | None = None
+    urls: list[str],
+    output_dir: str = "output",
+    format_override: str | None = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Collect multiple documents from the specified URLs.
 
+    A progress notification with completed and total counts, bytes and ETA
+    is sent as each document completes. Each list in the response holds at
+    most 100 entries; when a list is truncated, pass next_cursor to
+    get_job_status to page through the results of every document.
+
     Args:
         urls: List of URLs to collect documents from
         output_dir: Output directory for collected documents (default: "output")
@@ -160,16 +381,41 @@ async def collect_batch(
     logger.info("MCP collect_batch called", url_count=len(urls), output_dir=output_dir)
 
     try:
-        # Initialize the document collection service
-        service = DocumentCollectionService()
+        service = get_service()
 
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Collect documents in batch
+        total_count = len(urls)
+        started = time.monotonic()
+        processed = 0
+        bytes_collected = 0
+
+        async def report_progress(position: int, result: Any) -> None:
+            nonlocal processed, bytes_collected
+            processed += 1
+            bytes_collected += _output_size(result)
+            if ctx is None:
+                return
+            elapsed = time.monotonic() - started
+            eta = elapsed / processed * (total_count - processed)
+            await ctx.report_progress(
+                processed,
+                total_count,
+                f"{processed}/{total_count} documents, {bytes_collected} bytes, ETA {eta:.0f}s",
+            )
+
+        # Collect documents in batch, taking turns with other clients
+        client = _client_id(ctx)
         results = await service.collect_documents(
-            sources=urls, destination_path=output_path, format_override=format_override
+            sources=urls,
+            destination_path=output_path,
+            on_result=report_progress,
+            schedule=lambda operation: get_fair_scheduler().run(
+                client, operation, bulk=True
+            ),
+            format_override=format_override,
         )
 
         # Process results
@@ -188,7 +434,6 @@ async def collect_batch(
                     )
 
         success_count = len(collected_files)
-        total_count = len(urls)
 
         logger.info(
             "Batch collection completed",
@@ -197,12 +442,32 @@ async def collect_batch(
             failed=len(failed_urls),
         )
 
-        return CollectionResult(
+        # Keep large responses small; the full results go to the job table
+        truncated = (
+            max(len(collected_files), len(failed_urls), len(errors))
+            > MAX_BATCH_RESPONSE_ITEMS
+        )
+        job_id = None
+        if truncated:
+            store = get_scheduler().store
+            job_id = store.create(
+                urls, output_path, {"format_override": format_override}
+            )
+            store.start(job_id)
+            store.record_many(job_id, enumerate(results))
+            store.finish(job_id, "completed")
+
+        return BatchResult(
             success=success_count > 0,  # Success if at least one document collected
             message=f"Collected {success_count}/{total_count} documents successfully",
-            collected_files=collected_files,
-            failed_urls=failed_urls,
-            errors=errors,
+            collected_files=collected_files[:MAX_BATCH_RESPONSE_ITEMS],
+            failed_urls=failed_urls[:MAX_BATCH_RESPONSE_ITEMS],
+            errors=errors[:MAX_BATCH_RESPONSE_ITEMS],
+            total_collected=success_count,
+            total_failed=len(failed_urls),
+            truncated=truncated,
+            job_id=job_id,
+            next_cursor=_encode_cursor(job_id, 0) if job_id else None,
         ).model_dump()
 
     except Exception as e:
@@ -213,16 +478,162 @@ async def collect_batch(
             error=str(e),
             exc_info=True,
         )
-        return CollectionResult(
+        return BatchResult(
             success=False,
             message=error_msg,
             collected_files=[],
-            failed_urls=urls,
+            failed_urls=urls[:MAX_BATCH_RESPONSE_ITEMS],
             errors=[error_msg],
+            total_failed=len(urls),
+            truncated=len(urls) > MAX_BATCH_RESPONSE_ITEMS,
         ).model_dump()
 
 
 @mcp.tool()
+@admitted(INTERACTIVE_LANE)
+async def submit_batch(
+    urls: list[str], output_dir: str = "output", format_override: str | None = None
+) -> dict[str, Any]:
+    """Queue a batch of documents for collection in the background.
+
+    Returns immediately; use get_job_status to follow the job and
+    cancel_job to stop it.
+
+    Args:
+        urls: List of URLs or file paths to collect
+        output_dir: Output directory for collected documents (default: "output")
+        format_override: Force specific output format for all documents
+
+    Returns:
+        Dictionary with the job id
+
+    """
+    logger.info("MCP submit_batch called", url_count=len(urls), output_dir=output_dir)
+
+    try:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        options = {"format_override": format_override} if format_override else {}
+        job_id = get_scheduler().submit(urls, output_path, options)
+        return {
+            "job_id": job_id,
+            "status": "queued",
+            "total": len(urls),
+            "message": f"Queued {len(urls)} documents as job {job_id}",
+        }
+
+    except Exception as e:
+        error_msg = f"Error submitting batch: {str(e)}"
+        logger.error(
+            "Error in submit_batch", url_count=len(urls), error=str(e), exc_info=True
+        )
+        return {
+            "job_id": None,
+            "status": "failed",
+            "message": error_msg,
+            "error": error_msg,
+        }
+
+
+@mcp.tool()
+@admitted(INTERACTIVE_LANE)
+async def get_job_status(
+    job_id: str = "",
+    offset: int = 0,
+    limit: int = DEFAULT_JOB_PAGE_SIZE,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """Report the progress, throughput and partial results of a batch job.
+
+    Args:
+        job_id: Job id returned by submit_batch or collect_batch
+        offset: Position of the first per-document result to return (default: 0)
+        limit: Maximum number of per-document results (default: 50)
+        cursor: next_cursor of a previous response; replaces job_id and offset
+
+    Returns:
+        Dictionary with the job state, counters, throughput and one page of
+        per-document results; next_cursor is set when more results follow
+
+    """
+    logger.info(
+        "MCP get_job_status called", job_id=job_id, offset=offset, cursor=cursor
+    )
+
+    try:
+        if cursor:
+            job_id, offset = _decode_cursor(cursor)
+        status = get_scheduler().store.get(job_id, offset=offset, limit=limit)
+        if status is None:
+            return {
+                "job_id": job_id,
+                "found": False,
+                "message": f"Unknown job {job_id}",
+            }
+        done = status.completed + status.failed
+        next_cursor = (
+            _encode_cursor(job_id, status.next_offset)
+            if status.next_offset is not None
+            else None
+        )
+        return {
+            "found": True,
+            "message": f"Job {status.status}: {done}/{status.total} documents processed",
+            **status.model_dump(mode="json"),
+            "next_cursor": next_cursor,
+        }
+
+    except Exception as e:
+        error_msg = f"Error reading job status: {str(e)}"
+        logger.error(
+            "Error in get_job_status", job_id=job_id, error=str(e), exc_info=True
+        )
+        return {
+            "job_id": job_id,
+            "found": False,
+            "message": error_msg,
+            "error": error_msg,
+        }
+
+
+@mcp.tool()
+@admitted(INTERACTIVE_LANE)
+async def cancel_job(job_id: str) -> dict[str, Any]:
+    """Cancel a queued or running batch job.
+
+    Documents already collected are kept; the remaining ones are skipped.
+
+    Args:
+        job_id: Job id returned by submit_batch
+
+    Returns:
+        Dictionary telling whether the job was cancelled
+
+    """
+    logger.info("MCP cancel_job called", job_id=job_id)
+
+    try:
+        cancelled = get_scheduler().cancel(job_id)
+        message = (
+            f"Cancelling job {job_id}"
+            if cancelled
+            else f"Job {job_id} is unknown or already finished"
+        )
+        return {"job_id": job_id, "cancelled": cancelled, "message": message}
+
+    except Exception as e:
+        error_msg = f"Error cancelling job: {str(e)}"
+        logger.error("Error in cancel_job", job_id=job_id, error=str(e), exc_info=True)
+        return {
+            "job_id": job_id,
+            "cancelled": False,
+            "message": error_msg,
+            "error": error_msg,
+        }
+
+
+@mcp.tool()
+@admitted(INTERACTIVE_LANE)
 async def list_formats() -> dict[str, Any]:
     """List all supported document formats and their capabilities.
 
@@ -286,6 +697,320 @@ async def list_formats() -> dict[str, Any]:
         }
 
 
+@mcp.tool()
+@admitted(INTERACTIVE_LANE)
+async def get_document_section(document_path: str, heading: str) -> dict[str, Any]:
+    """Read one section of a collected Markdown document.
+
+    Args:
+        document_path: Path to a collected Markdown document
+        heading: Heading text, or a heading path such as "Page 2 > Scope"
+
+    Returns:
+        Dictionary with the section content, or found=False if no heading matches
+
+    """
+    logger.info(
+        "MCP get_document_section called", document_path=document_path, heading=heading
+    )
+
+    try:
+        service = get_service()
+        section = await service.get_section(document_path, heading)
+
+        if section is None:
+            return {
+                "found": False,
+                "message": f"No section matching '{heading}' in {document_path}",
+            }
+        return {
+            "found": True,
+            "message": f"Found section '{section.heading}'",
+            **section.model_dump(),
+        }
+
+    except Exception as e:
+        error_msg = f"Error reading document section: {str(e)}"
+        logger.error(
+            "Error in get_document_section",
+            document_path=document_path,
+            error=str(e),
+            exc_info=True,
+        )
+        return {"found": False, "message": error_msg, "error": error_msg}
+
+
+@mcp.tool()
+@admitted(INTERACTIVE_LANE)
+async def search_documents(
+    query: str, output_dir: str = "output", limit: int = DEFAULT_SEARCH_LIMIT
+) -> dict[str, Any]:
+    """Search the sections of collected documents, ranked by BM25.
+
+    Args:
+        query: Free text query
+        output_dir: Collection directory the documents were collected into (default: "output")
+        limit: Maximum number of results (default: 10)
+
+    Returns:
+        Dictionary with ranked results: document path, section heading, byte
+        range for get_document_section, score and a snippet
+
+    """
+    logger.info("MCP search_documents called", query=query, output_dir=output_dir)
+
+    try:
+        service = get_service()
+        hits = await service.search(
+            query, destination_path=Path(output_dir), limit=limit
+        )
+
+        logger.info("Search completed", query=query, result_count=len(hits))
+        return {
+            "query": query,
+            "results": [hit.model_dump(mode="json") for hit in hits],
+            "total_results": len(hits),
+            "message": f"Found {len(hits)} matching sections",
+        }
+
+    except Exception as e:
+        error_msg = f"Error searching documents: {str(e)}"
+        logger.error(
+            "Error in search_documents", query=query, error=str(e), exc_info=True
+        )
+        return {
+            "query": query,
+            "results": [],
+            "total_results": 0,
+            "message": error_msg,
+            "error": error_msg,
+        }
+
+
+@mcp.tool()
+async def get_server_status() -> dict[str, Any]:
+    """Report the load of the server: calls in flight, queue depth and rejections.
+
+    Returns:
+        Dictionary with the limits and counters of each admission lane and
+        the running and waiting conversions of the fair scheduler
+
+    """
+    lanes = get_admission().stats()
+    busy = [name for name, lane in lanes.items() if lane["queue_depth"] > 0]
+    return {
+        "lanes": lanes,
+        "scheduler": get_fair_scheduler().stats(),
+        "saturated": busy,
+        "message": f"Waiting calls in {', '.join(busy)}"
+        if busy
+        else "Server is not saturated",
+    }
+
+
+def _output_size(result: Any) -> int:
+    """Return the size of a collected document, 0 if there is none."""
+    if not result.success or not result.output_path:
+        return 0
+    try:
+        return Path(result.output_path).stat().st_size
+    except OSError:
+        return 0
+
+
+def _encode_cursor(job_id: str, offset: int) -> str:
+    """Encode a position in the results of a job as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{job_id}:{offset}".encode()).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor made by _encode_cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+
+    """
+    try:
+        job_id, offset = (
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode().split(":")
+        )
+        return job_id, int(offset)
+    except (ValueError, UnicodeError) as e:
+        raise ValidationError("Invalid cursor", field="cursor", value=cursor) from e
+
+
+def _resource_root() -> Path:
+    """Return the collection directory whose documents are served as resources."""
+    return Path(get_config().get("mcp_resource_root", "output")).resolve()
+
+
+def _document_uri(root: Path, path: Path) -> str:
+    """Return the resource URI of a collected document."""
+    return f"{RESOURCE_BASE}/{quote(path.relative_to(root).as_posix(), safe='')}"
+
+
+def _resolve_document(name: str) -> Path:
+    """Map a document name from a resource URI to a Markdown file in the collection.
+
+    Raises:
+        ValidationError: If the name is not a Markdown document inside the collection
+
+    """
+    root = _resource_root()
+    path = (root / unquote(name)).resolve()
+    if not path.is_relative_to(root):
+        raise ValidationError(
+            "Document is outside the collection", field="name", value=name
+        )
+    if path.suffix.lower() != ".md" or not path.is_file():
+        raise ValidationError(
+            "No such Markdown document in the collection", field="name", value=name
+        )
+    return path
+
+
+def _page_result(page: DocumentPage, uri: str, next_uri: str | None) -> dict[str, Any]:
+    """Build the response for one page of a document resource."""
+    return {"uri": uri, "next": next_uri, **page.model_dump()}
+
+
+@mcp.resource(
+    RESOURCE_BASE,
+    name="collected_documents",
+    description="Converted Markdown documents of the collection, with their resource URIs",
+    mime_type="application/json",
+)
+async def list_documents_resource() -> dict[str, Any]:
+    """List the converted documents of the collection."""
+    root = _resource_root()
+    documents = []
+    if root.is_dir():
+        for path in sorted(root.rglob("*.md")):
+            if STATE_DIRECTORY in path.relative_to(root).parts:
+                continue
+            documents.append(
+                {
+                    "name": path.relative_to(root).as_posix(),
+                    "uri": _document_uri(root, path),
+                    "size_bytes": path.stat().st_size,
+                }
+            )
+    return {
+        "root": str(root),
+        "documents": documents,
+        "total_documents": len(documents),
+    }
+
+
+@mcp.resource(
+    RESOURCE_BASE + "/{name}",
+    name="document_overview",
+    description="Size, content hash and page, slide and chunk counts of a collected document",
+    mime_type="application/json",
+)
+async def document_overview_resource(name: str) -> dict[str, Any]:
+    """Describe a collected document and how to read it page by page."""
+    logger.info("MCP document resource read", name=name)
+    path = _resolve_document(name)
+    uri = _document_uri(_resource_root(), path)
+    async with get_admission().admit(INTERACTIVE_LANE):
+        with open(path, "rb") as markdown:
+            digest = hashlib.file_digest(markdown, "sha256").hexdigest()
+        chunks = load_chunks(path).chunks
+    return {
+        "document": path.name,
+        "uri": uri,
+        "size_bytes": path.stat().st_size,
+        "content_hash": "sha256:" + digest,
+        "pages": len(unit_headings(path, "page")),
+        "slides": len(unit_headings(path, "slide")),
+        "chunks": len(chunks),
+        "links": {
+            "first_range": f"{uri}/bytes/0/{DEFAULT_RANGE_BYTES}",
+            "bytes": f"{uri}/bytes/{{start}}/{{length}}",
+            "page": f"{uri}/pages/{{number}}",
+            "slide": f"{uri}/slides/{{number}}",
+            "chunk": f"{uri}/chunks/{{index}}",
+        },
+    }
+
+
+@mcp.resource(
+    RESOURCE_BASE + "/{name}/bytes/{start}/{length}",
+    name="document_bytes",
+    description="A byte range of a collected document, snapped to character boundaries",
+    mime_type="application/json",
+)
+async def document_bytes_resource(name: str, start: int, length: int) -> dict[str, Any]:
+    """Read a byte range of a collected document."""
+    path = _resolve_document(name)
+    async with get_admission().admit(INTERACTIVE_LANE):
+        page = await get_service().read_range(path, start, length)
+    uri = _document_uri(_resource_root(), path)
+    next_uri = (
+        f"{uri}/bytes/{page.end}/{length}" if page.end < page.size_bytes else None
+    )
+    return _page_result(page, f"{uri}/bytes/{start}/{length}", next_uri)
+
+
+async def _read_unit(name: str, unit: str, segment: str, number: int) -> dict[str, Any]:
+    """Read a page, slide or chunk of a collected document."""
+    path = _resolve_document(name)
+    async with get_admission().admit(INTERACTIVE_LANE):
+        page = await get_service().get_page(path, unit, number)
+    if page is None:
+        raise ValidationError(
+            f"{path.name} has no {unit} {number}", field=unit, value=number
+        )
+    uri = _document_uri(_resource_root(), path)
+    following: int | None = None
+    if unit == "chunk":
+        # Chunks are numbered from 0 without gaps
+        if page.total is not None and number + 1 < page.total:
+            following = number + 1
+    else:
+        # Pages and slides keep the numbers of their source, which skips
+        # pages without text
+        following = min(
+            (key for key in unit_headings(path, unit) if key > number), default=None
+        )
+    next_uri = f"{uri}/{segment}/{following}" if following is not None else None
+    return _page_result(page, f"{uri}/{segment}/{number}", next_uri)
+
+
+@mcp.resource(
+    RESOURCE_BASE + "/{name}/pages/{number}",
+    name="document_page",
+    description="One page of a collected PDF document, numbered from 1",
+    mime_type="application/json",
+)
+async def document_page_resource(name: str, number: int) -> dict[str, Any]:
+    """Read one page of a collected document."""
+    return await _read_unit(name, "page", "pages", number)
+
+
+@mcp.resource(
+    RESOURCE_BASE + "/{name}/slides/{number}",
+    name="document_slide",
+    description="One slide of a collected presentation, numbered from 1",
+    mime_type="application/json",
+)
+async def document_slide_resource(name: str, number: int) -> dict[str, Any]:
+    """Read one slide of a collected document."""
+    return await _read_unit(name, "slide", "slides", number)
+
+
+@mcp.resource(
+    RESOURCE_BASE + "/{name}/chunks/{index}",
+    name="document_chunk",
+    description="One token-bounded chunk of a collected document, numbered from 0",
+    mime_type="application/json",
+)
+async def document_chunk_resource(name: str, index: int) -> dict[str, Any]:
+    """Read one chunk of a collected document."""
+    return await _read_unit(name, "chunk", "chunks", index)
+
+
 def run_server() -> None:
     """Run the MCP server with stdio transport.
 
@@ -304,19 +1029,39 @@ def run_server() -> None:
         raise
 
 
-def run_server_http(port: int = 8000) -> None:
+def run_server_http(
+    port: int = 8000, host: str = "127.0.0.1", workers: int = 1
+) -> None:
     """Run the MCP server with HTTP transport.
 
+    With more than one worker, that many server processes bind the same port
+    with SO_REUSEPORT and the kernel spreads connections between them. The
+    workers share the on-disk caches, indexes and job table; the admission
+    and fair scheduling limits apply to each worker. Sessions are stateless
+    in this mode, since consecutive requests may reach different workers.
+
     Args:
         port: Port number for HTTP server (default: 8000)
+        host: Address to bind (default: 127.0.0.1)
+        workers: Number of server processes (default: 1)
+
+    Raises:
+        ConfigurationError: If several workers are asked for on a platform
+            without SO_REUSEPORT
 
     """
-    logger.info("Starting Document Collection MCP Server (HTTP)", port=port)
+    logger.info(
+        "Starting Document Collection MCP Server (HTTP)",
+        host=host,
+        port=port,
+        workers=workers,
+    )
 
     try:
-        # Run with streamable HTTP transport
-        # Note: Port configuration may need to be handled differently
-        mcp.run(transport="streamable-http")
+        if workers <= 1:
+            _serve_http(host, port)
+        else:
+            _run_workers(host, port, workers)
     except KeyboardInterrupt:
         logger.info("HTTP server shutdown requested")
     except Exception as e:
@@ -324,6 +1069,88 @@ def run_server_http(port: int = 8000) -> None:
         raise
 
 
+def _http_app() -> Starlette:
+    """Build the streamable HTTP app, keeping the service warm for the process lifetime.
+
+    FastMCP runs the lifespan once per session (per request when stateless);
+    holding it open for the whole app keeps the service, its connection pool
+    and the job scheduler alive between sessions.
+    """
+    app = mcp.streamable_http_app()
+    session_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def app_lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with lifespan(mcp), session_lifespan(app):
+            yield
+
+    app.router.lifespan_context = app_lifespan
+    return app
+
+
+def _serve_http(host: str, port: int, worker: int | None = None) -> None:
+    """Serve HTTP in this process; ``worker`` is the index of a multi-worker process."""
+    import uvicorn
+
+    global _resume_jobs
+    mcp.settings.host = host
+    mcp.settings.port = port
+    if host not in LOCAL_HOSTS:
+        # As FastMCP does, DNS rebinding protection only applies to local binds
+        mcp.settings.transport_security = None
+
+    sockets = None
+    if worker is not None:
+        mcp.settings.stateless_http = True
+        _resume_jobs = worker == 0
+        sockets = [_reuse_port_socket(host, port)]
+
+    config = uvicorn.Config(
+        _http_app(), host=host, port=port, log_level=mcp.settings.log_level.lower()
+    )
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def _reuse_port_socket(host: str, port: int) -> socket.socket:
+    """Bind a listening socket that other processes can bind to as well."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def _run_workers(host: str, port: int, workers: int) -> None:
+    """Run several server processes on the same port and wait for them."""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise ConfigurationError(
+            "Multiple HTTP workers need SO_REUSEPORT, which this platform lacks",
+            config_key="workers",
+            config_value=workers,
+        )
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_serve_http, args=(host, port, worker), name=f"mcp-http-{worker}"
+        )
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Stopping the supervisor stops the workers too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
 if __name__ == "__main__":
     # Configure structlog for better logging
     structlog.configure(
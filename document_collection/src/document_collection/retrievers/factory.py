@@ -1,16 +1,49 @@
 """Retriever factory for document collection."""
 
+import inspect
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING, cast
+
 from document_collection.core.interfaces import DocumentRetriever
-from document_collection.retrievers.local_retriever import LocalFileRetriever
-from document_collection.retrievers.web_retriever import WebHttpRetriever
+from document_collection.core.registry import retriever_registry, source_scheme
+
+if TYPE_CHECKING:
+    import requests
 
 
 class RetrieverFactory:
-    """Factory to instantiate appropriate retriever based on source type."""
+    """Factory selecting the retriever registered for a source type."""
 
     @staticmethod
-    def get_retriever(source: str) -> DocumentRetriever:
-        """Get appropriate retriever instance based on source type."""
-        if source.lower().startswith(("http://", "https://")):
-            return WebHttpRetriever()
-        return LocalFileRetriever()
+    def get_retriever(
+        source: str, session: "requests.Session | None" = None
+    ) -> DocumentRetriever:
+        """Get the retriever registered for the URL scheme of a source.
+
+        Args:
+            source: Source file path or URL
+            session: HTTP session shared by retrievers that accept one
+
+        Raises:
+            ValueError: If no retriever is registered for the scheme
+
+        """
+        scheme = source_scheme(source)
+        retriever_class = retriever_registry.load(scheme)
+        if retriever_class is None:
+            raise ValueError(f"Unsupported source: {source}")
+        if session is not None and _takes_session(retriever_class):
+            # Bound to the caller's connection pool, so not shared
+            create = cast(Callable[..., DocumentRetriever], retriever_class)
+            return create(session=session)
+        retriever = retriever_registry.get(scheme)
+        if retriever is None:
+            raise ValueError(f"Unsupported source: {source}")
+        return retriever
+
+
+@cache
+def _takes_session(retriever_class: type) -> bool:
+    """Return whether a retriever class accepts an HTTP session."""
+    return "session" in inspect.signature(retriever_class).parameters
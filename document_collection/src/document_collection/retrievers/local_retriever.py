@@ -10,6 +10,7 @@ from document_collection.core.models import (
     DocumentSource,
     SourceType,
 )
+from document_collection.core.sniffer import FormatSniffer
 
 
 class LocalFileRetriever(DocumentRetriever):
@@ -25,12 +26,19 @@ class LocalFileRetriever(DocumentRetriever):
         if not path.exists() or not path.is_file():
             return None
         stat = path.stat()
+        extension = path.suffix.lstrip(".").lower()
+        if not extension:
+            document_format = DocumentFormat.MARKDOWN
+        elif extension in DocumentFormat:
+            document_format = DocumentFormat(extension)
+        else:
+            # The default of the model; the service replaces it with the
+            # format detected from the content
+            document_format = DocumentFormat.PDF
         return DocumentMetadata(
             filename=path.name,
             source=DocumentSource(source=source, source_type=SourceType.LOCAL_FILE),
-            format=DocumentFormat(path.suffix.lstrip(".").lower())
-            if path.suffix
-            else DocumentFormat.MARKDOWN,
+            format=document_format,
             size_bytes=stat.st_size,
             created_at=None,
             modified_at=None,
@@ -38,9 +46,18 @@ class LocalFileRetriever(DocumentRetriever):
         )
 
     async def retrieve(
-        self, source: str, destination: Path, request_id: str = "", **kwargs: Any
+        self,
+        source: str,
+        destination: Path,
+        request_id: str = "",
+        sniffer: FormatSniffer | None = None,
+        **kwargs: Any,
     ) -> Path:
-        """Retrieve a document from local filesystem to destination directory."""
+        """Retrieve a document from local filesystem to destination directory.
+
+        The head of the file is fed to the sniffer, if given. The copy itself
+        is left to the kernel, so this is the only read of the file here.
+        """
         source_path = Path(source)
         if not source_path.exists():
             raise FileNotFoundError(f"File not found: {source_path}")
@@ -52,6 +69,10 @@ class LocalFileRetriever(DocumentRetriever):
             # Ensure destination directory exists
             destination.mkdir(parents=True, exist_ok=True)
 
+            if sniffer is not None:
+                with open(source_path, "rb") as f:
+                    sniffer.feed(f.read(sniffer.limit))
+
             # Copy file to destination directory
             dest_file = destination / source_path.name
             shutil.copy2(source_path, dest_file)
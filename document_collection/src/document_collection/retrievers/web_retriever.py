@@ -6,11 +6,22 @@ from typing import Any
 import requests
 
 from document_collection.core.interfaces import DocumentRetriever
+from document_collection.core.sniffer import FormatSniffer
 
 
 class WebHttpRetriever(DocumentRetriever):
     """Retrieve documents from web HTTP/HTTPS sources."""
 
+    def __init__(self, session: requests.Session | None = None) -> None:
+        """Initialize the retriever.
+
+        Args:
+            session: Session whose connection pool is reused across downloads;
+                without one every download opens its own connection
+
+        """
+        self.session = session
+
     def can_handle(self, source: str) -> bool:
         """Check if this retriever can handle the given source."""
         return source.lower().startswith(("http://", "https://"))
@@ -21,23 +32,39 @@ class WebHttpRetriever(DocumentRetriever):
         return None
 
     async def retrieve(
-        self, source: str, destination: Path, request_id: str = "", **kwargs: Any
+        self,
+        source: str,
+        destination: Path,
+        request_id: str = "",
+        sniffer: FormatSniffer | None = None,
+        **kwargs: Any,
     ) -> Path:
-        """Retrieve a document from web HTTP/HTTPS source to destination directory."""
+        """Retrieve a document from web HTTP/HTTPS source to destination directory.
+
+        The first chunks downloaded are fed to the sniffer, if given.
+        """
         # Validate URL
         if not source.lower().startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL: {source}")
+        get = self.session.get if self.session is not None else requests.get
         try:
-            response = requests.get(
-                source, stream=True, timeout=kwargs.get("timeout", 10)
-            )
-            response.raise_for_status()
-            filename = kwargs.get("filename") or source.split("/")[-1]
-            dest_path = destination / filename
-            with open(dest_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            response = get(source, stream=True, timeout=kwargs.get("timeout", 10))
+            try:
+                response.raise_for_status()
+                # A URL ending in a slash names a page, not a file
+                filename = (
+                    kwargs.get("filename") or source.split("/")[-1] or "index.html"
+                )
+                dest_path = destination / filename
+                with open(dest_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            if sniffer is not None:
+                                sniffer.feed(chunk)
+                            f.write(chunk)
+            finally:
+                # Hands the connection back to the session's pool
+                response.close()
             return dest_path
         except Exception as e:
             raise RuntimeError(f"Error retrieving web document: {e}") from e
@@ -0,0 +1,5 @@
+"""Full-text search over collected documents."""
+
+from .index import SearchIndex, index_directory, tokenize
+
+__all__ = ["SearchIndex", "index_directory", "tokenize"]
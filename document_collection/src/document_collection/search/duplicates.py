@@ -0,0 +1,296 @@
+"""Near-duplicate detection of converted documents with MinHash and LSH."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from ..core.models import DuplicateMatch
+from ..core.types import (
+    DEFAULT_DUPLICATE_THRESHOLD,
+    DUPLICATE_INDEX_FILE,
+    STATE_DIRECTORY,
+)
+from .index import tokenize
+
+# Signature size; bins are addressed by the top bits of a 64-bit hash
+SIGNATURE_BINS = 128
+_BIN_BITS = 7
+# Words per shingle
+SHINGLE_WORDS = 5
+# LSH banding: 16 bands of 8 bins put the 50% candidate threshold at a
+# similarity of about 0.7, below the default match threshold
+LSH_BANDS = 16
+_ROWS_PER_BAND = SIGNATURE_BINS // LSH_BANDS
+
+# Bump when shingling or hashing changes; older signatures are dropped
+SIGNATURE_VERSION = 1
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+_PRIME = 0x100000001B3  # Odd, so it is invertible modulo 2**64
+_PRIME_INVERSE = pow(_PRIME, -1, 1 << 64)
+_SHINGLE_BASE = 0x9E3779B97F4A7C15
+_EMPTY = np.uint64(_MASK)
+_BAND_WEIGHTS = np.array(
+    [pow(_SHINGLE_BASE, row + 1, 1 << 64) for row in range(_ROWS_PER_BAND)],
+    dtype=np.uint64,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS signatures (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    key INTEGER NOT NULL,
+    document_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_by_key ON bands (band, key);
+CREATE INDEX IF NOT EXISTS bands_by_document ON bands (document_id);
+"""
+
+
+def minhash_signature(text: str) -> np.ndarray | None:
+    """Compute the MinHash signature of a document's word shingles.
+
+    The text is reduced to its lower-case words, so Markdown syntax, line
+    wrapping and page headings of different source formats matter little.
+    Every step is vectorised: words are hashed with a polynomial prefix hash
+    over the UTF-8 bytes, shingles of ``SHINGLE_WORDS`` words combine the word
+    hashes, and the signature uses one-permutation hashing, where the top bits
+    of a shingle's hash pick a bin and each bin keeps its smallest value.
+    Empty bins borrow from the next filled bin so signatures of short texts
+    still compare.
+
+    Returns:
+        ``SIGNATURE_BINS`` unsigned 64-bit values, or None for a text without words
+
+    """
+    words = tokenize(text)
+    if not words:
+        return None
+    with np.errstate(over="ignore"):
+        shingles = _mix(_shingle_hashes(_word_hashes(" ".join(words).encode("utf-8"))))
+        bins = (shingles >> np.uint64(64 - _BIN_BITS)).astype(np.intp)
+        values = shingles & np.uint64(_MASK >> _BIN_BITS)
+        signature = np.full(SIGNATURE_BINS, _EMPTY, dtype=np.uint64)
+        np.minimum.at(signature, bins, values)
+        return _densify(signature)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two documents from their signatures."""
+    return float(np.count_nonzero(first == second)) / SIGNATURE_BINS
+
+
+def _word_hashes(data: bytes) -> np.ndarray:
+    """Hash the space-separated words of ``data``, one value per word."""
+    codes = np.frombuffer(data, dtype=np.uint8).astype(np.uint64)
+    length = len(codes)
+    powers = np.cumprod(np.full(length, _PRIME, dtype=np.uint64))
+    inverse_powers = np.cumprod(np.full(length, _PRIME_INVERSE, dtype=np.uint64))
+    # prefix[i] is the sum of codes[j] * PRIME**(j + 1) for j < i
+    prefix = np.concatenate((np.zeros(1, dtype=np.uint64), np.cumsum(codes * powers)))
+    spaces = np.flatnonzero(codes == ord(" "))
+    starts = np.concatenate(([0], spaces + 1))
+    ends = np.concatenate((spaces, [length]))
+    # Dividing out PRIME**(start + 1) makes a word's hash independent of its position
+    hashes: np.ndarray = (prefix[ends] - prefix[starts]) * inverse_powers[starts]
+    return hashes
+
+
+def _shingle_hashes(words: np.ndarray) -> np.ndarray:
+    """Combine the hashes of each run of ``SHINGLE_WORDS`` consecutive words."""
+    width = min(SHINGLE_WORDS, len(words))
+    count = len(words) - width + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    for offset in range(width):
+        shingles = shingles * np.uint64(_SHINGLE_BASE) + words[offset : offset + count]
+    return shingles
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Scramble hash bits (the splitmix64 finaliser) so all bits are usable."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    mixed: np.ndarray = values ^ (values >> np.uint64(31))
+    return mixed
+
+
+def _densify(signature: np.ndarray) -> np.ndarray:
+    """Fill empty bins from the next filled bin, tagged with the distance."""
+    filled = np.flatnonzero(signature != _EMPTY)
+    empty = np.flatnonzero(signature == _EMPTY)
+    if not len(empty):
+        return signature
+    position = np.searchsorted(filled, empty) % len(filled)
+    source = filled[position]
+    distance = (source - empty) % SIGNATURE_BINS
+    signature[empty] = _mix(
+        signature[source] + distance.astype(np.uint64) * np.uint64(_SHINGLE_BASE)
+    )
+    return signature
+
+
+def _band_keys(signature: np.ndarray) -> list[int]:
+    """Return one LSH bucket key per band of a signature."""
+    with np.errstate(over="ignore"):
+        bands = signature.reshape(LSH_BANDS, _ROWS_PER_BAND)
+        keys = _mix((bands * _BAND_WEIGHTS).sum(axis=1, dtype=np.uint64))
+    band_keys: list[int] = keys.view(np.int64).tolist()
+    return band_keys
+
+
+def _candidates_query(bands: int) -> str:
+    """Return the query for documents sharing a bucket with any of the bands.
+
+    The bucket keys are probed one by one through ``bands_by_key``; the CROSS
+    JOINs keep SQLite from scanning the signatures and probing bands instead.
+    """
+    values = ",".join("(?, ?)" for _ in range(bands))
+    return (
+        f"WITH probes (band, key) AS (VALUES {values})"
+        " SELECT DISTINCT signatures.path, signatures.signature FROM probes"
+        " CROSS JOIN bands ON bands.band = probes.band AND bands.key = probes.key"
+        " CROSS JOIN signatures ON signatures.id = bands.document_id"
+    )
+
+
+def _probes(keys: list[int]) -> list[int]:
+    """Flatten band numbers and bucket keys into query parameters."""
+    return [value for band, key in enumerate(keys) for value in (band, key)]
+
+
+class DuplicateIndex:
+    """LSH index of the MinHash signatures of the documents in a collection.
+
+    Signatures are split into ``LSH_BANDS`` bands and every band is stored
+    as a bucket key in an indexed SQLite table, so finding candidates takes
+    one indexed lookup per band however many documents there are. Candidates
+    are confirmed against their stored signature.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Open (and create if needed) the index of a collection.
+
+        Args:
+            root: Collection directory the documents were collected into
+
+        """
+        self.root = root.resolve()
+        database_path = self.root / STATE_DIRECTORY / DUPLICATE_INDEX_FILE
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(database_path), timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._check_version()
+
+    def find(
+        self,
+        signature: np.ndarray,
+        threshold: float = DEFAULT_DUPLICATE_THRESHOLD,
+        exclude: Path | None = None,
+    ) -> list[DuplicateMatch]:
+        """Find documents whose estimated similarity reaches the threshold.
+
+        Args:
+            signature: Signature of the new document
+            threshold: Minimum estimated Jaccard similarity
+            exclude: Document to leave out, usually an earlier version of the new one
+
+        Returns:
+            Matches ordered by decreasing similarity; documents deleted since
+            they were added are left out and forgotten
+
+        """
+        keys = _band_keys(signature)
+        rows = self._connection.execute(
+            _candidates_query(len(keys)), _probes(keys)
+        ).fetchall()
+
+        excluded = self._key(exclude) if exclude is not None else None
+        matches = []
+        missing = []
+        for key, blob in rows:
+            if key == excluded:
+                continue
+            score = similarity(signature, np.frombuffer(blob, dtype=np.uint64))
+            if score < threshold:
+                continue
+            if (self.root / key).is_file():
+                matches.append(
+                    DuplicateMatch(document=self.root / key, similarity=score)
+                )
+            else:
+                missing.append(key)
+        if missing:
+            with self._connection:
+                for key in missing:
+                    self._delete(key)
+        return sorted(matches, key=lambda match: match.similarity, reverse=True)
+
+    def add(self, markdown_path: Path, signature: np.ndarray) -> None:
+        """Store the signature of a document, replacing an earlier one."""
+        key = self._key(markdown_path)
+        with self._connection:
+            self._delete(key)
+            document_id = self._connection.execute(
+                "INSERT INTO signatures (path, signature) VALUES (?, ?)",
+                (key, signature.astype(np.uint64).tobytes()),
+            ).lastrowid
+            self._connection.executemany(
+                "INSERT INTO bands (band, key, document_id) VALUES (?, ?, ?)",
+                [
+                    (band, band_key, document_id)
+                    for band, band_key in enumerate(_band_keys(signature))
+                ],
+            )
+
+    def remove(self, markdown_path: Path) -> None:
+        """Forget the signature of a document."""
+        with self._connection:
+            self._delete(self._key(markdown_path))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "DuplicateIndex":
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the index."""
+        self.close()
+
+    def _delete(self, key: str) -> None:
+        row = self._connection.execute(
+            "SELECT id FROM signatures WHERE path = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._connection.execute("DELETE FROM bands WHERE document_id = ?", row)
+            self._connection.execute("DELETE FROM signatures WHERE id = ?", row)
+
+    def _key(self, markdown_path: Path) -> str:
+        return os.path.relpath(markdown_path.resolve(), self.root)
+
+    def _check_version(self) -> None:
+        """Drop signatures computed by an incompatible version."""
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        if row == (SIGNATURE_VERSION,):
+            return
+        with self._connection:
+            self._connection.execute("DELETE FROM bands")
+            self._connection.execute("DELETE FROM signatures")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                (SIGNATURE_VERSION,),
+            )
@@ -0,0 +1,748 @@
+"""Incremental BM25 index over the Markdown documents of a collection."""
+
+import array
+import heapq
+import logging
+import math
+import mmap
+import os
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+
+from ..core.models import SearchHit
+from ..core.outline import load_outline
+from ..core.types import DEFAULT_SEARCH_LIMIT, SEARCH_INDEX_DIRECTORY, STATE_DIRECTORY
+from .segments import SegmentReader, SegmentWriter, segment_paths
+
+logger = logging.getLogger(__name__)
+
+# Bump when tokenisation or the file layout changes; older indexes are rebuilt
+INDEX_VERSION = 2
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Segments are merged once this many of them have the same level
+MERGE_FACTOR = 8
+
+# Postings scored per query; terms are read in impact order, so the budget
+# only drops the weakest matches of very common terms
+DEFAULT_POSTINGS_BUDGET = 50_000
+
+MAX_TERM_LENGTH = 64
+SNIPPET_CHARS = 240
+# Bytes read from the start of a section to build its snippet
+SNIPPET_SCAN_BYTES = 16 * 1024
+
+DATABASE_FILE = "index.sqlite"
+LENGTHS_FILE = "lengths.u32"
+
+_TOKEN = re.compile(r"[^\W_]+")
+_SPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    document_id INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    heading TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_by_document ON sections (document_id);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    level INTEGER NOT NULL,
+    postings INTEGER NOT NULL,
+    first_section INTEGER NOT NULL,
+    last_section INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT NOT NULL,
+    segment_id INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (term, segment_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS terms_by_segment ON terms (segment_id);
+CREATE TABLE IF NOT EXISTS document_terms (
+    document_id INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    sections INTEGER NOT NULL,
+    PRIMARY KEY (document_id, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS frequencies (
+    term TEXT PRIMARY KEY,
+    sections INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-case word tokens."""
+    return [
+        token
+        for token in _TOKEN.findall(text.casefold())
+        if len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def index_directory(root: Path) -> Path:
+    """Return the directory holding the search index of a collection."""
+    return root / STATE_DIRECTORY / SEARCH_INDEX_DIRECTORY
+
+
+class SearchIndex:
+    """Full-text index of the sections of the Markdown documents in a collection.
+
+    Documents are split at their headings and every section is indexed on its
+    own, so hits point at a byte range that can be read back with one seek.
+    Each added document becomes a small immutable posting segment; segments
+    of the same level are merged once ``MERGE_FACTOR`` of them exist, which
+    keeps the number of segments a query touches logarithmic in the size of
+    the collection. Postings are memory-mapped, the term dictionary and
+    section metadata live in SQLite, and per-section lengths are kept in a
+    flat file indexed by section id, where a zero length marks a section of a
+    document that was since reindexed or removed. Postings of such sections
+    linger in their segment until it is merged, so the number of live sections
+    holding each term is kept apart and updated as documents come and go.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Open (and create if needed) the index of a collection.
+
+        Args:
+            root: Collection directory the documents were collected into
+
+        """
+        self.root = root.resolve()
+        self.directory = index_directory(self.root)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.directory / DATABASE_FILE), timeout=30, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Commits in WAL mode stay atomic without a sync each; a power cut may
+        # only lose the most recent documents, which a refresh indexes again
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._lengths_fd = os.open(
+            self.directory / LENGTHS_FILE, os.O_RDWR | os.O_CREAT, 0o644
+        )
+        self._lengths_map: mmap.mmap | None = None
+        self._lengths: memoryview | None = None
+        self._segments: dict[int, SegmentReader] = {}
+        self._check_version()
+
+    def add_document(self, markdown_path: Path) -> int:
+        """Index a Markdown document, replacing an earlier version of it.
+
+        Documents whose size and modification time are unchanged since they
+        were indexed are skipped without being read.
+
+        Args:
+            markdown_path: Markdown document inside the collection
+
+        Returns:
+            Number of sections indexed, 0 if the document was unchanged
+
+        """
+        path = markdown_path.resolve()
+        key = self._document_key(path)
+        stat = path.stat()
+        row = self._connection.execute(
+            "SELECT size, mtime_ns FROM documents WHERE path = ?", (key,)
+        ).fetchone()
+        if row == (stat.st_size, stat.st_mtime_ns):
+            return 0
+
+        sections = list(_read_sections(path))
+        with self._transaction():
+            document_id = self._replace_document(key, stat.st_size, stat.st_mtime_ns)
+            # Section ids are handed out in one block while the write lock is held
+            row = self._connection.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'sections'"
+            ).fetchone()
+            first_id = (row[0] if row else 0) + 1
+            lengths = array.array(
+                "I", (sum(section[3].values()) for section in sections)
+            )
+            self._connection.executemany(
+                "INSERT INTO sections (id, document_id, start, end, length, heading)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        first_id + number,
+                        document_id,
+                        start,
+                        end,
+                        lengths[number],
+                        heading,
+                    )
+                    for number, (start, end, heading, _frequencies) in enumerate(
+                        sections
+                    )
+                ),
+            )
+            os.pwrite(self._lengths_fd, lengths.tobytes(), first_id * lengths.itemsize)
+            self._add_to_meta(len(lengths), sum(lengths))
+
+            postings: defaultdict[str, list[tuple[int, int]]] = defaultdict(list)
+            for number, (*_, frequencies) in enumerate(sections):
+                for term, frequency in frequencies.items():
+                    postings[term].append((first_id + number, frequency))
+            self._add_frequencies(
+                document_id,
+                ((term, len(entries)) for term, entries in postings.items()),
+            )
+            if postings:
+                self._write_segment(
+                    0,
+                    postings.items(),
+                    lambda section_id: lengths[section_id - first_id],
+                    (first_id, first_id + len(lengths) - 1),
+                )
+
+        self._merge_segments()
+        logger.debug("Indexed %d sections of %s", len(sections), path)
+        return len(sections)
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the Markdown documents on disk.
+
+        New and changed documents are indexed and documents that no longer
+        exist are removed. Unchanged documents are only looked at with
+        ``stat``, which makes this cheap enough to run before a search on a
+        collection that was also written to by other tools.
+
+        Returns:
+            Number of documents that were indexed or removed
+
+        """
+        changed = 0
+        found: set[str] = set()
+        for markdown_path in sorted(self.root.rglob("*.md")):
+            if STATE_DIRECTORY in markdown_path.relative_to(self.root).parts:
+                continue
+            found.add(self._document_key(markdown_path))
+            if self.add_document(markdown_path):
+                changed += 1
+        for (key,) in self._connection.execute("SELECT path FROM documents").fetchall():
+            if key not in found and self.remove_document(self.root / key):
+                changed += 1
+        return changed
+
+    def remove_document(self, markdown_path: Path) -> bool:
+        """Remove a document from the index.
+
+        Returns:
+            True if the document was indexed
+
+        """
+        key = self._document_key(markdown_path.resolve())
+        with self._transaction():
+            row = self._connection.execute(
+                "SELECT id FROM documents WHERE path = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False
+            self._delete_sections(row[0])
+            self._connection.execute("DELETE FROM documents WHERE id = ?", row)
+        return True
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        max_postings: int = DEFAULT_POSTINGS_BUDGET,
+    ) -> list[SearchHit]:
+        """Rank sections against a query with BM25.
+
+        Args:
+            query: Free text query; every word is a term, terms are OR-ed
+            limit: Maximum number of hits
+            max_postings: Postings read per query, shared by the query terms
+                with the rarest terms served first
+
+        Returns:
+            Hits ordered by decreasing score, with snippets
+
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        try:
+            return self._search(terms, limit, max_postings)
+        except FileNotFoundError:
+            pass
+        # Another process merged segments between reading the term
+        # dictionary and mapping them; forget the old ones and read again
+        self._prune_segments()
+        return self._search(terms, limit, max_postings)
+
+    def close(self) -> None:
+        """Release the mapped files and the database connection."""
+        self._release_segments()
+        self._release_lengths()
+        os.close(self._lengths_fd)
+        self._connection.close()
+
+    def __enter__(self) -> "SearchIndex":
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the index."""
+        self.close()
+
+    def _search(
+        self, terms: list[str], limit: int, max_postings: int
+    ) -> list[SearchHit]:
+        sections, total_length = self._meta()
+        if not sections:
+            return []
+        term_segments = []
+        for term in terms:
+            # Segments may still hold postings of removed sections, so they
+            # give the postings to read but not the document frequency
+            row = self._connection.execute(
+                "SELECT sections FROM frequencies WHERE term = ?", (term,)
+            ).fetchone()
+            if not row or row[0] <= 0:
+                continue
+            rows = self._connection.execute(
+                "SELECT segment_id, offset, count FROM terms WHERE term = ?", (term,)
+            ).fetchall()
+            term_segments.append(
+                (row[0], sum(count for _id, _offset, count in rows), rows)
+            )
+        term_segments.sort(key=itemgetter(0))
+        # Mapped after the term lookup, so it covers every section found there
+        lengths = self._length_view()
+
+        # BM25 with the length normalisation k1 * (1 - b + b * dl / avgdl)
+        # split into a constant and a per-length factor
+        constant = BM25_K1 * (1 - BM25_B)
+        per_length = BM25_K1 * BM25_B * sections / total_length
+        scores: dict[int, float] = {}
+        get_score = scores.get
+        remaining = max_postings
+        for position, (frequency, postings, rows) in enumerate(term_segments):
+            weight = (BM25_K1 + 1) * math.log(
+                1 + (sections - frequency + 0.5) / (frequency + 0.5)
+            )
+            share = max(remaining, 0) // (len(term_segments) - position)
+            for segment_id, offset, count in rows:
+                # Each segment gives up its best postings in proportion to its size
+                take = count if postings <= share else max(1, share * count // postings)
+                remaining -= take
+                ids, frequencies = self._segment(segment_id).postings(offset, take)
+                for section_id, term_frequency in zip(ids, frequencies, strict=True):
+                    length = lengths[section_id]
+                    if length:
+                        scores[section_id] = get_score(
+                            section_id, 0.0
+                        ) + weight * term_frequency / (
+                            term_frequency + constant + per_length * length
+                        )
+
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [
+            hit
+            for hit in (
+                self._hit(section_id, score, terms) for section_id, score in best
+            )
+            if hit
+        ]
+
+    def _hit(self, section_id: int, score: float, terms: list[str]) -> SearchHit | None:
+        row = self._connection.execute(
+            "SELECT documents.path, sections.start, sections.end, sections.heading"
+            " FROM sections JOIN documents ON documents.id = sections.document_id"
+            " WHERE sections.id = ?",
+            (section_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        key, start, end, heading = row
+        document = self.root / key
+        return SearchHit(
+            document=document,
+            heading=heading,
+            start=start,
+            end=end,
+            score=round(score, 4),
+            snippet=_snippet(document, start, end, terms),
+        )
+
+    def _write_segment(
+        self,
+        level: int,
+        postings: Iterable[
+            tuple[str, list[tuple[int, int]] | tuple[memoryview, memoryview]]
+        ],
+        length_of: Callable[[int], int],
+        section_range: tuple[int, int],
+    ) -> int:
+        """Write a segment inside the current transaction and register it.
+
+        Postings given as a list are sorted by their BM25 impact
+        ``tf / (tf + k1 * (1 - b + b * dl / avgdl))`` at the current average
+        section length; postings given as id and frequency arrays are taken
+        to be in impact order already and copied as they are.
+        """
+        sections, total_length = self._meta()
+        per_length = BM25_K1 * BM25_B * sections / total_length if total_length else 0.0
+        norms: dict[int, float] = {}
+
+        def impact(entry: tuple[int, int]) -> float:
+            section_id, frequency = entry
+            norm = norms.get(section_id)
+            if norm is None:
+                norm = norms[section_id] = BM25_K1 * (
+                    1 - BM25_B
+                ) + per_length * length_of(section_id)
+            return frequency / (frequency + norm)
+
+        segment_id: int = self._connection.execute(
+            "INSERT INTO segments (level, postings, first_section, last_section)"
+            " VALUES (?, 0, ?, ?) RETURNING id",
+            (level, *section_range),
+        ).fetchone()[0]
+        writer = SegmentWriter(self.directory, segment_id)
+        try:
+            for term, entries in postings:
+                if isinstance(entries, tuple):
+                    writer.add_run(term, *entries)
+                    continue
+                if len(entries) > 1:
+                    entries.sort(key=impact, reverse=True)
+                writer.add(term, entries)
+            self._connection.executemany(
+                "INSERT INTO terms (term, segment_id, offset, count) VALUES (?, ?, ?, ?)",
+                (
+                    (term, segment_id, offset, count)
+                    for term, offset, count in writer.terms
+                ),
+            )
+            self._connection.execute(
+                "UPDATE segments SET postings = ? WHERE id = ?",
+                (writer.postings, segment_id),
+            )
+            writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+        return segment_id
+
+    def _merge_segments(self) -> None:
+        """Merge full levels of segments until no level is full."""
+        while True:
+            with self._transaction():
+                row = self._connection.execute(
+                    "SELECT level FROM segments GROUP BY level HAVING COUNT(*) >= ?"
+                    " ORDER BY level LIMIT 1",
+                    (MERGE_FACTOR,),
+                ).fetchone()
+                if row is None:
+                    return
+                merged = self._merge_level(row[0])
+            for segment_id in merged:
+                self._drop_segment_files(segment_id)
+
+    def _merge_level(self, level: int) -> list[int]:
+        """Merge all segments of a level into one segment of the next level.
+
+        Postings of removed sections are dropped on the way. When none of the
+        merged sections were removed, terms found in a single segment are
+        copied over without being decoded.
+
+        Returns:
+            Identifiers of the merged, now unused, segments
+
+        """
+        segments = self._connection.execute(
+            "SELECT id, first_section, last_section FROM segments WHERE level = ? ORDER BY id",
+            (level,),
+        ).fetchall()
+        segment_ids = [segment_id for segment_id, _first, _last in segments]
+        placeholders = ",".join("?" * len(segment_ids))
+        rows = self._connection.execute(
+            f"SELECT term, segment_id, offset, count FROM terms"
+            f" WHERE segment_id IN ({placeholders}) ORDER BY term",
+            segment_ids,
+        ).fetchall()
+        lengths = self._length_view()
+        # Removed sections have a zero length
+        purge = any(
+            array.array("I", lengths[first : last + 1]).count(0)
+            for _id, first, last in segments
+        )
+
+        def merged_postings() -> Iterator[
+            tuple[str, list[tuple[int, int]] | tuple[memoryview, memoryview]]
+        ]:
+            for term, group in groupby(rows, key=itemgetter(0)):
+                runs = [
+                    self._segment(segment_id).postings(offset, count)
+                    for _term, segment_id, offset, count in group
+                ]
+                if len(runs) == 1 and not purge:
+                    yield term, runs[0]
+                    continue
+                entries: list[tuple[int, int]] = []
+                for ids, frequencies in runs:
+                    pairs = zip(ids, frequencies, strict=True)
+                    entries.extend(
+                        pairs
+                        if not purge
+                        else (pair for pair in pairs if lengths[pair[0]])
+                    )
+                yield term, entries
+
+        self._write_segment(
+            level + 1,
+            merged_postings(),
+            lengths.__getitem__,
+            (
+                min(first for _id, first, _last in segments),
+                max(last for _id, _first, last in segments),
+            ),
+        )
+        self._connection.execute(
+            f"DELETE FROM terms WHERE segment_id IN ({placeholders})", segment_ids
+        )
+        self._connection.execute(
+            f"DELETE FROM segments WHERE id IN ({placeholders})", segment_ids
+        )
+        logger.debug("Merged %d segments of level %d", len(segment_ids), level)
+        return segment_ids
+
+    def _replace_document(self, key: str, size: int, mtime_ns: int) -> int:
+        row = self._connection.execute(
+            "SELECT id FROM documents WHERE path = ?", (key,)
+        ).fetchone()
+        if row is None:
+            row = self._connection.execute(
+                "INSERT INTO documents (path, size, mtime_ns) VALUES (?, ?, ?) RETURNING id",
+                (key, size, mtime_ns),
+            ).fetchone()
+        else:
+            self._delete_sections(row[0])
+            self._connection.execute(
+                "UPDATE documents SET size = ?, mtime_ns = ? WHERE id = ?",
+                (size, mtime_ns, row[0]),
+            )
+        document_id: int = row[0]
+        return document_id
+
+    def _delete_sections(self, document_id: int) -> None:
+        """Delete the sections of a document and zero their lengths.
+
+        The sections of a document were given consecutive ids, so their
+        lengths are cleared with a single write.
+        """
+        first_id, last_id, count, length = self._connection.execute(
+            "SELECT MIN(id), MAX(id), COUNT(*), TOTAL(length) FROM sections WHERE document_id = ?",
+            (document_id,),
+        ).fetchone()
+        if not count:
+            return
+        os.pwrite(self._lengths_fd, bytes(4 * (last_id - first_id + 1)), first_id * 4)
+        self._connection.execute(
+            "DELETE FROM sections WHERE document_id = ?", (document_id,)
+        )
+        self._add_to_meta(-count, -int(length))
+        self._remove_frequencies(document_id)
+
+    def _add_frequencies(
+        self, document_id: int, counts: Iterable[tuple[str, int]]
+    ) -> None:
+        """Record how many sections of a document hold each of its terms."""
+        self._connection.executemany(
+            "INSERT INTO document_terms (document_id, term, sections) VALUES (?, ?, ?)",
+            ((document_id, term, sections) for term, sections in counts),
+        )
+        self._connection.execute(
+            "INSERT INTO frequencies (term, sections)"
+            " SELECT term, sections FROM document_terms WHERE document_id = ? AND true"
+            " ON CONFLICT (term) DO UPDATE SET sections = sections + excluded.sections",
+            (document_id,),
+        )
+
+    def _remove_frequencies(self, document_id: int) -> None:
+        """Take the terms of a document's sections out of the live frequencies."""
+        self._connection.execute(
+            "UPDATE frequencies SET sections = frequencies.sections - document_terms.sections"
+            " FROM document_terms"
+            " WHERE document_terms.document_id = ? AND document_terms.term = frequencies.term",
+            (document_id,),
+        )
+        self._connection.execute(
+            "DELETE FROM frequencies WHERE sections <= 0 AND term IN"
+            " (SELECT term FROM document_terms WHERE document_id = ?)",
+            (document_id,),
+        )
+        self._connection.execute(
+            "DELETE FROM document_terms WHERE document_id = ?", (document_id,)
+        )
+
+    def _length_view(self) -> memoryview:
+        """Return the section lengths, remapping the file when it has grown."""
+        size = os.fstat(self._lengths_fd).st_size
+        if self._lengths is None or len(self._lengths) * 4 != size:
+            self._release_lengths()
+            if size == 0:
+                return memoryview(b"").cast("B").cast("I")
+            self._lengths_map = mmap.mmap(
+                self._lengths_fd, size, access=mmap.ACCESS_READ
+            )
+            self._lengths = memoryview(self._lengths_map).cast("I")
+        return self._lengths
+
+    def _release_lengths(self) -> None:
+        if self._lengths is not None:
+            self._lengths.release()
+            self._lengths = None
+        if self._lengths_map is not None:
+            self._lengths_map.close()
+            self._lengths_map = None
+
+    def _segment(self, segment_id: int) -> SegmentReader:
+        reader = self._segments.get(segment_id)
+        if reader is None:
+            reader = self._segments[segment_id] = SegmentReader(
+                self.directory, segment_id
+            )
+        return reader
+
+    def _drop_segment_files(self, segment_id: int) -> None:
+        reader = self._segments.pop(segment_id, None)
+        if reader is not None:
+            reader.close()
+        for path in segment_paths(self.directory, segment_id):
+            path.unlink(missing_ok=True)
+
+    def _prune_segments(self) -> None:
+        live = {row[0] for row in self._connection.execute("SELECT id FROM segments")}
+        for segment_id in [
+            segment_id for segment_id in self._segments if segment_id not in live
+        ]:
+            self._segments.pop(segment_id).close()
+
+    def _release_segments(self) -> None:
+        for reader in self._segments.values():
+            reader.close()
+        self._segments.clear()
+
+    def _meta(self) -> tuple[int, int]:
+        values = dict(self._connection.execute("SELECT key, value FROM meta"))
+        return values.get("sections", 0), values.get("length", 0)
+
+    def _add_to_meta(self, sections: int, length: int) -> None:
+        self._connection.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+            (("sections", sections), ("length", length)),
+        )
+
+    def _check_version(self) -> None:
+        """Clear an index written by an incompatible version."""
+        version = "SELECT value FROM meta WHERE key = 'version'"
+        if self._connection.execute(version).fetchone() == (INDEX_VERSION,):
+            return
+        with self._transaction():
+            if self._connection.execute(version).fetchone() == (INDEX_VERSION,):
+                return
+            for table in (
+                "meta",
+                "documents",
+                "sections",
+                "segments",
+                "terms",
+                "document_terms",
+                "frequencies",
+            ):
+                self._connection.execute(f"DELETE FROM {table}")
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('version', ?)", (INDEX_VERSION,)
+            )
+            os.ftruncate(self._lengths_fd, 0)
+            for path in self.directory.glob("seg*"):
+                path.unlink()
+
+    def _document_key(self, path: Path) -> str:
+        """Return how a document is stored in the index: relative to the root."""
+        return os.path.relpath(path, self.root)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a write transaction, holding the database write lock throughout."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+
+def _read_sections(path: Path) -> Iterator[tuple[int, int, str, Counter[str]]]:
+    """Split a document at its headings and count the terms of each section.
+
+    Yields:
+        ``(start, end, heading path, term frequencies)`` of non-empty sections
+
+    """
+    outline = load_outline(path)
+    headings = {
+        entry.start: " > ".join([*entry.path, entry.text]) for entry in outline.headings
+    }
+    boundaries = sorted({0, *headings, outline.size_bytes})
+    with open(path, "rb") as markdown:
+        for start, end in zip(boundaries, boundaries[1:], strict=False):
+            frequencies = Counter(
+                tokenize(markdown.read(end - start).decode("utf-8", errors="replace"))
+            )
+            if frequencies:
+                yield start, end, headings.get(start, ""), frequencies
+
+
+def _snippet(document: Path, start: int, end: int, terms: list[str]) -> str:
+    """Return the text around the first query term in a section."""
+    try:
+        with open(document, "rb") as markdown:
+            markdown.seek(start)
+            data = markdown.read(min(end - start, SNIPPET_SCAN_BYTES))
+    except OSError:
+        return ""
+    text = data.decode("utf-8", errors="ignore")
+    if text.startswith("#"):
+        text = text.partition("\n")[2]
+    text = _SPACE.sub(" ", text).strip()
+
+    pattern = re.compile(
+        r"(?<!\w)(?:" + "|".join(map(re.escape, terms)) + r")(?!\w)", re.IGNORECASE
+    )
+    match = pattern.search(text)
+    center = match.start() if match else 0
+    begin = max(0, center - SNIPPET_CHARS // 3)
+    snippet = text[begin : begin + SNIPPET_CHARS]
+    return (
+        ("…" if begin else "")
+        + snippet
+        + ("…" if begin + SNIPPET_CHARS < len(text) else "")
+    )
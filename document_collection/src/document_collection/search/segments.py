@@ -0,0 +1,155 @@
+"""On-disk posting segments of the search index.
+
+A segment holds the postings of a set of terms in two flat files: section ids
+as 32-bit and term frequencies as 16-bit unsigned integers, in native byte
+order. The postings of one term are contiguous and ordered by decreasing
+BM25 impact, so a query can stop reading a term's postings early and still
+have seen its best matches. The term dictionary, mapping each term to its
+offset and count in a segment, is kept in the index database.
+"""
+
+import array
+import mmap
+import os
+from pathlib import Path
+from typing import Literal
+
+IDS_SUFFIX = ".ids"
+FREQUENCIES_SUFFIX = ".tfs"
+MAX_FREQUENCY = 0xFFFF
+
+# Postings are buffered up to this many entries before being written out
+_WRITE_BUFFER = 1 << 16
+
+
+def segment_paths(directory: Path, segment_id: int) -> tuple[Path, Path]:
+    """Return the section id and frequency files of a segment."""
+    stem = directory / f"seg{segment_id:08d}"
+    return stem.with_suffix(IDS_SUFFIX), stem.with_suffix(FREQUENCIES_SUFFIX)
+
+
+class SegmentWriter:
+    """Write the postings of a new segment term by term.
+
+    Files are written under temporary names and only renamed into place by
+    ``commit``, so a failed write never leaves a partial segment behind.
+    """
+
+    def __init__(self, directory: Path, segment_id: int) -> None:
+        """Open the temporary files of a segment.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_id: Identifier of the segment in the index database
+
+        """
+        self._paths = segment_paths(directory, segment_id)
+        self._temp_paths = tuple(
+            path.with_name(path.name + ".tmp") for path in self._paths
+        )
+        self._files = [open(path, "wb") for path in self._temp_paths]
+        self._ids = array.array("I")
+        self._frequencies = array.array("H")
+        self._written = 0
+        self.terms: list[tuple[str, int, int]] = []
+
+    def add(self, term: str, postings: list[tuple[int, int]]) -> None:
+        """Append the postings of a term, already in impact order.
+
+        Args:
+            term: Indexed term; terms may be added in any order
+            postings: ``(section id, term frequency)`` pairs
+
+        """
+        if not postings:
+            return
+        self.terms.append((term, self.postings, len(postings)))
+        section_ids, frequencies = zip(*postings, strict=True)
+        if max(frequencies) > MAX_FREQUENCY:
+            frequencies = tuple(
+                min(frequency, MAX_FREQUENCY) for frequency in frequencies
+            )
+        self._ids.extend(section_ids)
+        self._frequencies.extend(frequencies)
+        if len(self._ids) >= _WRITE_BUFFER:
+            self._flush()
+
+    def add_run(
+        self, term: str, section_ids: memoryview, frequencies: memoryview
+    ) -> None:
+        """Append postings of a term read from another segment, in impact order."""
+        if not len(section_ids):
+            return
+        self.terms.append((term, self.postings, len(section_ids)))
+        self._ids.frombytes(section_ids.cast("B"))
+        self._frequencies.frombytes(frequencies.cast("B"))
+        if len(self._ids) >= _WRITE_BUFFER:
+            self._flush()
+
+    @property
+    def postings(self) -> int:
+        """Number of postings added so far."""
+        return self._written + len(self._ids)
+
+    def commit(self) -> None:
+        """Write the remaining postings and move the files into place."""
+        self._flush()
+        for handle in self._files:
+            handle.close()
+        for temp_path, path in zip(self._temp_paths, self._paths, strict=True):
+            os.replace(temp_path, path)
+
+    def abort(self) -> None:
+        """Discard the segment."""
+        for handle in self._files:
+            handle.close()
+        for temp_path in self._temp_paths:
+            temp_path.unlink(missing_ok=True)
+
+    def _flush(self) -> None:
+        self._ids.tofile(self._files[0])
+        self._frequencies.tofile(self._files[1])
+        self._written += len(self._ids)
+        del self._ids[:]
+        del self._frequencies[:]
+
+
+class SegmentReader:
+    """Memory-mapped read access to the postings of a segment."""
+
+    def __init__(self, directory: Path, segment_id: int) -> None:
+        """Map the files of a segment.
+
+        Raises:
+            FileNotFoundError: If the segment was merged away in the meantime
+
+        """
+        self._maps: list[mmap.mmap] = []
+        ids_path, frequencies_path = segment_paths(directory, segment_id)
+        self._ids = self._map(ids_path, "I")
+        self._frequencies = self._map(frequencies_path, "H")
+
+    def _map(self, path: Path, typecode: Literal["I", "H"]) -> memoryview:
+        """Map a file of the segment as an array of the given type."""
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return memoryview(b"").cast("B").cast(typecode)
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def postings(self, offset: int, count: int) -> tuple[memoryview, memoryview]:
+        """Return the section ids and frequencies of one term."""
+        end = offset + count
+        return self._ids[offset:end], self._frequencies[offset:end]
+
+    def close(self) -> None:
+        """Release the mappings."""
+        self._ids.release()
+        self._frequencies.release()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # Postings are still referenced; the mapping goes with them
+                pass
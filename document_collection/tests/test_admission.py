@@ -0,0 +1,185 @@
+"""Tests for admission control of MCP tool calls."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.converters.markdown_processor import MarkdownProcessor
+from document_collection.core.service import DocumentCollectionService
+from document_collection.mcp_server import server
+from document_collection.mcp_server.admission import (
+    COLLECT_LANE,
+    INTERACTIVE_LANE,
+    AdmissionController,
+    Lane,
+    ServerBusy,
+)
+from document_collection.mcp_server.fairness import FairScheduler
+from document_collection.mcp_server.server import (
+    collect_document,
+    get_server_status,
+    list_formats,
+)
+
+
+async def _hold(
+    lane: Lane, release: asyncio.Event, order: list[int], number: int
+) -> None:
+    async with lane.admit():
+        order.append(number)
+        await release.wait()
+
+
+class TestLane:
+    """Test the concurrency limit and wait queue of a lane."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_calls_are_admitted_in_order(self):
+        """Test calls beyond the limit wait and get slots in arrival order."""
+        lane = Lane("test", limit=2, queue_size=4, timeout=5)
+        release = asyncio.Event()
+        order: list[int] = []
+
+        tasks = [asyncio.create_task(_hold(lane, release, order, n)) for n in range(4)]
+        await asyncio.sleep(0.01)
+        busy = lane.stats()
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert (busy["in_flight"], busy["queue_depth"]) == (2, 2)
+        assert order == [0, 1, 2, 3]
+        assert lane.stats()["in_flight"] == 0
+        assert lane.admitted == 4
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_at_once(self):
+        """Test a call finding the queue full is shed with a retry hint."""
+        lane = Lane("test", limit=1, queue_size=1, timeout=5)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(lane, release, [], n)) for n in range(2)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServerBusy) as busy:
+            async with lane.admit():
+                pass
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert busy.value.lane == "test"
+        assert busy.value.retry_after >= 1.0
+        assert "queue is full" in busy.value.message
+        assert lane.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_leaking_slots(self):
+        """Test a call waiting too long is rejected and the lane still works."""
+        lane = Lane("test", limit=1, queue_size=4, timeout=0.01)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(lane, release, [], 0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServerBusy):
+            async with lane.admit():
+                pass
+        release.set()
+        await holder
+        async with lane.admit():
+            in_flight = lane.stats()["in_flight"]
+
+        assert lane.timed_out == 1
+        assert in_flight == 1
+        assert lane.stats()["queue_depth"] == 0
+
+
+class TestAdmittedTools:
+    """Test tools are admitted through separate lanes."""
+
+    @pytest.mark.asyncio
+    async def test_saturated_collect_lane_keeps_interactive_calls(self, monkeypatch):
+        """Test collection is shed while cheap tools still answer."""
+        admission = AdmissionController(
+            [
+                Lane(COLLECT_LANE, limit=1, queue_size=0, timeout=1),
+                Lane(INTERACTIVE_LANE, limit=4, queue_size=4, timeout=1),
+            ]
+        )
+        monkeypatch.setattr(server, "_admission", admission)
+        release = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(admission.lanes[COLLECT_LANE], release, [], 0)
+        )
+        await asyncio.sleep(0)
+
+        rejected = await collect_document("https://example.com/doc.pdf")
+        formats = await list_formats()
+        status = await get_server_status()
+        release.set()
+        await holder
+
+        assert rejected["success"] is False
+        assert rejected["lane"] == COLLECT_LANE
+        assert rejected["retry_after"] >= 1.0
+        assert formats["total_formats"] > 0
+        assert status["lanes"][COLLECT_LANE]["rejected"] == 1
+        assert status["lanes"][INTERACTIVE_LANE]["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_answers_during_conversions(
+        self, tmp_path, monkeypatch
+    ):
+        """Test interactive calls keep their latency while every conversion slot blocks."""
+        convert = MarkdownProcessor.convert
+
+        async def slow_convert(self, input_path, output_path, **kwargs):
+            # Blocks its thread the way a parser library does
+            time.sleep(1.0)
+            return await convert(self, input_path, output_path, **kwargs)
+
+        monkeypatch.setattr(MarkdownProcessor, "convert", slow_convert)
+        service = DocumentCollectionService()
+        monkeypatch.setattr(server, "_service", service)
+        monkeypatch.setattr(server, "_fair_scheduler", FairScheduler(capacity=4))
+        monkeypatch.setattr(
+            server,
+            "_admission",
+            AdmissionController(
+                [
+                    Lane(COLLECT_LANE, limit=4, queue_size=4, timeout=10),
+                    Lane(INTERACTIVE_LANE, limit=32, queue_size=64, timeout=10),
+                ]
+            ),
+        )
+        sources = []
+        for number in range(4):
+            sources.append(tmp_path / f"doc{number}.md")
+            sources[-1].write_text(f"# Doc {number}\n\nText.\n", encoding="utf-8")
+
+        collections = [
+            asyncio.create_task(
+                collect_document(str(source), output_dir=str(tmp_path / "out"))
+            )
+            for source in sources
+        ]
+        await asyncio.sleep(0.1)
+
+        async def timed(call):
+            started = time.monotonic()
+            await call()
+            return time.monotonic() - started
+
+        latencies = await asyncio.gather(
+            *(timed(list_formats if n % 2 else get_server_status) for n in range(64))
+        )
+        converting = not any(task.done() for task in collections)
+        results = await asyncio.gather(*collections)
+        service.close()
+
+        assert converting
+        assert max(latencies) < 0.3
+        assert all(result["success"] for result in results)
@@ -0,0 +1,114 @@
+"""Tests for chunking of converted documents."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core.chunking import (
+    build_chunk_index,
+    chunk_index_path,
+    load_chunk_index,
+    read_chunk,
+    write_chunk_index,
+)
+from document_collection.core.service import DocumentCollectionService
+
+
+def _write_markdown(path: Path) -> Path:
+    """Write a small converted document with pages and sub-headings."""
+    path.write_text(
+        "# report\n\nConverted from PDF document\n\n"
+        "## Page 1\n\nIntro paragraph.\n\n### Scope\n\nScope text.\n\n"
+        "## Page 2\n\n```\n# not a heading\n```\n\nClosing words – done.\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestChunking:
+    """Test the chunk index."""
+
+    def test_chunks_start_at_page_headings(self, tmp_path):
+        """Test pages start new chunks and carry their heading path."""
+        markdown = _write_markdown(tmp_path / "report.md")
+
+        index = build_chunk_index(markdown, max_tokens=1000)
+
+        assert [chunk.heading_path for chunk in index.chunks] == [
+            ["report"],
+            ["report", "Page 1"],
+            ["report", "Page 2"],
+        ]
+        assert read_chunk(markdown, index.chunks[2]).startswith("## Page 2\n")
+        assert "# not a heading" in read_chunk(markdown, index.chunks[2])
+
+    def test_chunks_respect_budget_and_cover_document(self, tmp_path):
+        """Test every chunk fits the budget and chunks tile the file exactly."""
+        markdown = _write_markdown(tmp_path / "report.md")
+        data = markdown.read_bytes()
+
+        for max_chars in (1, 5, 16, 40):
+            index = build_chunk_index(markdown, max_chars=max_chars)
+
+            assert index.size_bytes == len(data)
+            assert index.chunks[0].start == 0
+            assert index.chunks[-1].end == len(data)
+            for previous, chunk in zip(index.chunks, index.chunks[1:], strict=False):
+                assert previous.end == chunk.start
+            for chunk in index.chunks:
+                text = read_chunk(markdown, chunk)
+                assert len(text) == chunk.chars <= max_chars
+
+    def test_oversized_sections_split_at_sub_headings(self, tmp_path):
+        """Test a section over the budget is split before a deeper heading."""
+        markdown = _write_markdown(tmp_path / "report.md")
+
+        index = build_chunk_index(markdown, max_chars=40)
+
+        scope = [
+            chunk
+            for chunk in index.chunks
+            if read_chunk(markdown, chunk).startswith("### Scope")
+        ]
+        assert scope and scope[0].heading_path == ["report", "Page 1", "Scope"]
+
+    def test_index_sidecar_round_trip(self, tmp_path):
+        """Test the sidecar is written next to the document and loads back."""
+        markdown = _write_markdown(tmp_path / "report.md")
+
+        index_path = write_chunk_index(markdown, max_tokens=10)
+
+        assert (
+            index_path == chunk_index_path(markdown) == tmp_path / "report.chunks.json"
+        )
+        assert load_chunk_index(markdown) == build_chunk_index(markdown, max_tokens=10)
+
+    @pytest.mark.asyncio
+    async def test_service_writes_chunk_index(self, tmp_path):
+        """Test collecting a document records the chunk index as an artifact."""
+        source = _write_markdown(tmp_path / "report.md")
+
+        result = await DocumentCollectionService().collect_document(
+            str(source), tmp_path / "out", chunk_max_tokens=20
+        )
+
+        assert result.success
+        assert result.artifacts["chunks"] == tmp_path / "out" / "report.chunks.json"
+        index = load_chunk_index(result.output_path)
+        assert all(chunk.approx_tokens <= 20 for chunk in index.chunks)
+
+    @pytest.mark.asyncio
+    async def test_service_chunking_can_be_disabled(self, tmp_path):
+        """Test the chunk option turns indexing off."""
+        source = _write_markdown(tmp_path / "report.md")
+
+        result = await DocumentCollectionService().collect_document(
+            str(source), tmp_path / "out", chunk=False
+        )
+
+        assert "chunks" not in result.artifacts
+        assert not (tmp_path / "out" / "report.chunks.json").exists()
@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -80,3 +82,22 @@ def test_invalid_command(runner):
     result = runner.invoke(cli, ["invalid-command"])
     assert result.exit_code != 0
     assert "Error: No such command" in result.output
+
+
+def test_cli_import_defers_heavy_modules():
+    """Test importing the CLI loads neither the service nor rich."""
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import document_collection.cli.main; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent / "src")},
+    ).stdout.split()
+
+    assert "document_collection.core.service" not in loaded
+    assert "document_collection.converters.factory" not in loaded
+    assert "rich" not in loaded
@@ -292,7 +292,9 @@ class TestCLICommands:
         )
 
         assert result.exit_code == 0
-        mock_run_server_http.assert_called_once_with(port=9000)
+        mock_run_server_http.assert_called_once_with(
+            port=9000, host="127.0.0.1", workers=1
+        )
 
     @patch("document_collection.mcp_server.server.run_server_http")
     def test_mcp_server_default_http_port(self, mock_run_server_http):
@@ -300,7 +302,31 @@ class TestCLICommands:
         result = self.runner.invoke(mcp_server, ["--transport", "http"])
 
         assert result.exit_code == 0
-        mock_run_server_http.assert_called_once_with(port=8000)
+        mock_run_server_http.assert_called_once_with(
+            port=8000, host="127.0.0.1", workers=1
+        )
+
+    @patch("document_collection.mcp_server.server.run_server_http")
+    def test_mcp_server_http_host_and_workers(self, mock_run_server_http):
+        """Test MCP server with HTTP transport on a given address with several workers."""
+        result = self.runner.invoke(
+            mcp_server,
+            [
+                "--transport",
+                "http",
+                "--host",
+                "0.0.0.0",
+                "--port",
+                "9000",
+                "--workers",
+                "4",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_run_server_http.assert_called_once_with(
+            port=9000, host="0.0.0.0", workers=4
+        )
 
     def test_collect_invalid_source(self):
         """Test collect command with invalid source."""
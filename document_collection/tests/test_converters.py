@@ -9,12 +9,96 @@ sys.path.insert(
 
 import pytest
 
+from document_collection.converters.compaction import compact_text
 from document_collection.converters.excel_converter import ExcelConverter
 from document_collection.converters.factory import ConverterFactory
+from document_collection.converters.html_converter import HtmlConverter
+from document_collection.converters.image_store import ImageStore
 from document_collection.converters.markdown_processor import MarkdownProcessor
+from document_collection.converters.page_cache import CachedPage, PageCache
 from document_collection.converters.pdf_converter import PdfConverter
 from document_collection.converters.powerpoint_converter import PowerPointConverter
+from document_collection.converters.running_lines import strip_running_lines
 from document_collection.converters.word_converter import WordConverter
+from document_collection.converters.worker_pool import worker_pool
+from document_collection.core.service import DocumentCollectionService
+
+
+def _build_pdf(path, pages, images=None):
+    """Write a PDF whose pages have the given text lines and image XObjects.
+
+    ``pages`` is a list of ``(lines, image_keys)``; ``images`` maps an image key
+    to ``(width, height, data, filter)``. Each key becomes one shared object.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import (
+        DecodedStreamObject,
+        DictionaryObject,
+        NameObject,
+        NumberObject,
+        StreamObject,
+    )
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    image_refs = {}
+    for key, (width, height, data, filter_name) in (images or {}).items():
+        stream = StreamObject()
+        stream._data = data
+        stream.update(
+            {
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Image"),
+                NameObject("/Width"): NumberObject(width),
+                NameObject("/Height"): NumberObject(height),
+                NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+                NameObject("/BitsPerComponent"): NumberObject(8),
+                NameObject("/Filter"): NameObject(filter_name),
+            }
+        )
+        image_refs[key] = writer._add_object(stream)
+
+    for lines, image_keys in pages:
+        page = writer.add_blank_page(612, 792)
+        ops = ["BT /F1 10 Tf 14 TL 50 750 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        ops.extend(f"q 32 0 0 32 50 50 cm /{key} Do Q" for key in image_keys)
+        content = DecodedStreamObject()
+        content.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(content)
+        resources = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        if image_keys:
+            resources[NameObject("/XObject")] = DictionaryObject(
+                {NameObject(f"/{key}"): image_refs[key] for key in image_keys}
+            )
+        page[NameObject("/Resources")] = resources
+
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def _jpeg_bytes(color, size=(32, 32)):
+    """Return a small JPEG image of a solid color."""
+    import io
+
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="JPEG")
+    return buffer.getvalue()
 
 
 class TestConverterFactory:
@@ -50,6 +134,13 @@ class TestConverterFactory:
         with pytest.raises(ValueError, match="Unsupported file type"):
             ConverterFactory.get_converter("document.txt")
 
+    def test_warm_up_preloads_parsers(self):
+        """Test warming up imports the installed parser libraries."""
+        loaded = ConverterFactory.warm_up()
+
+        assert "pypdf" in loaded
+        assert "pypdf" in sys.modules
+
 
 class TestPdfConverter:
     """Test PDF converter."""
@@ -74,6 +165,296 @@ class TestPdfConverter:
         result = await converter.convert(input_path, output_path)
         assert result == output_path
 
+    @pytest.mark.asyncio
+    async def test_jpeg_images_are_written_unchanged(self, tmp_path):
+        """Test DCTDecode streams are passed through as .jpg files."""
+        import zlib
+
+        jpeg = _jpeg_bytes((255, 0, 0))
+        _build_pdf(
+            tmp_path / "photos.pdf",
+            [(["Photo page"], ["Photo", "Raw"])],
+            images={
+                "Photo": (32, 32, jpeg, "/DCTDecode"),
+                "Raw": (2, 2, zlib.compress(bytes(12)), "/FlateDecode"),
+            },
+        )
+
+        output = await PdfConverter().convert(
+            tmp_path / "photos.pdf", tmp_path / "out" / "photos.md"
+        )
+
+        images_dir = tmp_path / "out" / "images"
+        jpeg_name = f"{ImageStore.digest(jpeg)}.jpg"
+        suffixes = sorted(path.suffix for path in images_dir.iterdir())
+        assert suffixes == [".jpg", ".png"]
+        assert (images_dir / jpeg_name).read_bytes() == jpeg
+        assert f"images/{jpeg_name}" in output.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_repeated_images_are_stored_once(self, tmp_path):
+        """Test a logo repeated on every page is written and referenced once."""
+        logo = _jpeg_bytes((0, 128, 0))
+        _build_pdf(
+            tmp_path / "logo.pdf",
+            [(["One"], ["Logo"]), (["Two"], ["Logo", "Copy"]), (["Three"], ["Logo"])],
+            images={
+                "Logo": (32, 32, logo, "/DCTDecode"),
+                "Copy": (32, 32, logo, "/DCTDecode"),
+            },
+        )
+
+        output = await PdfConverter().convert(
+            tmp_path / "logo.pdf", tmp_path / "out" / "logo.md"
+        )
+
+        images = list((tmp_path / "out" / "images").iterdir())
+        assert [path.read_bytes() for path in images] == [logo]
+        references = [
+            line
+            for line in output.read_text(encoding="utf-8").splitlines()
+            if line.startswith("![")
+        ]
+        assert references == [f"![Image from Page 1](images/{images[0].name})"]
+
+    @pytest.mark.asyncio
+    async def test_large_images_decoded_lazily_keep_order(self, tmp_path):
+        """Test deferred decoding extracts the same images in page order."""
+        import zlib
+
+        from pypdf import PdfReader
+
+        large = zlib.compress(bytes([10, 20, 30]) * (1024 * 1024))
+        other = zlib.compress(bytes([40, 50, 60]) * (1024 * 1024))
+        _build_pdf(
+            tmp_path / "large.pdf",
+            [(["One"], ["Large", "Photo"]), (["Two"], ["Large2"])],
+            images={
+                "Large": (1024, 1024, large, "/FlateDecode"),
+                "Large2": (1024, 1024, other, "/FlateDecode"),
+                "Photo": (32, 32, _jpeg_bytes((0, 0, 255)), "/DCTDecode"),
+            },
+        )
+        expected = sum(
+            len(page.images) for page in PdfReader(tmp_path / "large.pdf").pages
+        )
+
+        output = await PdfConverter().convert(
+            tmp_path / "large.pdf", tmp_path / "out" / "large.md", max_workers=2
+        )
+
+        content = output.read_text(encoding="utf-8")
+        references = [line for line in content.splitlines() if line.startswith("![")]
+        assert len(references) == expected == 3
+        assert [line.split("](")[0] for line in references] == [
+            "![Image from Page 1",
+            "![Image from Page 1",
+            "![Image from Page 2",
+        ]
+        assert references[0].endswith(".png)")
+        assert references[1].endswith(".jpg)")
+        assert len(list((tmp_path / "out" / "images").iterdir())) == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pages_reused_from_page_cache(self, tmp_path):
+        """Test a new revision only re-extracts the pages that changed."""
+        images = {"Logo": (32, 32, _jpeg_bytes((0, 128, 0)), "/DCTDecode")}
+        pages = [(["One"], ["Logo"]), (["Two"], []), (["Three"], ["Logo"])]
+        _build_pdf(tmp_path / "report.pdf", pages, images=images)
+        converter = PdfConverter()
+
+        first_stats = {}
+        await converter.convert(
+            tmp_path / "report.pdf", tmp_path / "out" / "report.md", stats=first_stats
+        )
+        assert (first_stats["pages_total"], first_stats["pages_reused"]) == (3, 0)
+
+        pages[1] = (["Two, revised"], [])
+        _build_pdf(tmp_path / "report.pdf", pages, images=images)
+        stats = {}
+        output = await converter.convert(
+            tmp_path / "report.pdf", tmp_path / "out" / "report.md", stats=stats
+        )
+        assert (stats["pages_total"], stats["pages_reused"]) == (3, 2)
+
+        uncached = await converter.convert(
+            tmp_path / "report.pdf", tmp_path / "fresh" / "report.md", page_cache=False
+        )
+        assert output.read_text(encoding="utf-8") == uncached.read_text(
+            encoding="utf-8"
+        )
+        assert "Two, revised" in output.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_page_cache_skipped_when_image_blob_missing(self, tmp_path):
+        """Test cached pages whose images were deleted are extracted again."""
+        images = {"Logo": (32, 32, _jpeg_bytes((0, 128, 0)), "/DCTDecode")}
+        _build_pdf(tmp_path / "logo.pdf", [(["One"], ["Logo"])], images=images)
+        converter = PdfConverter()
+        await converter.convert(tmp_path / "logo.pdf", tmp_path / "out" / "logo.md")
+        for image in (tmp_path / "out" / "images").iterdir():
+            image.unlink()
+
+        stats = {}
+        await converter.convert(
+            tmp_path / "logo.pdf", tmp_path / "out" / "logo.md", stats=stats
+        )
+
+        assert stats["pages_reused"] == 0
+        assert len(list((tmp_path / "out" / "images").iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_page_cache_keyed_by_image_passthrough(self, tmp_path):
+        """Test pages converted with other image options are not reused."""
+        images = {"Logo": (32, 32, _jpeg_bytes((0, 128, 0)), "/DCTDecode")}
+        _build_pdf(tmp_path / "logo.pdf", [(["One"], ["Logo"])], images=images)
+        converter = PdfConverter()
+        await converter.convert(tmp_path / "logo.pdf", tmp_path / "out" / "logo.md")
+
+        stats = {}
+        await converter.convert(
+            tmp_path / "logo.pdf",
+            tmp_path / "out" / "logo.md",
+            image_passthrough=False,
+            stats=stats,
+        )
+        assert stats["pages_reused"] == 0
+
+        await converter.convert(
+            tmp_path / "logo.pdf",
+            tmp_path / "out" / "logo.md",
+            image_passthrough=False,
+            stats=stats,
+        )
+        assert stats["pages_reused"] == 1
+
+    def test_page_cache_prunes_old_and_excess_pages(self, tmp_path):
+        """Test stale pages and the oldest pages over the limit are pruned."""
+        import time
+
+        cache = PageCache(tmp_path / "cache.db", max_age=3600, max_pages=2)
+        cache._connection.execute(
+            "INSERT INTO pdf_pages VALUES ('stale', '', '[]', ?)", (time.time() - 7200,)
+        )
+        cache.put_many([("first", CachedPage("One", []))])
+        cache.put_many(
+            [("second", CachedPage("Two", [])), ("third", CachedPage("Three", []))]
+        )
+        cache.put_many([("first", CachedPage("One", []))])
+
+        assert cache.get("stale") is None
+        assert cache.get("second") is None
+        assert cache.get("first") == CachedPage("One", [])
+        assert cache.get("third") == CachedPage("Three", [])
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_running_headers_and_footers_are_removed(self, tmp_path):
+        """Test lines repeated at the top and bottom of every page are dropped."""
+        pages = [
+            (["ACME Annual Report", body, f"Page {n} of 5"], [])
+            for n, body in enumerate(
+                ["Alpha.", "Bravo.", "Charlie.", "Delta.", "Echo."], 1
+            )
+        ]
+        _build_pdf(tmp_path / "report.pdf", pages)
+
+        stats = {}
+        output = await PdfConverter().convert(
+            tmp_path / "report.pdf", tmp_path / "out" / "report.md", stats=stats
+        )
+
+        content = output.read_text(encoding="utf-8")
+        assert "ACME Annual Report" not in content
+        assert "of 5" not in content
+        assert "Charlie." in content
+        assert stats["running_lines_bytes_saved"] > 0
+
+
+class TestRunningLines:
+    """Test running header and footer detection."""
+
+    def test_chapter_footers_with_page_numbers_are_removed(self):
+        """Test footers naming the current section are found by their page number."""
+        sections = ["Intro", "Intro", "Setup", "Setup", "Usage"]
+        pages = [
+            f"Guide\n{section} text, part {'one two three four five'.split()[n - 1]}.\n{section} {n}"
+            for n, section in enumerate(sections, 1)
+        ]
+
+        stripped, bytes_saved = strip_running_lines(pages)
+
+        assert stripped[2] == "Setup text, part three."
+        assert bytes_saved == sum(len(page) for page in pages) - sum(
+            len(page) for page in stripped
+        )
+
+    def test_body_lines_ending_in_numbers_are_kept(self):
+        """Test closing sentences that end in a year are not taken for page numbers."""
+        closing = [
+            "Revenue grew to 2019",
+            "Costs fell in 2021",
+            "The plan runs until 2020",
+            "Hiring resumed in 2024",
+            "Offices reopened in 2022",
+        ]
+        pages = [f"Guide\n{line}\n{n}" for n, line in enumerate(closing, 1)]
+
+        stripped, _ = strip_running_lines(pages)
+
+        assert stripped == closing
+
+    def test_short_documents_are_unchanged(self):
+        """Test documents below the minimum page count are left alone."""
+        pages = ["Header\nOne", "Header\nTwo"]
+
+        assert strip_running_lines(pages) == (pages, 0)
+
+    def test_lines_below_ratio_are_kept(self):
+        """Test a line repeated on a minority of pages is not treated as running text."""
+        pages = ["Note\nA", "Note\nB", "C\nD", "E\nF", "G\nH", "I\nJ"]
+
+        stripped, bytes_saved = strip_running_lines(pages)
+
+        assert stripped == pages
+        assert bytes_saved == 0
+
+
+class TestCompaction:
+    """Test compaction of extracted text."""
+
+    def test_dot_leaders_are_collapsed(self):
+        """Test table of contents leaders shrink to a short separator."""
+        text = "Introduction ........................ 1\nSecurity . . . . . . . . 20"
+
+        assert compact_text(text) == "Introduction ... 1\n\nSecurity ... 20"
+
+    def test_wrapped_lines_are_joined_into_paragraphs(self):
+        """Test hard-wrapped lines and line-break hyphens are rejoined."""
+        text = (
+            "The AWS WA Tool provides recommendations for making \n"
+            "workloads more reliable, secure, and cost-\n"
+            "effective.\n"
+            "Definitions\n"
+            "Every  day, experts assist custo\u00ad\n"
+            "mers."
+        )
+
+        assert compact_text(text) == (
+            "The AWS WA Tool provides recommendations for making workloads more "
+            "reliable, secure, and cost-effective.\n\n"
+            "Definitions\n\n"
+            "Every day, experts assist customers."
+        )
+
+    def test_list_items_start_new_blocks(self):
+        """Test bullets are not merged into the wrapped line above them."""
+        text = "Terms used: \n\u2022 A component is the code \n1. A workload"
+
+        assert compact_text(text) == (
+            "Terms used:\n\n\u2022 A component is the code\n\n1. A workload"
+        )
+
 
 class TestWordConverter:
     """Test Word converter."""
@@ -98,6 +479,133 @@ class TestWordConverter:
         result = await converter.convert(input_path, output_path)
         assert result == output_path
 
+    @pytest.mark.asyncio
+    async def test_streaming_keeps_body_order(self, tmp_path):
+        """Test the streaming path emits paragraphs and tables in body order."""
+        from docx import Document
+
+        doc = Document()
+        doc.add_heading("Overview", level=1)
+        doc.add_paragraph("Before the table")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Name"
+        table.cell(0, 1).text = "Value"
+        table.cell(1, 0).text = "a"
+        table.cell(1, 1).text = "b"
+        doc.add_paragraph("After the table")
+        doc.save(str(tmp_path / "ordered.docx"))
+
+        output = await WordConverter().convert(
+            tmp_path / "ordered.docx", tmp_path / "ordered.md"
+        )
+        content = output.read_text(encoding="utf-8")
+
+        assert "## Overview" in content
+        assert content.index("Before the table") < content.index("| Name | Value |")
+        assert content.index("| Name | Value |") < content.index("After the table")
+
+    @pytest.mark.asyncio
+    async def test_streaming_matches_python_docx_content(self, tmp_path):
+        """Test both code paths produce the same lines, only the order differs."""
+        from docx import Document
+
+        doc = Document()
+        doc.add_heading("Title heading", level=2)
+        doc.add_paragraph("Body text")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "x"
+        table.cell(0, 1).text = "y"
+        table.cell(1, 0).merge(table.cell(1, 1)).text = "merged"
+        doc.save(str(tmp_path / "parity.docx"))
+
+        fast = await WordConverter().convert(
+            tmp_path / "parity.docx", tmp_path / "fast.md"
+        )
+        slow = await WordConverter().convert(
+            tmp_path / "parity.docx", tmp_path / "slow.md", fast_path=False
+        )
+
+        fast_lines = sorted(fast.read_text(encoding="utf-8").splitlines())
+        slow_lines = sorted(slow.read_text(encoding="utf-8").splitlines())
+        assert fast_lines == slow_lines
+        assert "### Title heading" in fast_lines
+        assert "| merged | merged |" in fast_lines
+
+
+class TestImageStore:
+    """Test the content-addressed image store."""
+
+    def test_put_names_blobs_by_content(self, tmp_path):
+        """Test identical bytes are written once under their hash."""
+        store = ImageStore(tmp_path / "images")
+
+        first = store.put(b"same bytes", ".PNG")
+        second = store.put(b"same bytes", ".png")
+        other = store.put(b"other bytes", ".png")
+
+        assert first == second == f"{ImageStore.digest(b'same bytes')}.png"
+        assert other != first
+        assert store.images_written == 2
+        assert store.images_deduplicated == 1
+        assert store.bytes_deduplicated == len(b"same bytes")
+
+    def test_existing_blobs_are_not_rewritten(self, tmp_path):
+        """Test a new store instance reuses blobs already on disk."""
+        ImageStore(tmp_path).put(b"logo", ".jpg")
+
+        store = ImageStore(tmp_path)
+        store.put(b"logo", ".jpg")
+
+        assert store.images_written == 0
+        assert store.images_deduplicated == 1
+
+    def test_blobs_follow_the_umask(self, tmp_path):
+        """Test blobs get the mode of files written directly, not the temp file mode."""
+        reference = tmp_path / "reference.png"
+        reference.write_bytes(b"reference")
+
+        filename = ImageStore(tmp_path).put(b"logo", ".png")
+
+        assert (tmp_path / filename).stat().st_mode == reference.stat().st_mode
+
+    def test_blobs_follow_a_changed_umask(self, tmp_path):
+        """Test the umask in force when a blob is written is the one applied."""
+        import os
+        import stat
+
+        previous = os.umask(0o077)
+        try:
+            filename = ImageStore(tmp_path).put(b"logo", ".png")
+        finally:
+            os.umask(previous)
+
+        assert stat.S_IMODE((tmp_path / filename).stat().st_mode) == 0o600
+        assert [path.name for path in tmp_path.iterdir()] == [filename]
+
+    @pytest.mark.asyncio
+    async def test_documents_with_same_stem_keep_their_images(self, tmp_path):
+        """Test two documents with one stem no longer overwrite each other's images."""
+        import zipfile
+
+        from docx import Document
+
+        outputs = []
+        for folder, payload in (("a", b"\x89PNG first"), ("b", b"\x89PNG second")):
+            (tmp_path / folder).mkdir()
+            source = tmp_path / folder / "report.docx"
+            Document().save(str(source))
+            with zipfile.ZipFile(source, "a") as docx_zip:
+                docx_zip.writestr("word/media/image1.png", payload)
+            outputs.append(
+                await WordConverter().convert(
+                    source, tmp_path / "out" / f"report_{folder}.md"
+                )
+            )
+
+        stored = {path.read_bytes() for path in (tmp_path / "out" / "images").iterdir()}
+        assert stored == {b"\x89PNG first", b"\x89PNG second"}
+        assert outputs[0].read_text() != outputs[1].read_text()
+
 
 class TestPowerPointConverter:
     """Test PowerPoint converter."""
@@ -122,6 +630,85 @@ class TestPowerPointConverter:
         result = await converter.convert(input_path, output_path)
         assert result == output_path
 
+    @staticmethod
+    def _build_deck(path):
+        """Write a small deck with notes, a table and a grouped text box."""
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        prs = Presentation()
+        first = prs.slides.add_slide(prs.slide_layouts[1])
+        first.shapes.title.text = "Welcome"
+        first.notes_slide.notes_text_frame.text = "Say hello"
+        second = prs.slides.add_slide(prs.slide_layouts[5])
+        second.shapes.title.text = "Numbers"
+        table = second.shapes.add_table(
+            2, 2, Inches(1), Inches(1), Inches(4), Inches(2)
+        ).table
+        table.cell(0, 0).text = "Key"
+        table.cell(0, 1).text = "Value"
+        table.cell(1, 0).text = "a"
+        table.cell(1, 1).text = "1"
+        group = second.shapes.add_group_shape()
+        box = group.shapes.add_textbox(Inches(1), Inches(4), Inches(2), Inches(1))
+        box.text_frame.text = "Grouped note"
+        prs.save(str(path))
+
+    @pytest.mark.asyncio
+    async def test_streaming_reads_slides_notes_and_groups(self, tmp_path):
+        """Test the XML path extracts notes, tables and grouped shapes."""
+        self._build_deck(tmp_path / "deck.pptx")
+
+        output = await PowerPointConverter().convert(
+            tmp_path / "deck.pptx", tmp_path / "deck.md"
+        )
+        content = output.read_text(encoding="utf-8")
+
+        assert content.index("## Slide 1") < content.index("## Slide 2")
+        assert "**Speaker Notes:** Say hello" in content
+        assert "| Key | Value |" in content
+        assert "### Grouped note" in content
+
+    @pytest.mark.asyncio
+    async def test_parallel_chunks_match_sequential(self, tmp_path):
+        """Test converting in parallel chunks gives the same output."""
+        self._build_deck(tmp_path / "deck.pptx")
+        converter = PowerPointConverter()
+
+        sequential = await converter.convert(
+            tmp_path / "deck.pptx", tmp_path / "sequential.md"
+        )
+        parallel = await converter.convert(
+            tmp_path / "deck.pptx",
+            tmp_path / "parallel.md",
+            parallel_threshold=1,
+            max_workers=2,
+        )
+
+        assert parallel.read_text(encoding="utf-8") == sequential.read_text(
+            encoding="utf-8"
+        )
+
+    @pytest.mark.asyncio
+    async def test_parallel_conversions_share_the_worker_pool(self, tmp_path):
+        """Test parallel conversions reuse one pool that the service shuts down."""
+        self._build_deck(tmp_path / "deck.pptx")
+        converter = PowerPointConverter()
+        pool = worker_pool()
+
+        for name in ("first.md", "second.md"):
+            await converter.convert(
+                tmp_path / "deck.pptx",
+                tmp_path / name,
+                parallel_threshold=1,
+                max_workers=2,
+            )
+
+        assert worker_pool() is pool
+        assert pool._mp_context.get_start_method() != "fork"
+        DocumentCollectionService().close()
+        assert worker_pool() is not pool
+
 
 class TestExcelConverter:
     """Test Excel converter."""
@@ -162,10 +749,195 @@ class TestMarkdownProcessor:
         assert "md" in converter.get_supported_formats()
 
     @pytest.mark.asyncio
-    async def test_convert_returns_output_path(self):
+    async def test_convert_returns_output_path(self, tmp_path):
         """Test Markdown convert method returns output path."""
         converter = MarkdownProcessor()
-        input_path = Path("test.md")
-        output_path = Path("test.md")
+        input_path = tmp_path / "test.md"
+        input_path.write_bytes(Path("test.md").read_bytes())
+        output_path = input_path
         result = await converter.convert(input_path, output_path)
         assert result == output_path
+
+    @pytest.mark.asyncio
+    async def test_normalises_headings_and_whitespace(self, tmp_path):
+        """Test line endings, headings, whitespace and blank lines are normalised."""
+        source = tmp_path / "notes.md"
+        source.write_bytes(
+            b"\xef\xbb\xbf\r\n\r\nTitle\r\n=====\r\n\r\n\r\n\r\n"
+            b"Body text   \r\n##   Section ##\r\nSub\r\n---\r\n#hashtag\r\n"
+            b"- item\r\n---\r\n"
+        )
+
+        output = await MarkdownProcessor().convert(
+            source, tmp_path / "out" / "notes.md"
+        )
+
+        assert output.read_bytes() == (
+            b"# Title\n\nBody text\n## Section\n## Sub\n#hashtag\n- item\n---\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_strips_mixed_trailing_whitespace(self, tmp_path):
+        """Test any mix of trailing tabs and spaces is removed, however long."""
+        source = tmp_path / "notes.md"
+        source.write_bytes(b"abc \t\nnext \nfoo\t \t \nbar" + b" \t" * 20 + b"\n\t\n")
+
+        output = await MarkdownProcessor().convert(
+            source, tmp_path / "out" / "notes.md"
+        )
+
+        assert output.read_bytes() == b"abc\nnext\nfoo\nbar\n"
+
+    @pytest.mark.asyncio
+    async def test_hard_line_breaks_are_kept(self, tmp_path):
+        """Test two or more trailing spaces inside a paragraph stay a line break."""
+        source = tmp_path / "notes.md"
+        source.write_bytes(b"Line one  \nline two    \nline three  \n\n    \nNext  \n")
+
+        output = await MarkdownProcessor().convert(
+            source, tmp_path / "out" / "notes.md"
+        )
+
+        assert output.read_bytes() == b"Line one  \nline two  \nline three\n\nNext\n"
+
+    @pytest.mark.asyncio
+    async def test_front_matter_and_code_blocks_are_kept(self, tmp_path):
+        """Test front matter is reported and fenced code is copied unchanged."""
+        source = tmp_path / "notes.md"
+        source.write_text(
+            "---\ntitle: Review notes\ntags: [security]\n---\n\n\n"
+            "```bash\n#  not a heading   \n\n\n\n```\n",
+            encoding="utf-8",
+        )
+
+        stats = {}
+        output = await MarkdownProcessor().convert(source, source, stats=stats)
+
+        assert stats["front_matter"] == {"title": "Review notes", "tags": ["security"]}
+        assert output.read_text(encoding="utf-8") == (
+            "---\ntitle: Review notes\ntags: [security]\n---\n\n"
+            "```bash\n#  not a heading   \n\n\n\n```\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_block_boundaries_do_not_change_output(self, tmp_path, monkeypatch):
+        """Test streaming in tiny blocks gives the same result as one block."""
+        from document_collection.converters import markdown_processor
+
+        source = tmp_path / "notes.md"
+        source.write_text(
+            "Intro\n\n\n\nHeading\n-------\n```\ncode  \n```\n\n###  Last  ###\n",
+            encoding="utf-8",
+        )
+        expected = await MarkdownProcessor().convert(source, tmp_path / "one.md")
+
+        monkeypatch.setattr(markdown_processor, "READ_BLOCK_SIZE", 3)
+        streamed = await MarkdownProcessor().convert(source, tmp_path / "many.md")
+
+        assert streamed.read_text(encoding="utf-8") == expected.read_text(
+            encoding="utf-8"
+        )
+        assert "## Heading\n" in expected.read_text(encoding="utf-8")
+
+
+class TestHtmlConverter:
+    """Test the streaming HTML converter."""
+
+    PAGE = (
+        "<!DOCTYPE html><html><head><title>Ignored</title>"
+        "<style>p { color: red }</style></head><body>"
+        '<nav><a href="/">Home</a></nav>'
+        "<main><h1>Release   notes</h1>"
+        '<p>Read the <a href="https://example.com/guide">guide</a> <b>first</b>.</p>'
+        "<ul><li>Faster</li><li>Safer<ol><li>sandbox</li></ol></li></ul>"
+        "<table><tr><th>Option</th><th>Default</th></tr>"
+        "<tr><td>mode</td><td>a|b</td></tr></table>"
+        '<pre><code class="language-python">def f():\n    return 1\n</code></pre>'
+        '<script>document.write("<p>injected</p>")</script>'
+        "</main><footer>Copyright</footer></body></html>"
+    )
+
+    @pytest.mark.asyncio
+    async def test_converts_structure_and_drops_boilerplate(
+        self, tmp_path, monkeypatch
+    ):
+        """Test the Markdown is the same whatever the chunks fed to the parser."""
+        from document_collection.converters import html_converter
+
+        source = tmp_path / "page.html"
+        source.write_text(self.PAGE, encoding="utf-8")
+        whole = await HtmlConverter().convert(source, tmp_path / "whole.md")
+
+        monkeypatch.setattr(html_converter, "READ_BLOCK_SIZE", 7)
+        chunked = await HtmlConverter().convert(source, tmp_path / "chunked.md")
+        content = whole.read_text(encoding="utf-8")
+
+        assert chunked.read_text(encoding="utf-8") == content
+        assert "# Release notes\n" in content
+        assert "Read the [guide](https://example.com/guide) **first**." in content
+        assert "- Faster\n- Safer\n  1. sandbox\n" in content
+        assert "| Option | Default |\n| --- | --- |\n| mode | a\\|b |\n" in content
+        assert "```python\ndef f():\n    return 1\n```\n" in content
+        for boilerplate in ("Home", "Copyright", "injected", "color", "Ignored"):
+            assert boilerplate not in content
+
+    @pytest.mark.asyncio
+    async def test_page_header_is_dropped_and_article_header_kept(self, tmp_path):
+        """Test only a header outside the main content counts as the page banner."""
+        source = tmp_path / "post.html"
+        source.write_text(
+            "<body><header>Site banner</header><article>"
+            "<header><h2>Post title</h2></header><p>Body.</p></article>"
+            "<header>Trailing banner</header></body>",
+            encoding="utf-8",
+        )
+
+        content = (
+            await HtmlConverter().convert(source, tmp_path / "post.md")
+        ).read_text(encoding="utf-8")
+
+        assert "## Post title\n" in content
+        assert "Body." in content
+        assert "banner" not in content
+
+    @pytest.mark.asyncio
+    async def test_encoding_from_meta_tag_else_utf8(self, tmp_path):
+        """Test declared encodings are honoured and undeclared pages read as UTF-8."""
+        declared = tmp_path / "declared.html"
+        declared.write_bytes(
+            '<meta charset="windows-1252"><p>caf\xe9</p>'.encode("cp1252")
+        )
+        undeclared = tmp_path / "undeclared.html"
+        undeclared.write_bytes("<p>café ✓</p>".encode())
+
+        first = await HtmlConverter().convert(declared, tmp_path / "declared.md")
+        second = await HtmlConverter().convert(undeclared, tmp_path / "undeclared.md")
+
+        assert "café" in first.read_text(encoding="utf-8")
+        assert "café ✓" in second.read_text(encoding="utf-8")
+
+    def test_long_text_is_written_before_the_element_ends(self):
+        """Test one huge element does not hold the whole page in memory."""
+        from lxml import etree
+
+        from document_collection.converters.html_converter import (
+            MAX_BLOCK_CHARS,
+            _MarkdownTarget,
+        )
+
+        target = _MarkdownTarget()
+        parser = etree.HTMLParser(target=target, encoding="utf-8")
+        parser.feed(b"<p>" + b"word " * (MAX_BLOCK_CHARS // 2))
+
+        assert target.drain()
+        assert not target._text
+
+    def test_factory_returns_html_converter(self):
+        """Test pages are dispatched by extension and content type."""
+        assert isinstance(ConverterFactory.get_converter("index.htm"), HtmlConverter)
+        assert isinstance(
+            ConverterFactory.get_converter(
+                "page", mime_type="text/html; charset=utf-8"
+            ),
+            HtmlConverter,
+        )
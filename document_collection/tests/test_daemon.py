@@ -0,0 +1,218 @@
+"""Tests for the local collection daemon of the CLI."""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.cli import daemon as daemon_module
+from document_collection.cli.daemon import (
+    CollectionDaemon,
+    collect_via_daemon,
+    daemon_status,
+    stop_daemon,
+)
+from document_collection.cli.main import collect
+from document_collection.converters.markdown_processor import MarkdownProcessor
+from document_collection.core.exceptions import ConfigurationError, ProcessingError
+from document_collection.core.models import CollectionResult
+
+
+async def _start(daemon: CollectionDaemon) -> asyncio.Task[None]:
+    task = asyncio.create_task(daemon.serve())
+    while await daemon_status(daemon.socket_path) is None:
+        assert not task.done(), task.exception()
+        await asyncio.sleep(0.01)
+    return task
+
+
+class TestCollectionDaemon:
+    """Test serving collection requests over the socket."""
+
+    @pytest.mark.asyncio
+    async def test_collects_relative_sources_and_stops(self, tmp_path, monkeypatch):
+        """Test a request is collected by the daemon relative to the client."""
+        monkeypatch.chdir(tmp_path)
+        Path("notes.md").write_text("# Notes\n\nWarm.\n", encoding="utf-8")
+        socket_path = tmp_path / "daemon.sock"
+        task = await _start(CollectionDaemon(socket_path))
+
+        results = await collect_via_daemon(
+            ["notes.md"], Path("out"), socket_path=socket_path
+        )
+        status = await daemon_status(socket_path)
+        with pytest.raises(ConfigurationError):
+            await CollectionDaemon(socket_path).serve()
+        stopped = await stop_daemon(socket_path)
+        await task
+
+        assert results[0].success
+        assert results[0].source == "notes.md"
+        assert (tmp_path / "out" / "notes.md").exists()
+        assert status["requests"] >= 2
+        assert stopped
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_no_daemon_means_no_results(self, tmp_path):
+        """Test clients see None without a daemon, also for a stale socket."""
+        stale = tmp_path / "stale.sock"
+        left_behind = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        left_behind.bind(str(stale))
+        left_behind.close()
+
+        assert (
+            await collect_via_daemon(
+                ["a.md"], tmp_path, socket_path=tmp_path / "none.sock"
+            )
+            is None
+        )
+        assert await daemon_status(stale) is None
+        assert not await stop_daemon(stale)
+
+    @pytest.mark.asyncio
+    async def test_socket_of_another_user_is_not_trusted(self, tmp_path, monkeypatch):
+        """Test clients ignore a socket they do not own and fall back to in-process work."""
+        socket_path = tmp_path / "daemon.sock"
+        task = await _start(CollectionDaemon(socket_path))
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(socket_path).st_uid + 1)
+
+        results = await collect_via_daemon(["a.md"], tmp_path, socket_path=socket_path)
+        status = await daemon_status(socket_path)
+        monkeypatch.undo()
+        await stop_daemon(socket_path)
+        await task
+
+        assert results is None
+        assert status is None
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_private_directory_and_socket_mode(self, tmp_path):
+        """Test the socket directory is created private and the socket owner-only."""
+        socket_path = tmp_path / "private" / "daemon.sock"
+        task = await _start(CollectionDaemon(socket_path))
+        directory_mode = socket_path.parent.stat().st_mode & 0o777
+        socket_mode = socket_path.stat().st_mode & 0o777
+        await stop_daemon(socket_path)
+        await task
+
+        assert directory_mode == 0o700
+        assert socket_mode == 0o600
+
+    @pytest.mark.asyncio
+    async def test_busy_daemon_answers_and_keeps_its_socket(
+        self, tmp_path, monkeypatch
+    ):
+        """Test a daemon answers pings while converting and is not replaced."""
+        convert = MarkdownProcessor.convert
+
+        async def slow_convert(self, input_path, output_path, **kwargs):
+            # Blocks its thread the way a parser library does
+            time.sleep(1.0)
+            return await convert(self, input_path, output_path, **kwargs)
+
+        monkeypatch.setattr(MarkdownProcessor, "convert", slow_convert)
+        (tmp_path / "notes.md").write_text("# Notes\n\nBusy.\n", encoding="utf-8")
+        socket_path = tmp_path / "daemon.sock"
+        task = await _start(CollectionDaemon(socket_path))
+
+        collection = asyncio.create_task(
+            collect_via_daemon(
+                [str(tmp_path / "notes.md")], tmp_path / "out", socket_path=socket_path
+            )
+        )
+        await asyncio.sleep(0.1)
+        started = time.monotonic()
+        status = await daemon_status(socket_path)
+        ping_seconds = time.monotonic() - started
+        with pytest.raises(ConfigurationError):
+            await CollectionDaemon(socket_path).serve()
+        results = await collection
+        await stop_daemon(socket_path)
+        await task
+
+        assert status is not None
+        assert ping_seconds < 0.5
+        assert results[0].success
+
+    @pytest.mark.asyncio
+    async def test_silent_listener_is_not_replaced(self, tmp_path):
+        """Test a socket that accepts connections is kept even when pings go unanswered."""
+        socket_path = tmp_path / "daemon.sock"
+        released = asyncio.Event()
+
+        async def hang(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await released.wait()
+            writer.close()
+
+        server = await asyncio.start_unix_server(hang, path=str(socket_path))
+        async with server:
+            with pytest.raises(ConfigurationError):
+                await CollectionDaemon(socket_path).serve()
+            exists = socket_path.exists()
+            released.set()
+            await asyncio.sleep(0.01)
+
+        assert exists
+
+    @pytest.mark.asyncio
+    async def test_hung_daemon_times_out(self, tmp_path, monkeypatch):
+        """Test a daemon that never answers does not block the client."""
+        socket_path = tmp_path / "hung.sock"
+        released = asyncio.Event()
+
+        async def hang(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await released.wait()
+            writer.close()
+
+        server = await asyncio.start_unix_server(hang, path=str(socket_path))
+        monkeypatch.setattr(daemon_module, "DAEMON_PING_TIMEOUT", 0.05)
+        monkeypatch.setattr(
+            daemon_module, "get_config", lambda: {"daemon_timeout": 0.05}
+        )
+
+        async with server:
+            status = await daemon_status(socket_path)
+            with pytest.raises(ProcessingError, match="did not answer"):
+                await collect_via_daemon(["a.md"], tmp_path, socket_path=socket_path)
+            released.set()
+
+        assert status is None
+
+
+class TestDaemonClient:
+    """Test the CLI hands work to a running daemon."""
+
+    def test_collect_uses_daemon_when_running(self, tmp_path):
+        """Test the in-process service is not started when the daemon answers."""
+        result = CollectionResult(
+            success=True, source="a.md", output_path=tmp_path / "a.md"
+        )
+
+        with (
+            patch(
+                "document_collection.cli.main.collect_via_daemon",
+                AsyncMock(return_value=[result]),
+            ) as client,
+            patch("document_collection.cli.main.DocumentCollectionService") as service,
+        ):
+            outcome = CliRunner().invoke(collect, ["a.md", "-d", str(tmp_path)])
+
+        assert outcome.exit_code == 0
+        assert "Successfully collected" in outcome.output
+        client.assert_awaited_once()
+        service.assert_not_called()
@@ -0,0 +1,196 @@
+"""Tests for near-duplicate document detection."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core.service import DocumentCollectionService
+from document_collection.search.duplicates import (
+    LSH_BANDS,
+    SIGNATURE_BINS,
+    DuplicateIndex,
+    _candidates_query,
+    _probes,
+    minhash_signature,
+    similarity,
+)
+
+WORDS = (
+    "reliability security cost optimization operational excellence performance efficiency "
+    "workload architecture review design principle recovery backup region zone identity"
+).split()
+
+
+def _text(seed: int, words: int = 600) -> str:
+    """Build a deterministic pseudo-random text."""
+    state = seed
+    parts = []
+    for _ in range(words):
+        state = (state * 1103515245 + 12345) % (1 << 31)
+        parts.append(WORDS[state % len(WORDS)])
+    return " ".join(parts)
+
+
+class TestMinHash:
+    """Test signatures and similarity estimates."""
+
+    def test_signature_is_deterministic(self):
+        """Test the same text gives the same full signature."""
+        first = minhash_signature(_text(1))
+        second = minhash_signature(_text(1))
+
+        assert first.shape == (SIGNATURE_BINS,)
+        assert similarity(first, second) == 1.0
+        assert minhash_signature("  ...  ") is None
+
+    def test_formatting_does_not_matter(self):
+        """Test Markdown syntax and line wrapping are ignored."""
+        text = _text(2)
+        formatted = "# Title\n\n" + text[:300] + "\n\n**" + text[300:] + "**\n"
+
+        assert (
+            similarity(minhash_signature("title " + text), minhash_signature(formatted))
+            == 1.0
+        )
+
+    def test_similarity_tracks_overlap(self):
+        """Test a slightly edited copy scores high and unrelated text scores low."""
+        original = _text(3)
+        edited = original + " " + _text(4, words=40)
+
+        assert similarity(minhash_signature(original), minhash_signature(edited)) > 0.8
+        assert (
+            similarity(minhash_signature(original), minhash_signature(_text(5))) < 0.2
+        )
+
+
+class TestDuplicateIndex:
+    """Test the LSH index and the collection workflow."""
+
+    def test_find_returns_matches_above_threshold(self, tmp_path):
+        """Test only similar documents are returned, excluding the document itself."""
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).touch()
+        with DuplicateIndex(tmp_path) as index:
+            index.add(tmp_path / "a.md", minhash_signature(_text(6)))
+            index.add(tmp_path / "b.md", minhash_signature(_text(7)))
+            signature = minhash_signature(_text(6) + " appendix")
+
+            matches = index.find(signature, threshold=0.8)
+            assert [match.document.name for match in matches] == ["a.md"]
+            assert index.find(signature, threshold=0.8, exclude=tmp_path / "a.md") == []
+
+            index.remove(tmp_path / "a.md")
+            assert index.find(signature, threshold=0.8) == []
+
+    def test_deleted_documents_are_forgotten(self, tmp_path):
+        """Test a match whose file is gone is left out and removed from the index."""
+        with DuplicateIndex(tmp_path) as index:
+            index.add(tmp_path / "gone.md", minhash_signature(_text(6)))
+
+            assert index.find(minhash_signature(_text(6)), threshold=0.8) == []
+            assert index._connection.execute(
+                "SELECT COUNT(*) FROM bands"
+            ).fetchone() == (0,)
+
+    def test_candidates_are_probed_through_the_key_index(self, tmp_path):
+        """Test finding candidates never scans the signatures or all bands."""
+        with DuplicateIndex(tmp_path) as index:
+            index.add(tmp_path / "a.md", minhash_signature(_text(8)))
+            plan = index._connection.execute(
+                "EXPLAIN QUERY PLAN " + _candidates_query(LSH_BANDS),
+                _probes(list(range(LSH_BANDS))),
+            ).fetchall()
+
+        details = [row[-1] for row in plan]
+        assert "SEARCH bands USING INDEX bands_by_key (band=? AND key=?)" in details
+        assert not any(
+            detail.startswith(("SCAN bands", "SCAN signatures")) for detail in details
+        )
+
+    @pytest.mark.asyncio
+    async def test_collect_document_flags_duplicates(self, tmp_path):
+        """Test a second copy under another name is flagged but kept."""
+        for name in ("first.md", "second.md"):
+            (tmp_path / name).write_text(f"# Notes\n\n{_text(8)}\n", encoding="utf-8")
+        service = DocumentCollectionService()
+
+        first = await service.collect_document(
+            str(tmp_path / "first.md"), tmp_path / "out"
+        )
+        again = await service.collect_document(
+            str(tmp_path / "first.md"), tmp_path / "out"
+        )
+        second = await service.collect_document(
+            str(tmp_path / "second.md"), tmp_path / "out"
+        )
+
+        assert first.duplicates == [] and again.duplicates == []
+        assert [match.document.name for match in second.duplicates] == ["first.md"]
+        assert second.output_path.name == "second.md"
+        assert any("Near-duplicate" in warning for warning in second.warnings)
+
+    @pytest.mark.asyncio
+    async def test_collect_document_skips_duplicates(self, tmp_path):
+        """Test skip mode drops the new copy and points at the earlier document."""
+        (tmp_path / "first.md").write_text(f"# Notes\n\n{_text(9)}\n", encoding="utf-8")
+        (tmp_path / "copy.md").write_text(f"# Notes\n\n{_text(9)}\n", encoding="utf-8")
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(tmp_path / "first.md"), tmp_path / "out")
+        result = await service.collect_document(
+            str(tmp_path / "copy.md"), tmp_path / "out", duplicates="skip"
+        )
+
+        assert result.success
+        assert result.output_path.name == "first.md"
+        assert "chunks" not in result.artifacts
+        assert not (tmp_path / "out" / "copy.md").exists()
+        assert (tmp_path / "copy.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_deleted_originals_are_not_matched(self, tmp_path):
+        """Test a document deleted from the collection no longer swallows a new copy."""
+        (tmp_path / "a.md").write_text(f"# Notes\n\n{_text(10)}\n", encoding="utf-8")
+        (tmp_path / "b.md").write_text(
+            f"# Notes\n\n{_text(10)} {_text(11, words=5)}\n", encoding="utf-8"
+        )
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(tmp_path / "a.md"), tmp_path / "out")
+        (tmp_path / "out" / "a.md").unlink()
+        result = await service.collect_document(
+            str(tmp_path / "b.md"), tmp_path / "out", duplicates="skip"
+        )
+
+        assert result.success
+        assert result.duplicates == []
+        assert result.output_path == tmp_path / "out" / "b.md"
+        assert result.output_path.is_file()
+        with DuplicateIndex(tmp_path / "out") as index:
+            paths = [
+                path
+                for (path,) in index._connection.execute("SELECT path FROM signatures")
+            ]
+        assert paths == ["b.md"]
+
+    @pytest.mark.asyncio
+    async def test_skipped_copies_are_not_reported(self, tmp_path):
+        """Test skip mode reports no original copy once it is discarded."""
+        (tmp_path / "first.md").write_text(
+            f"# Notes\n\n{_text(12)}\n", encoding="utf-8"
+        )
+        (tmp_path / "copy.md").write_text(f"# Notes\n\n{_text(12)}\n", encoding="utf-8")
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(tmp_path / "first.md"), tmp_path / "out")
+        result = await service.collect_document(
+            str(tmp_path / "copy.md"), tmp_path / "out", duplicates="skip"
+        )
+
+        assert result.output_path == tmp_path / "out" / "first.md"
+        assert result.original_path is None
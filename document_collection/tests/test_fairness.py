@@ -0,0 +1,166 @@
+"""Tests for fair scheduling of conversions between clients."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.converters.markdown_processor import MarkdownProcessor
+from document_collection.core.models import CollectionResult
+from document_collection.core.service import DocumentCollectionService
+from document_collection.mcp_server.fairness import FairScheduler
+
+
+async def _occupy(scheduler: FairScheduler, release: asyncio.Event) -> None:
+    async def wait() -> None:
+        await release.wait()
+
+    await scheduler.run("holder", wait)
+
+
+class TestFairScheduler:
+    """Test the order in which waiting work is granted slots."""
+
+    @pytest.mark.asyncio
+    async def test_clients_take_turns_and_interactive_goes_first(self):
+        """Test a big batch does not delay other clients or interactive work."""
+        scheduler = FairScheduler(capacity=1)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        def work(name: str):
+            async def record() -> str:
+                order.append(name)
+                return name
+
+            return record
+
+        holder = asyncio.create_task(_occupy(scheduler, release))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.create_task(scheduler.run("a", work("a1"), bulk=True)),
+            asyncio.create_task(scheduler.run("a", work("a2"), bulk=True)),
+            asyncio.create_task(scheduler.run("a", work("a3"), bulk=True)),
+            asyncio.create_task(scheduler.run("b", work("b1"), bulk=True)),
+            asyncio.create_task(scheduler.run("c", work("c1"))),
+        ]
+        await asyncio.sleep(0)
+        queued = scheduler.stats()
+        release.set()
+        await asyncio.gather(holder, *waiting)
+
+        assert (
+            queued["bulk_queued"],
+            queued["bulk_clients"],
+            queued["interactive_queued"],
+        ) == (4, 2, 1)
+        assert order == ["c1", "a1", "b1", "a2", "a3"]
+        assert scheduler.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_turn(self):
+        """Test work cancelled while waiting is skipped and leaks no slot."""
+        scheduler = FairScheduler(capacity=1)
+        release = asyncio.Event()
+        ran: list[str] = []
+
+        async def record() -> None:
+            ran.append("b")
+
+        holder = asyncio.create_task(_occupy(scheduler, release))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(scheduler.run("a", record))
+        kept = asyncio.create_task(scheduler.run("b", record))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+        await asyncio.gather(holder, kept)
+
+        assert cancelled.cancelled()
+        assert ran == ["b"]
+        assert scheduler.stats()["running"] == 0
+
+
+class TestScheduledBatch:
+    """Test batches collected through a shared scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_call_waits_for_one_document_only(self, monkeypatch):
+        """Test a single document overtakes the rest of a running batch."""
+        service = DocumentCollectionService()
+        scheduler = FairScheduler(capacity=1)
+        finished: list[str] = []
+
+        async def collect(source, destination_path=None, **options):
+            await asyncio.sleep(0.01)
+            finished.append(source)
+            return CollectionResult(success=True, source=source)
+
+        monkeypatch.setattr(service, "collect_document", collect)
+        batch = asyncio.create_task(
+            service.collect_documents(
+                [f"batch{n}" for n in range(4)],
+                schedule=lambda operation: scheduler.run(
+                    "bulk-client", operation, bulk=True
+                ),
+            )
+        )
+        await asyncio.sleep(0.005)
+        single = await scheduler.run("interactive-client", lambda: collect("single"))
+        results = await batch
+
+        assert single.success
+        assert finished[:2] == ["batch0", "single"]
+        assert [result.source for result in results] == [f"batch{n}" for n in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_blocking_conversion_leaves_the_loop_free(
+        self, tmp_path, monkeypatch
+    ):
+        """Test an interactive document is collected while a bulk conversion blocks."""
+        convert = MarkdownProcessor.convert
+
+        async def slow_convert(self, input_path, output_path, **kwargs):
+            if input_path.stem == "bulk":
+                # Blocks its thread the way a parser library does
+                time.sleep(1.0)
+            return await convert(self, input_path, output_path, **kwargs)
+
+        monkeypatch.setattr(MarkdownProcessor, "convert", slow_convert)
+        for name in ("bulk", "single"):
+            (tmp_path / f"{name}.md").write_text(
+                f"# {name}\n\nText.\n", encoding="utf-8"
+            )
+        service = DocumentCollectionService()
+        scheduler = FairScheduler(capacity=2)
+
+        bulk = asyncio.create_task(
+            scheduler.run(
+                "bulk-client",
+                lambda: service.collect_document(
+                    str(tmp_path / "bulk.md"), tmp_path / "out"
+                ),
+                bulk=True,
+            )
+        )
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        single = await scheduler.run(
+            "interactive-client",
+            lambda: service.collect_document(
+                str(tmp_path / "single.md"), tmp_path / "out"
+            ),
+        )
+        elapsed = time.monotonic() - started
+        bulk_done = bulk.done()
+        await bulk
+        service.close()
+
+        assert single.success
+        assert not bulk_done
+        assert elapsed < 0.5
@@ -0,0 +1,252 @@
+"""Tests for background batch jobs."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core import config as config_module
+from document_collection.core.jobs import JobScheduler, JobStore
+from document_collection.core.models import CollectionResult
+from document_collection.core.service import DocumentCollectionService
+from document_collection.mcp_server import server
+from document_collection.mcp_server.server import (
+    cancel_job,
+    collect_batch,
+    get_job_status,
+    submit_batch,
+)
+
+
+def _write_sources(directory: Path, count: int) -> list[str]:
+    """Write Markdown sources and return their paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    sources = []
+    for number in range(count):
+        path = directory / f"doc{number}.md"
+        path.write_text(f"# Document {number}\n\nBody {number}.\n", encoding="utf-8")
+        sources.append(str(path))
+    return sources
+
+
+def _result(
+    source: str, success: bool = True, output: Path | None = None
+) -> CollectionResult:
+    return CollectionResult(
+        success=success,
+        source=source,
+        output_path=output,
+        errors=[] if success else ["boom"],
+    )
+
+
+class TestJobStore:
+    """Test the job table."""
+
+    def test_progress_and_pagination(self, tmp_path):
+        """Test recorded results update the counters and are paged."""
+        output = tmp_path / "a.md"
+        output.write_text("12345", encoding="utf-8")
+        store = JobStore(tmp_path / "jobs.sqlite")
+        job_id = store.create(["a", "b", "c"], tmp_path, {})
+
+        store.start(job_id)
+        store.record(job_id, 0, _result("a", output=output))
+        store.record(job_id, 1, _result("b", success=False))
+        first_page = store.get(job_id, offset=0, limit=2)
+        second_page = store.get(job_id, offset=2, limit=2)
+
+        assert (first_page.status, first_page.completed, first_page.failed) == (
+            "running",
+            1,
+            1,
+        )
+        assert first_page.bytes_collected == 5
+        assert [item.status for item in first_page.items] == ["completed", "failed"]
+        assert first_page.items[1].error == "boom"
+        assert first_page.next_offset == 2
+        assert [item.source for item in second_page.items] == ["c"]
+        assert second_page.next_offset is None
+        assert store.unfinished() == [job_id]
+        assert store.get("missing") is None
+        store.close()
+
+
+class TestJobScheduler:
+    """Test running, cancelling and resuming jobs."""
+
+    @pytest.mark.asyncio
+    async def test_job_collects_all_sources(self, tmp_path):
+        """Test a submitted job collects every source in the background."""
+        sources = _write_sources(tmp_path / "sources", 3)
+        scheduler = JobScheduler(
+            DocumentCollectionService(), JobStore(tmp_path / "jobs.sqlite")
+        )
+
+        job_id = scheduler.submit(sources, tmp_path / "out")
+        status = await scheduler.wait(job_id)
+        await scheduler.stop()
+
+        assert status.status == "completed"
+        assert status.completed == 3
+        assert status.documents_per_second > 0
+        assert (tmp_path / "out" / "doc2.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, tmp_path):
+        """Test cancelling keeps finished results and cancels the rest."""
+        release = asyncio.Event()
+        service = Mock()
+
+        async def collect(source, destination, **options):
+            if source != "first":
+                await release.wait()
+            return _result(source)
+
+        service.collect_document = collect
+        scheduler = JobScheduler(service, JobStore(tmp_path / "jobs.sqlite"))
+
+        job_id = scheduler.submit(["first", "second", "third"], tmp_path)
+        while scheduler.store.get(job_id).completed < 1:
+            await asyncio.sleep(0.01)
+        assert scheduler.cancel(job_id)
+        status = await scheduler.wait(job_id)
+        await scheduler.stop()
+
+        items = scheduler.store.get(job_id).items
+        assert status.status == "cancelled"
+        assert [item.status for item in items] == [
+            "completed",
+            "cancelled",
+            "cancelled",
+        ]
+        assert not scheduler.cancel(job_id)
+
+    @pytest.mark.asyncio
+    async def test_job_cancelled_by_another_process_stops(self, tmp_path):
+        """Test a job stops when the shared job table marks it cancelled."""
+        service = Mock()
+        calls = []
+        database = tmp_path / "jobs.sqlite"
+
+        async def collect(source, destination, **options):
+            calls.append(source)
+            # Another server process cancels the job through the table
+            other = JobStore(database)
+            other.finish(job_id, "cancelled")
+            other.close()
+            return _result(source)
+
+        service.collect_document = collect
+        scheduler = JobScheduler(service, JobStore(database))
+
+        job_id = scheduler.submit(["first", "second"], tmp_path)
+        status = await scheduler.wait(job_id)
+        await scheduler.stop()
+
+        assert calls == ["first"]
+        assert status.status == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_resume_on_start(self, tmp_path):
+        """Test a job interrupted by a restart continues with its remaining sources."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        job_id = store.create(["done", "todo"], tmp_path, {"chunk": False})
+        store.start(job_id)
+        store.record(job_id, 0, _result("done"))
+        service = Mock()
+        calls = []
+
+        async def collect(source, destination, **options):
+            calls.append((source, options))
+            return _result(source)
+
+        service.collect_document = collect
+        scheduler = JobScheduler(service, store)
+
+        scheduler.start()
+        status = await scheduler.wait(job_id)
+        await scheduler.stop()
+
+        assert calls == [("todo", {"chunk": False})]
+        assert (status.status, status.completed) == ("completed", 2)
+
+
+class TestJobTools:
+    """Test the MCP job tools."""
+
+    @pytest.mark.asyncio
+    async def test_submit_status_and_cancel(self, tmp_path, monkeypatch):
+        """Test a batch is queued, reported and cannot be cancelled once done."""
+        monkeypatch.setenv(
+            "DOCUMENT_COLLECTION_JOB_DATABASE", str(tmp_path / "jobs.sqlite")
+        )
+        monkeypatch.setattr(config_module, "_global_config", None)
+        monkeypatch.setattr(server, "_scheduler", None)
+        sources = _write_sources(tmp_path / "sources", 2)
+
+        submitted = await submit_batch(sources, output_dir=str(tmp_path / "out"))
+        await server.get_scheduler().wait(submitted["job_id"])
+        status = await get_job_status(submitted["job_id"], limit=1)
+        cancelled = await cancel_job(submitted["job_id"])
+        unknown = await get_job_status("nope")
+        await server.close_scheduler()
+
+        assert submitted["total"] == 2
+        assert status["status"] == "completed"
+        assert status["completed"] == 2
+        assert len(status["items"]) == 1
+        assert status["next_offset"] == 1
+        assert cancelled["cancelled"] is False
+        assert unknown["found"] is False
+
+
+class TestBatchProgress:
+    """Test progress notifications and paging of collect_batch."""
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_document(self, tmp_path):
+        """Test a notification with counts, bytes and ETA follows each document."""
+        sources = _write_sources(tmp_path / "sources", 3)
+        ctx = Mock()
+        ctx.report_progress = AsyncMock()
+
+        result = await collect_batch(sources, output_dir=str(tmp_path / "out"), ctx=ctx)
+
+        assert result["total_collected"] == 3
+        assert result["truncated"] is False
+        assert result["next_cursor"] is None
+        calls = ctx.report_progress.await_args_list
+        assert [call.args[:2] for call in calls] == [(1, 3), (2, 3), (3, 3)]
+        assert "bytes, ETA" in calls[-1].args[2]
+
+    @pytest.mark.asyncio
+    async def test_large_batch_is_truncated_with_cursor(self, tmp_path, monkeypatch):
+        """Test long result lists are cut and paged through get_job_status."""
+        monkeypatch.setenv(
+            "DOCUMENT_COLLECTION_JOB_DATABASE", str(tmp_path / "jobs.sqlite")
+        )
+        monkeypatch.setattr(config_module, "_global_config", None)
+        monkeypatch.setattr(server, "_scheduler", None)
+        monkeypatch.setattr(server, "MAX_BATCH_RESPONSE_ITEMS", 2)
+        sources = _write_sources(tmp_path / "sources", 5)
+
+        result = await collect_batch(sources, output_dir=str(tmp_path / "out"))
+        first = await get_job_status(cursor=result["next_cursor"], limit=3)
+        second = await get_job_status(cursor=first["next_cursor"], limit=3)
+        invalid = await get_job_status(cursor="not a cursor")
+        await server.close_scheduler()
+
+        assert result["truncated"] is True
+        assert len(result["collected_files"]) == 2
+        assert result["total_collected"] == 5
+        assert [item["position"] for item in first["items"]] == [0, 1, 2]
+        assert [item["position"] for item in second["items"]] == [3, 4]
+        assert second["next_cursor"] is None
+        assert second["bytes_collected"] > 0
+        assert "error" in invalid
@@ -4,9 +4,14 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from document_collection.core import config as config_module
+from document_collection.mcp_server import server
 from document_collection.mcp_server.server import (
     collect_batch,
     collect_document,
+    get_document_section,
+    get_service,
+    lifespan,
     list_formats,
     mcp,
 )
@@ -27,7 +32,7 @@ class TestMCPServer:
         mock_service.collect_document = AsyncMock(return_value=mock_result)
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_document(
@@ -55,7 +60,7 @@ class TestMCPServer:
         mock_service.collect_document = AsyncMock(return_value=mock_result)
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_document(
@@ -92,7 +97,7 @@ class TestMCPServer:
         )
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_batch(
@@ -130,7 +135,7 @@ class TestMCPServer:
         )
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_batch(
@@ -178,7 +183,7 @@ class TestMCPServer:
         )
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_document(
@@ -201,7 +206,7 @@ class TestMCPServer:
         )
 
         with patch(
-            "document_collection.mcp_server.server.DocumentCollectionService",
+            "document_collection.mcp_server.server.get_service",
             return_value=mock_service,
         ):
             result = await collect_batch(
@@ -214,6 +219,75 @@ class TestMCPServer:
         assert result["failed_urls"] == ["https://example.com/test.pdf"]
         assert len(result["errors"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_document_section(self, tmp_path) -> None:
+        """Test reading a section of a collected document."""
+        document = tmp_path / "report.md"
+        document.write_text("# report\n\n## Page 1\n\nFirst.\n\n## Page 2\n\nSecond.\n")
+
+        result = await get_document_section(str(document), "page 2")
+        missing = await get_document_section(str(document), "Appendix")
+
+        assert result["found"] is True
+        assert result["path"] == ["report"]
+        assert result["content"] == "## Page 2\n\nSecond.\n"
+        assert missing["found"] is False
+
+    @pytest.mark.asyncio
+    async def test_lifespan_shares_and_closes_service(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """Test tool calls share one warmed-up service that is closed on shutdown."""
+        monkeypatch.setattr(server, "_service", None)
+        monkeypatch.setattr(server, "_scheduler", None)
+        monkeypatch.setenv(
+            "DOCUMENT_COLLECTION_JOB_DATABASE", str(tmp_path / "jobs.sqlite")
+        )
+        monkeypatch.setattr(config_module, "_global_config", None)
+        service = Mock()
+        monkeypatch.setattr(
+            server, "DocumentCollectionService", Mock(return_value=service)
+        )
+
+        async with lifespan(mcp), lifespan(mcp):
+            assert get_service() is service
+        service.warm_up.assert_called_once()
+        service.close.assert_called_once()
+        assert server._service is None
+        assert server._scheduler is None
+
+    def test_http_binds_requested_host_and_port(self, monkeypatch) -> None:
+        """Test run_server_http serves the given address instead of the default."""
+        import uvicorn
+
+        for name in ("host", "port", "transport_security", "stateless_http"):
+            monkeypatch.setattr(mcp.settings, name, getattr(mcp.settings, name))
+        monkeypatch.setattr(mcp, "_session_manager", None)
+        served = []
+        monkeypatch.setattr(
+            uvicorn.Server,
+            "run",
+            lambda self, sockets=None: served.append((self.config, sockets)),
+        )
+
+        server.run_server_http(port=9123, host="0.0.0.0")
+
+        config, sockets = served[0]
+        assert (config.host, config.port) == ("0.0.0.0", 9123)
+        assert sockets is None
+        assert mcp.settings.transport_security is None
+        assert mcp.settings.stateless_http is False
+
+    def test_workers_share_port(self) -> None:
+        """Test worker sockets can bind the same port."""
+        first = server._reuse_port_socket("127.0.0.1", 0)
+        port = first.getsockname()[1]
+        second = server._reuse_port_socket("127.0.0.1", port)
+
+        assert second.getsockname()[1] == port
+        first.close()
+        second.close()
+
     def test_mcp_server_instance(self) -> None:
         """Test that MCP server instance is properly configured."""
         assert mcp.name == "Document Collection Server"
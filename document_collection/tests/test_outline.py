@@ -0,0 +1,118 @@
+"""Tests for heading outlines and section reads."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.converters.writer import write_markdown
+from document_collection.core.exceptions import ValidationError
+from document_collection.core.outline import (
+    OutlineBuilder,
+    build_outline,
+    find_heading,
+    load_outline,
+    outline_path,
+    read_section,
+)
+from document_collection.core.service import DocumentCollectionService
+
+CONTENT_PARTS = [
+    "# report",
+    "",
+    "## Page 1",
+    "",
+    "Intro – paragraph.",
+    "",
+    "### Scope",
+    "",
+    "```",
+    "# not a heading",
+    "```",
+    "",
+    "## Page 2",
+    "",
+    "Closing words.",
+]
+
+
+class TestOutline:
+    """Test the outline sidecar and section lookup."""
+
+    def test_writer_emits_outline(self, tmp_path):
+        """Test writing markdown records every heading with its byte range."""
+        markdown = write_markdown(tmp_path / "report.md", CONTENT_PARTS)
+        data = markdown.read_bytes()
+
+        outline = load_outline(markdown)
+
+        assert outline_path(markdown).is_file()
+        assert data == "\n".join(CONTENT_PARTS).encode("utf-8")
+        assert [
+            (entry.level, entry.text, entry.path) for entry in outline.headings
+        ] == [
+            (1, "report", []),
+            (2, "Page 1", ["report"]),
+            (3, "Scope", ["report", "Page 1"]),
+            (2, "Page 2", ["report"]),
+        ]
+        scope = outline.headings[2]
+        assert (
+            data[scope.start : scope.end]
+            == b"### Scope\n\n```\n# not a heading\n```\n\n"
+        )
+        assert outline.headings[0].end == outline.size_bytes == len(data)
+
+    def test_builder_is_independent_of_feed_sizes(self, tmp_path):
+        """Test feeding bytes in odd pieces gives the same outline as a rebuild."""
+        markdown = write_markdown(tmp_path / "report.md", CONTENT_PARTS)
+        data = markdown.read_bytes()
+
+        builder = OutlineBuilder()
+        for position in range(0, len(data), 7):
+            builder.feed(data[position : position + 7])
+
+        assert builder.finish("report.md") == build_outline(markdown)
+
+    def test_find_heading_by_path_and_text(self, tmp_path):
+        """Test sections are found by heading path, exact text and substring."""
+        outline = load_outline(write_markdown(tmp_path / "report.md", CONTENT_PARTS))
+
+        assert find_heading(outline, "Page 1 > scope").text == "Scope"
+        assert find_heading(outline, "report/Page 2").text == "Page 2"
+        assert find_heading(outline, "PAGE 2").text == "Page 2"
+        assert find_heading(outline, "sco").text == "Scope"
+        assert find_heading(outline, "Page 2 > Scope") is None
+        assert find_heading(outline, "") is None
+
+    def test_stale_outline_is_rebuilt(self, tmp_path):
+        """Test an edited document gets a fresh outline."""
+        markdown = write_markdown(tmp_path / "report.md", CONTENT_PARTS)
+        markdown.write_text("# report\n\n## Appendix\n\nExtra.\n", encoding="utf-8")
+
+        entry = find_heading(load_outline(markdown), "Appendix")
+
+        assert read_section(markdown, entry).content == "## Appendix\n\nExtra.\n"
+
+    @pytest.mark.asyncio
+    async def test_service_reads_section(self, tmp_path):
+        """Test the service collects a document and reads one section back."""
+        source = tmp_path / "notes.md"
+        source.write_text(
+            "---\ntitle: Notes\n---\n\nNotes\n=====\n\nText.\n\n## Details\n\nMore text.\n",
+            encoding="utf-8",
+        )
+        service = DocumentCollectionService()
+
+        result = await service.collect_document(str(source), tmp_path / "out")
+        section = await service.get_section(result.output_path, "Notes > Details")
+
+        assert result.artifacts["outline"] == tmp_path / "out" / "notes.outline.json"
+        assert section.content == "## Details\n\nMore text.\n"
+        assert section.path == ["Notes"]
+        assert await service.get_section(result.output_path, "Missing") is None
+        with pytest.raises(ValidationError):
+            await service.get_section(tmp_path / "missing.md", "Notes")
@@ -0,0 +1,132 @@
+"""Tests for paginated document reads and the MCP document resources."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core import config as config_module
+from document_collection.core.config import Configuration
+from document_collection.core.exceptions import ValidationError
+from document_collection.core.pages import content_hash, read_range, read_unit
+from document_collection.mcp_server.server import mcp
+
+DOCUMENT = (
+    "# report\n\n## Page 1\n\nIntro – café.\n\n### Scope\n\nDetails.\n\n"
+    "## Page 2\n\nClosing words.\n"
+)
+DECK = "# deck\n\n## Slide 1\n\nTitle slide.\n\n## Slide 2\n\nAgenda.\n"
+
+
+@pytest.fixture
+def collection(tmp_path, monkeypatch):
+    """Write a small collection and serve it as MCP resources."""
+    root = tmp_path / "collection"
+    root.mkdir()
+    (root / "report.md").write_text(DOCUMENT, encoding="utf-8")
+    (root / "deck.md").write_text(DECK, encoding="utf-8")
+    config = Configuration()
+    config.set("mcp_resource_root", str(root))
+    monkeypatch.setattr(config_module, "_global_config", config)
+    return root
+
+
+async def _read(uri: str) -> dict:
+    """Read a resource and decode its JSON body."""
+    contents = list(await mcp.read_resource(uri))
+    return json.loads(contents[0].content)
+
+
+class TestPages:
+    """Test byte-range, page, slide and chunk reads."""
+
+    def test_ranges_cover_document_on_character_boundaries(self, collection):
+        """Test consecutive small ranges never split a character and lose nothing."""
+        path = collection / "report.md"
+        parts = []
+        start = 0
+        while start < path.stat().st_size:
+            page = read_range(path, start, 5)
+            assert page.end > page.start >= start
+            parts.append(page.content)
+            start = page.end
+
+        assert "".join(parts) == DOCUMENT
+
+    def test_range_outside_document_is_rejected(self, collection):
+        """Test a start past the end of the document raises."""
+        with pytest.raises(ValidationError):
+            read_range(collection / "report.md", 10_000, 10)
+
+    def test_pages_slides_and_chunks(self, collection):
+        """Test units are read by number with their content hash."""
+        page = read_unit(collection / "report.md", "page", 2)
+        slide = read_unit(collection / "deck.md", "slide", 1)
+        chunk = read_unit(collection / "deck.md", "chunk", 0)
+
+        assert page.content == "## Page 2\n\nClosing words.\n"
+        assert (page.total, page.end) == (2, len(DOCUMENT.encode("utf-8")))
+        assert page.content_hash == content_hash(page.content.encode("utf-8"))
+        assert slide.content == "## Slide 1\n\nTitle slide.\n\n"
+        assert chunk.start == 0
+        assert read_unit(collection / "report.md", "slide", 1) is None
+        assert read_unit(collection / "report.md", "page", 3) is None
+
+
+class TestDocumentResources:
+    """Test the MCP resources over a collection."""
+
+    @pytest.mark.asyncio
+    async def test_list_and_overview(self, collection):
+        """Test documents are listed with URIs and described with unit counts."""
+        listing = await _read("document://collection")
+        overview = await _read("document://collection/report.md")
+
+        assert [document["name"] for document in listing["documents"]] == [
+            "deck.md",
+            "report.md",
+        ]
+        assert overview["pages"] == 2
+        assert overview["slides"] == 0
+        assert overview["chunks"] >= 1
+        assert overview["content_hash"] == content_hash(DOCUMENT.encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_page_and_byte_range_links(self, collection):
+        """Test pages link to the next page and ranges to the next range."""
+        first = await _read("document://collection/report.md/pages/1")
+        last = await _read(first["next"])
+        head = await _read("document://collection/report.md/bytes/0/20")
+
+        assert first["content"].startswith("## Page 1\n")
+        assert last["number"] == 2
+        assert last["next"] is None
+        assert head["next"] == "document://collection/report.md/bytes/20/20"
+
+    @pytest.mark.asyncio
+    async def test_page_links_skip_missing_pages(self, collection):
+        """Test the next page is the next one in the document, not the next number."""
+        (collection / "scan.md").write_text(
+            "# scan\n\n## Page 1\n\nCover.\n\n## Page 4\n\nText.\n", encoding="utf-8"
+        )
+
+        first = await _read("document://collection/scan.md/pages/1")
+        last = await _read(first["next"])
+
+        assert first["next"] == "document://collection/scan.md/pages/4"
+        assert last["content"].startswith("## Page 4\n")
+        assert last["next"] is None
+
+    @pytest.mark.asyncio
+    async def test_documents_outside_collection_are_refused(self, collection):
+        """Test a document name cannot escape the collection directory."""
+        (collection.parent / "secret.md").write_text("# secret\n", encoding="utf-8")
+
+        with pytest.raises(Exception, match="outside the collection"):
+            await _read("document://collection/..%2Fsecret.md")
+        with pytest.raises(Exception, match="no page 9"):
+            await _read("document://collection/report.md/pages/9")
@@ -0,0 +1,100 @@
+"""Tests for the converter and retriever registries."""
+
+import importlib.metadata
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.converters.factory import ConverterFactory
+from document_collection.converters.markdown_processor import MarkdownProcessor
+from document_collection.converters.pdf_converter import PdfConverter
+from document_collection.core.registry import (
+    Registry,
+    converter_registry,
+    source_extension,
+    source_scheme,
+)
+from document_collection.retrievers.factory import RetrieverFactory
+from document_collection.retrievers.local_retriever import LocalFileRetriever
+from document_collection.retrievers.web_retriever import WebHttpRetriever
+
+
+class PluginConverter(MarkdownProcessor):
+    """Converter provided by a test plugin."""
+
+
+class TestRegistry:
+    """Test dispatch, sharing and plugins of a registry."""
+
+    def test_dispatch_by_extension_and_mime_type_shares_instances(self):
+        """Test every key of a converter returns the same instance."""
+        by_extension = ConverterFactory.get_converter(
+            "https://example.com/Report.PDF?v=2"
+        )
+        by_mime = ConverterFactory.get_converter(
+            "https://example.com/download", mime_type="application/pdf; qs=0.9"
+        )
+
+        assert isinstance(by_extension, PdfConverter)
+        assert by_mime is by_extension
+        assert ConverterFactory.get_converter("notes.pdf") is by_extension
+        assert ".pdf" in converter_registry.keys()
+
+    def test_entry_points_are_loaded_once_and_take_precedence(self, monkeypatch):
+        """Test plugins are read lazily and override built-in registrations."""
+        group = "document_collection.test_converters"
+        plugins = [
+            importlib.metadata.EntryPoint(
+                name=".md", value=f"{__name__}:PluginConverter", group=group
+            ),
+            importlib.metadata.EntryPoint(
+                name=".rtf", value=f"{__name__}:PluginConverter", group=group
+            ),
+        ]
+        reads = MagicMock(return_value=plugins)
+        monkeypatch.setattr(importlib.metadata, "entry_points", reads)
+        registry = Registry("converter", plugin_group=group)
+        registry.register(MarkdownProcessor, ".md")
+
+        assert reads.call_count == 0
+        assert isinstance(registry.get(".md"), PluginConverter)
+        assert registry.get(".rtf") is registry.get(".md")
+        assert registry.get(".txt") is None
+        reads.assert_called_once_with(group=group)
+
+
+class TestRetrieverDispatch:
+    """Test retrievers are selected by URL scheme."""
+
+    def test_schemes(self):
+        """Test local paths, web URLs and unknown schemes."""
+        session = MagicMock()
+
+        assert isinstance(
+            RetrieverFactory.get_retriever("./doc.pdf"), LocalFileRetriever
+        )
+        assert RetrieverFactory.get_retriever(
+            "a.pdf"
+        ) is RetrieverFactory.get_retriever("b.md")
+        assert isinstance(
+            RetrieverFactory.get_retriever("HTTPS://x/y.pdf"), WebHttpRetriever
+        )
+        assert (
+            RetrieverFactory.get_retriever("https://x/y", session=session).session
+            is session
+        )
+        with pytest.raises(ValueError, match="Unsupported source"):
+            RetrieverFactory.get_retriever("ftp://example.com/doc.pdf")
+
+    def test_source_keys(self):
+        """Test the keys derived from sources."""
+        assert source_extension("/docs/archive.tar.PDF") == ".pdf"
+        assert source_extension("https://example.com/a.docx#page=2") == ".docx"
+        assert source_extension("https://example.com/") == ""
+        assert source_scheme("/tmp/a.pdf") == "file"
+        assert source_scheme("Http://example.com") == "http"
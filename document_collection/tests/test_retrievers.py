@@ -103,6 +103,22 @@ class TestWebHttpRetriever:
             mock_open.assert_called()
             assert result == destination / "document.pdf"
 
+    @pytest.mark.asyncio
+    async def test_retrieve_uses_shared_session(self, tmp_path):
+        """Test downloads go through the given session and release the connection."""
+        session = MagicMock()
+        response = session.get.return_value
+        response.iter_content.return_value = [b"fake ", b"pdf"]
+        retriever = RetrieverFactory.get_retriever(
+            "https://example.com/doc.pdf", session=session
+        )
+
+        result = await retriever.retrieve("https://example.com/doc.pdf", tmp_path)
+
+        session.get.assert_called_once()
+        response.close.assert_called_once()
+        assert result.read_bytes() == b"fake pdf"
+
     @pytest.mark.asyncio
     async def test_retrieve_http_error(self):
         """Test HTTP error during retrieval."""
@@ -0,0 +1,205 @@
+"""Tests for the full-text search index."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.cli.main import search
+from document_collection.core.service import DocumentCollectionService
+from document_collection.mcp_server.server import search_documents
+from document_collection.search import SearchIndex, index_directory, tokenize
+from document_collection.search import index as search_index
+
+
+def _write_collection(root: Path) -> None:
+    """Write a few converted documents into a collection directory."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "reliability.md").write_text(
+        "# reliability\n\n## Page 1\n\nDisaster recovery plans define the recovery time objective.\n\n"
+        "## Page 2\n\nBackups are tested every quarter.\n",
+        encoding="utf-8",
+    )
+    (root / "security.md").write_text(
+        "# security\n\n## Page 1\n\nIdentity and access management for every workload.\n\n"
+        "## Page 2\n\nRecovery keys are stored offline.\n",
+        encoding="utf-8",
+    )
+
+
+class TestSearchIndex:
+    """Test indexing and ranking."""
+
+    def test_tokenize(self):
+        """Test tokens are lower-case words without punctuation."""
+        assert tokenize("Well-Architected, RTO_target (99.9%)") == [
+            "well",
+            "architected",
+            "rto",
+            "target",
+            "99",
+            "9",
+        ]
+
+    def test_ranks_sections_by_bm25(self, tmp_path):
+        """Test the section holding more query terms ranks first, with a snippet."""
+        _write_collection(tmp_path)
+
+        with SearchIndex(tmp_path) as index:
+            assert index.refresh() == 2
+            hits = index.search("disaster recovery")
+
+        assert [(hit.document.name, hit.heading) for hit in hits] == [
+            ("reliability.md", "reliability > Page 1"),
+            ("security.md", "security > Page 2"),
+        ]
+        assert hits[0].score > hits[1].score
+        assert "Disaster recovery plans" in hits[0].snippet
+        data = (tmp_path / "reliability.md").read_bytes()
+        assert data[hits[0].start : hits[0].end].startswith(b"## Page 1\n")
+
+    def test_reindex_and_removal_hide_old_sections(self, tmp_path):
+        """Test a changed document replaces its old sections and a deleted one disappears."""
+        _write_collection(tmp_path)
+        with SearchIndex(tmp_path) as index:
+            index.refresh()
+            assert index.refresh() == 0
+
+            (tmp_path / "security.md").write_text(
+                "# security\n\nOnly firewalls here.\n", encoding="utf-8"
+            )
+            (tmp_path / "reliability.md").unlink()
+            assert index.refresh() == 2
+
+            assert index.search("recovery") == []
+            assert [hit.document.name for hit in index.search("firewalls")] == [
+                "security.md"
+            ]
+
+    def test_merges_keep_results(self, tmp_path, monkeypatch):
+        """Test merged segments drop stale postings and return the same hits."""
+        monkeypatch.setattr(search_index, "MERGE_FACTOR", 2)
+        _write_collection(tmp_path)
+        with SearchIndex(tmp_path) as index:
+            index.refresh()
+            for version in range(3):
+                (tmp_path / "security.md").write_text(
+                    f"# security\n\nRevision {version} of the recovery keys policy.\n",
+                    encoding="utf-8",
+                )
+                index.add_document(tmp_path / "security.md")
+
+            levels = index._connection.execute("SELECT level FROM segments").fetchall()
+            hits = index.search("recovery")
+
+        assert max(level for (level,) in levels) >= 2
+        assert len(list(index_directory(tmp_path).glob("seg*"))) == 2 * len(levels)
+        assert sorted(hit.document.name for hit in hits) == [
+            "reliability.md",
+            "security.md",
+        ]
+        assert (
+            "Revision 2"
+            in next(hit for hit in hits if hit.document.name == "security.md").snippet
+        )
+
+    def test_reindexed_documents_keep_scores_positive(self, tmp_path):
+        """Test stale postings awaiting a merge do not count towards term frequencies."""
+        tmp_path.mkdir(exist_ok=True)
+        (tmp_path / "a.md").write_text(
+            "# a\n\nsecurity security security review\n", encoding="utf-8"
+        )
+        with SearchIndex(tmp_path) as index:
+            for version in range(5):
+                (tmp_path / "b.md").write_text(
+                    f"# b\n\nsecurity review, revision {version}\n", encoding="utf-8"
+                )
+                index.refresh()
+            assert (
+                index._connection.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+                > 2
+            )
+            hits = index.search("security")
+            (tmp_path / "b.md").unlink()
+            index.refresh()
+            remaining = index.search("security")
+
+        assert [hit.document.name for hit in hits] == ["a.md", "b.md"]
+        assert all(hit.score > 0 for hit in hits)
+        assert [hit.document.name for hit in remaining] == ["a.md"]
+        assert remaining[0].score > 0
+
+    def test_postings_budget_keeps_best_matches(self, tmp_path):
+        """Test a truncated posting list still yields the strongest section."""
+        tmp_path.mkdir(exist_ok=True)
+        for number in range(20):
+            (tmp_path / f"doc{number}.md").write_text(
+                f"# doc{number}\n\n"
+                + "cloud " * (30 if number == 7 else 1)
+                + "platform notes\n",
+                encoding="utf-8",
+            )
+        with SearchIndex(tmp_path) as index:
+            index.refresh()
+            hits = index.search("cloud", limit=1, max_postings=2)
+
+        assert hits[0].document.name == "doc7.md"
+
+    @pytest.mark.asyncio
+    async def test_collect_document_updates_index(self, tmp_path):
+        """Test collected documents are searchable without a refresh."""
+        source = tmp_path / "notes.md"
+        source.write_text(
+            "# Notes\n\n## Capacity\n\nAutoscaling thresholds.\n", encoding="utf-8"
+        )
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(source), tmp_path / "out")
+        hits = await service.search("autoscaling", destination_path=tmp_path / "out")
+
+        assert [hit.heading for hit in hits] == ["Notes > Capacity"]
+
+    @pytest.mark.asyncio
+    async def test_collect_document_index_can_be_disabled(self, tmp_path):
+        """Test the index option keeps a document out of the index."""
+        source = tmp_path / "notes.md"
+        source.write_text("# Notes\n\nAutoscaling thresholds.\n", encoding="utf-8")
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(source), tmp_path / "out", index=False)
+
+        assert not index_directory(tmp_path / "out").exists()
+
+    def test_search_command(self, tmp_path):
+        """Test the CLI prints ranked results."""
+        _write_collection(tmp_path)
+
+        result = CliRunner().invoke(
+            search, ["backups", "-d", str(tmp_path), "--refresh"]
+        )
+
+        assert result.exit_code == 0
+        assert "reliability > Page 2" in result.output
+        assert "Backups are tested every quarter." in result.output
+
+    @pytest.mark.asyncio
+    async def test_search_documents_tool(self, tmp_path):
+        """Test the MCP tool returns ranked sections."""
+        _write_collection(tmp_path)
+        with SearchIndex(tmp_path) as index:
+            index.refresh()
+
+        result = await search_documents(
+            "identity access", output_dir=str(tmp_path), limit=5
+        )
+        missing = await search_documents(
+            "identity", output_dir=str(tmp_path / "missing")
+        )
+
+        assert result["total_results"] == 1
+        assert result["results"][0]["heading"] == "security > Page 1"
+        assert "error" in missing
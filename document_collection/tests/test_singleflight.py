@@ -0,0 +1,147 @@
+"""Tests for coalescing of identical concurrent requests."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core.service import DocumentCollectionService
+from document_collection.core.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test the single-flight group."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """Test callers of the same key wait for a single operation."""
+        group: SingleFlight[int] = SingleFlight()
+        calls = []
+
+        async def operation() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        results = await asyncio.gather(*(group.do("key", operation) for _ in range(5)))
+        other = await group.do("other", operation)
+
+        assert results == [1] * 5
+        assert other == 2
+        assert group.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_and_are_not_memoised(self):
+        """Test a failure is shared by waiting callers but retried afterwards."""
+        group: SingleFlight[str] = SingleFlight(ttl=60)
+        attempts = []
+
+        async def operation() -> str:
+            attempts.append(1)
+            await asyncio.sleep(0)
+            if len(attempts) == 1:
+                raise RuntimeError("download failed")
+            return "ok"
+
+        results = await asyncio.gather(
+            group.do("key", operation),
+            group.do("key", operation),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await group.do("key", operation) == "ok"
+        assert await group.do("key", operation) == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_memo_respects_ttl_and_filter(self, monkeypatch):
+        """Test results are reused until they expire, and only when accepted."""
+        clock = [100.0]
+        monkeypatch.setattr(
+            "document_collection.core.singleflight.time.monotonic", lambda: clock[0]
+        )
+        group: SingleFlight[int] = SingleFlight(
+            ttl=5, remember=lambda result: result > 0
+        )
+        counter = iter(range(10))
+
+        async def operation() -> int:
+            return next(counter)
+
+        assert await group.do("key", operation) == 0  # Rejected by the filter
+        assert await group.do("key", operation) == 1
+        clock[0] += 4
+        assert await group.do("key", operation) == 1
+        clock[0] += 2
+        assert await group.do("key", operation) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test the shared operation survives one waiting caller being cancelled."""
+        group: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def operation() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(group.do("key", operation))
+        second = asyncio.ensure_future(group.do("key", operation))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+
+class TestServiceCoalescing:
+    """Test collect_document coalesces identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_convert_once(self, tmp_path, monkeypatch):
+        """Test concurrent and repeated requests share one collection."""
+        source = tmp_path / "notes.md"
+        source.write_text("# Notes\n\nShared.\n", encoding="utf-8")
+        service = DocumentCollectionService()
+        runs = []
+        collect = service._collect_document
+
+        async def counting_collect(*args, **kwargs):
+            runs.append(args)
+            return await collect(*args, **kwargs)
+
+        monkeypatch.setattr(service, "_collect_document", counting_collect)
+
+        results = await asyncio.gather(
+            *(service.collect_document(str(source), tmp_path / "out") for _ in range(3))
+        )
+        again = await service.collect_document(str(source), tmp_path / "out")
+        other_options = await service.collect_document(
+            str(source), tmp_path / "out", chunk=False
+        )
+
+        assert len(runs) == 2
+        assert all(result.success for result in [*results, again, other_options])
+        assert results[0] is not results[1]
+        assert again.output_path == results[0].output_path
+
+    @pytest.mark.asyncio
+    async def test_edited_source_is_collected_again(self, tmp_path):
+        """Test a changed local file is not answered from the memo."""
+        source = tmp_path / "notes.md"
+        source.write_text("# Notes\n\nFirst.\n", encoding="utf-8")
+        service = DocumentCollectionService()
+
+        await service.collect_document(str(source), tmp_path / "out")
+        source.write_text("# Notes\n\nSecond version.\n", encoding="utf-8")
+        await service.collect_document(str(source), tmp_path / "out")
+
+        assert "Second version." in (tmp_path / "out" / "notes.md").read_text(
+            encoding="utf-8"
+        )
@@ -0,0 +1,139 @@
+"""Tests for detecting document formats from their content."""
+
+import io
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to sys.path for test discovery
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_collection.core.models import DocumentFormat
+from document_collection.core.service import DocumentCollectionService
+from document_collection.core.sniffer import (
+    FormatSniffer,
+    detect_format,
+    trusted_format,
+)
+from document_collection.retrievers.web_retriever import WebHttpRetriever
+
+
+def _office_document(document_format: DocumentFormat) -> bytes:
+    buffer = io.BytesIO()
+    if document_format is DocumentFormat.WORD:
+        from docx import Document
+
+        document = Document()
+        document.add_paragraph("Sniffed paragraph")
+        document.save(buffer)
+    elif document_format is DocumentFormat.POWERPOINT:
+        from pptx import Presentation
+
+        Presentation().save(buffer)
+    else:
+        from openpyxl import Workbook
+
+        Workbook().save(buffer)
+    return buffer.getvalue()
+
+
+class TestDetectFormat:
+    """Test the signatures recognised in the first bytes."""
+
+    @pytest.mark.parametrize(
+        "document_format",
+        [DocumentFormat.WORD, DocumentFormat.POWERPOINT, DocumentFormat.EXCEL],
+    )
+    def test_office_documents_are_told_apart(self, document_format):
+        """Test ZIP archives are identified by their content types."""
+        sniffer = FormatSniffer()
+        data = _office_document(document_format)
+        for start in range(0, len(data), 1000):
+            sniffer.feed(data[start : start + 1000])
+
+        assert sniffer.detect() is document_format
+
+    def test_pdf_html_and_unknown(self):
+        """Test headers, HTML document tags and content left to the extension."""
+        assert detect_format(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n") is DocumentFormat.PDF
+        assert detect_format(b"\r\n%PDF-1.4") is DocumentFormat.PDF
+        assert detect_format(b"The file starts with the %PDF-1.7 header") is None
+        assert (
+            detect_format(b"\xef\xbb\xbf\n<!DOCTYPE html>\n<html>")
+            is DocumentFormat.HTML
+        )
+        assert detect_format(b"<!-- saved -->\n<HTML lang=en>") is DocumentFormat.HTML
+        assert detect_format(b'<div align="center">\n\n# Title') is None
+        assert detect_format(b"<header>") is None
+        assert detect_format(b"# Notes\n\n<html> in prose") is None
+        assert detect_format(b"PK\x03\x04not an office document") is None
+        assert detect_format(b"") is None
+
+    def test_detected_format_overrides_only_untrusted_extensions(self):
+        """Test text content never overrides the known extension of a source."""
+        pdf, html, word = DocumentFormat.PDF, DocumentFormat.HTML, DocumentFormat.WORD
+        assert trusted_format(pdf, "https://example.com/download?id=1") is pdf
+        assert trusted_format(html, "page.aspx") is html
+        assert trusted_format(word, "report.pdf") is word
+        assert trusted_format(html, "report.pdf") is None
+        assert trusted_format(pdf, "notes.md") is None
+        assert trusted_format(None, "download") is None
+
+
+class TestSniffedCollection:
+    """Test detected formats drive conversion and metadata."""
+
+    @pytest.mark.asyncio
+    async def test_extensionless_download_converts_by_content(self, tmp_path):
+        """Test a download without an extension is converted as what it is."""
+        session = MagicMock()
+        response = session.get.return_value
+        data = _office_document(DocumentFormat.WORD)
+        response.iter_content.return_value = [data[:100], data[100:]]
+        service = DocumentCollectionService()
+        service.retriever_factory.get_retriever = MagicMock(
+            return_value=WebHttpRetriever(session=session)
+        )
+
+        result = await service.collect_document(
+            "https://example.com/download?id=123", tmp_path
+        )
+
+        assert result.success
+        assert result.metadata.format is DocumentFormat.WORD
+        assert result.output_path.suffix == ".md"
+        assert "Sniffed paragraph" in result.output_path.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_mislabelled_file_is_not_given_the_wrong_converter(self, tmp_path):
+        """Test a Word document saved as .pdf is converted as Word."""
+        source = tmp_path / "source" / "report.pdf"
+        source.parent.mkdir()
+        source.write_bytes(_office_document(DocumentFormat.WORD))
+
+        result = await DocumentCollectionService().collect_document(
+            str(source), tmp_path / "out"
+        )
+
+        assert result.success
+        assert result.metadata.format is DocumentFormat.WORD
+        assert result.output_path == tmp_path / "out" / "report.md"
+        assert "Sniffed paragraph" in result.output_path.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_text_quoting_a_signature_keeps_its_extension(self, tmp_path):
+        """Test Markdown that mentions the PDF header is processed as Markdown."""
+        source = tmp_path / "source" / "notes.md"
+        source.parent.mkdir()
+        notes = "# Notes\n\nA PDF starts with the %PDF-1.7 header.\n"
+        source.write_text(notes, encoding="utf-8")
+
+        result = await DocumentCollectionService().collect_document(
+            str(source), tmp_path / "out"
+        )
+
+        assert result.success
+        assert result.metadata.format is DocumentFormat.MARKDOWN
+        assert "%PDF-1.7 header" in result.output_path.read_text(encoding="utf-8")